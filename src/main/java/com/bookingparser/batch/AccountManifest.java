@@ -0,0 +1,83 @@
+package com.bookingparser.batch;
+
+import com.bookingparser.scrape.Account;
+
+import java.io.IOException;
+import java.io.Reader;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.attribute.PosixFilePermission;
+import java.util.ArrayList;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Locale;
+import java.util.Map;
+import java.util.Properties;
+import java.util.Set;
+import java.util.regex.Pattern;
+
+/**
+ * Reads the account list for a batch run. One account per line, {@code name [output.csv]}; blank
+ * lines and lines starting with '#' are skipped. Without an output path the account writes to
+ * {@code <outDir>/<name>.csv}.
+ * <p>
+ * Credentials come from the optional secrets file ({@code <name>.email} and {@code <name>.password}
+ * in Java properties format) or else from the environment as {@code BOOKING_EMAIL_<NAME>} and
+ * {@code BOOKING_PASSWORD_<NAME>}, with the name upper-cased and '.' and '-' turned into '_'.
+ */
+public final class AccountManifest {
+	private static final Pattern NAME = Pattern.compile("[A-Za-z0-9._-]+");
+
+	private AccountManifest() {}
+
+	public static List<Account> read(Path manifest, Path secrets, Path outDir) throws IOException {
+		return read(manifest, secrets, outDir, System.getenv());
+	}
+
+	/** As {@link #read(Path, Path, Path)}, looking up environment credentials in {@code env}. */
+	public static List<Account> read(Path manifest, Path secrets, Path outDir, Map<String, String> env) throws IOException {
+		Properties secretProps = new Properties();
+		if (secrets != null) {
+			warnIfShared(secrets);
+			try (Reader r = Files.newBufferedReader(secrets)) {
+				secretProps.load(r);
+			}
+		}
+		List<Account> accounts = new ArrayList<>();
+		Set<String> seen = new HashSet<>();
+		List<String> lines = Files.readAllLines(manifest);
+		for (int n = 0; n < lines.size(); n++) {
+			String line = lines.get(n).strip();
+			if (line.isEmpty() || line.startsWith("#")) continue;
+			String[] parts = line.split("\\s+", 2);
+			String name = parts[0];
+			String at = manifest + ":" + (n + 1);
+			if (!NAME.matcher(name).matches()) throw new IllegalArgumentException(at + ": invalid account name '" + name + "'");
+			if (!seen.add(name)) throw new IllegalArgumentException(at + ": duplicate account '" + name + "'");
+			Path output = parts.length > 1 ? Path.of(parts[1].strip()) : outDir.resolve(name + ".csv");
+
+			String email = secretProps.getProperty(name + ".email");
+			String password = secretProps.getProperty(name + ".password");
+			String key = name.toUpperCase(Locale.ROOT).replace('.', '_').replace('-', '_');
+			if (email == null) email = env.get("BOOKING_EMAIL_" + key);
+			if (password == null) password = env.get("BOOKING_PASSWORD_" + key);
+			if (email == null || password == null) {
+				throw new IllegalArgumentException(at + ": no credentials for '" + name + "' (set BOOKING_EMAIL_" + key
+					+ " and BOOKING_PASSWORD_" + key + ", or " + name + ".email and " + name + ".password in the secrets file)");
+			}
+			accounts.add(new Account(name, email, password, output));
+		}
+		return accounts;
+	}
+
+	private static void warnIfShared(Path secrets) {
+		try {
+			Set<PosixFilePermission> perms = Files.getPosixFilePermissions(secrets);
+			if (perms.contains(PosixFilePermission.GROUP_READ) || perms.contains(PosixFilePermission.OTHERS_READ)) {
+				System.err.println("Warning: " + secrets + " is readable by other users; chmod 600 it.");
+			}
+		} catch (UnsupportedOperationException | IOException ignored) {
+			// not a POSIX file system
+		}
+	}
+}
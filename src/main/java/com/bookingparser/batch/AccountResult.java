@@ -0,0 +1,42 @@
+package com.bookingparser.batch;
+
+import com.bookingparser.scrape.Account;
+import com.bookingparser.scrape.BlockStats;
+
+/** Outcome of one account in a batch run; {@code error} is null when the export completed. */
+public class AccountResult {
+	private final Account account;
+	private final long written;
+	private final int rejects;
+	private final long elapsedNanos;
+	private final String error;
+	private final BlockStats requests; // nullable: no browser
+
+	public AccountResult(Account account, long written, int rejects, long elapsedNanos, String error, BlockStats requests) {
+		this.account = account;
+		this.written = written;
+		this.rejects = rejects;
+		this.elapsedNanos = elapsedNanos;
+		this.error = error;
+		this.requests = requests;
+	}
+
+	public Account getAccount() { return account; }
+	public long getWritten() { return written; }
+	public int getRejects() { return rejects; }
+	public long getElapsedNanos() { return elapsedNanos; }
+	public String getError() { return error; }
+	public BlockStats getRequests() { return requests; }
+
+	public boolean isOk() {
+		return error == null;
+	}
+
+	@Override
+	public String toString() {
+		String status = error == null
+			? written + " rows" + (rejects > 0 ? ", " + rejects + " rejects" : "") + " -> " + account.getOutput()
+			: "FAILED: " + error;
+		return String.format("%-20s %s (%.1fs)%s", account.getName(), status, elapsedNanos / 1e9, requests == null ? "" : "; " + requests);
+	}
+}
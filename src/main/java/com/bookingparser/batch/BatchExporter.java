@@ -0,0 +1,126 @@
+package com.bookingparser.batch;
+
+import com.bookingparser.export.CsvSink;
+import com.bookingparser.export.Exporter;
+import com.bookingparser.export.FlushPolicy;
+import com.bookingparser.filter.Where;
+import com.bookingparser.model.BookingView;
+import com.bookingparser.pipeline.Pipeline;
+import com.bookingparser.pipeline.PipelineOptions;
+import com.bookingparser.pipeline.PipelineResult;
+import com.bookingparser.scrape.Account;
+import com.bookingparser.scrape.BlockStats;
+import com.bookingparser.scrape.BrowserPool;
+import com.bookingparser.scrape.RateLimiters;
+import com.bookingparser.server.ExportJob;
+import com.bookingparser.server.SourceFactory;
+import com.bookingparser.source.DateRange;
+import com.bookingparser.source.ExportIndex;
+
+import java.io.IOException;
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.Callable;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+import java.util.function.Predicate;
+import java.util.function.Supplier;
+
+/**
+ * Exports many accounts in one process. At most {@code concurrency} accounts run at once, each on a
+ * browser leased from the shared pool with a context of its own, so logins and cookies stay
+ * isolated while browser launch is paid once per pool slot. Limiters are keyed by account, so each
+ * account keeps to its own rate and total throughput grows with the number of concurrent accounts.
+ * One account failing does not stop the others.
+ * <p>
+ * With {@link #incremental} each account is exported against its own {@link ExportIndex}, saved
+ * once that account's CSV is committed.
+ */
+public class BatchExporter {
+	private static final int FLUSH_ROWS = 10_000;
+
+	private final BrowserPool browsers; // nullable: sources that need no browser
+	private final SourceFactory sources;
+	private final RateLimiters limiters;
+	private final Supplier<PipelineOptions> options;
+	private final int concurrency;
+	private Path indexDir; // nullable: export everything
+
+	public BatchExporter(BrowserPool browsers, SourceFactory sources, RateLimiters limiters, Supplier<PipelineOptions> options, int concurrency) {
+		if (concurrency < 1) throw new IllegalArgumentException("concurrency must be >= 1: " + concurrency);
+		this.browsers = browsers;
+		this.sources = sources;
+		this.limiters = limiters;
+		this.options = options;
+		this.concurrency = concurrency;
+	}
+
+	/** Exports only reservations new or changed since the last incremental run, with one index per account in {@code indexDir}; null turns it off. */
+	public BatchExporter incremental(Path indexDir) {
+		this.indexDir = indexDir;
+		return this;
+	}
+
+	/** Runs every account and returns their outcomes in manifest order. */
+	public List<AccountResult> run(List<Account> accounts, DateRange range, Where where) throws InterruptedException {
+		ExecutorService pool = Executors.newFixedThreadPool(Math.min(concurrency, Math.max(1, accounts.size())), r -> {
+			Thread t = new Thread(r, "batch-account");
+			t.setDaemon(true);
+			return t;
+		});
+		try {
+			List<Callable<AccountResult>> tasks = new ArrayList<>(accounts.size());
+			for (int i = 0; i < accounts.size(); i++) {
+				ExportJob job = new ExportJob(i + 1, range, where, accounts.get(i));
+				tasks.add(() -> export(job));
+			}
+			List<AccountResult> results = new ArrayList<>(accounts.size());
+			for (Future<AccountResult> f : pool.invokeAll(tasks)) {
+				try {
+					results.add(f.get());
+				} catch (ExecutionException e) {
+					throw new IllegalStateException("Batch export failed", e.getCause());
+				}
+			}
+			return results;
+		} finally {
+			pool.shutdownNow();
+		}
+	}
+
+	private AccountResult export(ExportJob job) throws InterruptedException {
+		Account account = job.getAccount();
+		long t0 = System.nanoTime();
+		PipelineOptions opts = options.get();
+		Predicate<BookingView> filter = b -> job.getRange().contains(b.getStartDate());
+		if (job.getWhere() != null) {
+			opts.rawFilter(job.getWhere().rawFilter());
+			filter = filter.and(job.getWhere().residual());
+		}
+		BrowserPool.Lease lease = null;
+		try {
+			Path indexFile = indexDir == null ? null : ExportIndex.file(indexDir, account.getName());
+			ExportIndex index = indexFile == null ? null : ExportIndex.load(indexFile);
+			if (index != null) opts.onWritten(index::record);
+			ExportJob incremental = index == null ? job : new ExportJob(job.getId(), job.getRange(), job.getWhere(), account, index);
+			if (browsers != null) lease = browsers.acquire();
+			try (CsvSink sink = Exporter.open(account.getOutput(), FlushPolicy.everyRows(FLUSH_ROWS))) {
+				PipelineResult r = new Pipeline(opts).run(sources.open(incremental, lease, limiters), job.getRange(), filter, sink);
+				sink.commit();
+				if (index != null) index.save(indexFile);
+				return new AccountResult(account, r.getWritten(), r.getRejects().size(), System.nanoTime() - t0, null, stats(lease));
+			}
+		} catch (IOException | RuntimeException e) {
+			return new AccountResult(account, 0, 0, System.nanoTime() - t0, e.toString(), stats(lease));
+		} finally {
+			if (lease != null) lease.close();
+		}
+	}
+
+	private static BlockStats stats(BrowserPool.Lease lease) {
+		return lease == null ? null : lease.blockStats();
+	}
+}
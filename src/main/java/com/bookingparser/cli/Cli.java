@@ -1,37 +1,101 @@
 package com.bookingparser.cli;
 
+import com.bookingparser.batch.AccountManifest;
+import com.bookingparser.batch.AccountResult;
+import com.bookingparser.batch.BatchExporter;
+import com.bookingparser.export.CsvEngine;
+import com.bookingparser.export.CsvSink;
 import com.bookingparser.export.Exporter;
-import com.bookingparser.model.BookingNormalized;
+import com.bookingparser.export.FlushPolicy;
+import com.bookingparser.filter.Where;
 import com.bookingparser.model.BookingRaw;
-import com.bookingparser.normalize.NormalizerUtil;
+import com.bookingparser.model.BookingView;
+import com.bookingparser.normalize.NormalizeCache;
+import com.bookingparser.normalize.Reject;
+import com.bookingparser.pipeline.Pipeline;
+import com.bookingparser.pipeline.PipelineOptions;
+import com.bookingparser.pipeline.PipelineResult;
+import com.bookingparser.pipeline.StageStats;
+import com.bookingparser.scrape.Account;
+import com.bookingparser.scrape.BlockProfile;
+import com.bookingparser.scrape.BrowserPool;
+import com.bookingparser.scrape.CachedReservationSource;
+import com.bookingparser.scrape.HttpReservationSource;
+import com.bookingparser.scrape.PageCache;
+import com.bookingparser.scrape.RateLimiter;
+import com.bookingparser.scrape.RateLimiters;
+import com.bookingparser.scrape.ReservationScraper;
+import com.bookingparser.scrape.SessionStore;
+import com.bookingparser.server.ExportServer;
+import com.bookingparser.server.ExportJob;
+import com.bookingparser.source.DateRange;
+import com.bookingparser.source.ExportIndex;
+import com.bookingparser.source.FetchJournal;
+import com.bookingparser.source.ListingSource;
+import com.bookingparser.source.RawFileSource;
+import com.bookingparser.source.ReservationSource;
 
 import java.io.IOException;
+import java.net.InetAddress;
+import java.net.InetSocketAddress;
+import java.nio.file.DirectoryStream;
+import java.nio.file.Files;
 import java.nio.file.Path;
+import java.time.Duration;
 import java.time.LocalDate;
-import java.util.ArrayList;
+import java.util.Arrays;
 import java.util.List;
-import java.util.Optional;
+import java.util.concurrent.CountDownLatch;
+import java.util.function.Predicate;
 
 public class Cli {
+	private static final int FLUSH_ROWS = 10_000;
+	/** Token buckets on disk, shared by every exporter process run from this directory. */
+	private static final String RATE_STATE_DIR = ".cache/ratelimit";
+	/** Saved sign-in for the account from BOOKING_EMAIL / BOOKING_PASSWORD; manifest accounts get one each in SESSIONS_DIR. */
+	private static final Path SESSION_FILE = Path.of(".cache/session.json");
+	private static final Path SESSIONS_DIR = Path.of(".cache/sessions");
+	/** What incremental runs have exported, one index per account: BOOKING_EMAIL in the main mode, the manifest name in batch mode. */
+	private static final Path INDEX_DIR = Path.of(".cache/index");
+	/** Responses read by earlier runs, for --offline. */
+	private static final Path PAGE_CACHE_DIR = Path.of(".cache/pages");
+	/** Checkpoints of the export in progress, for --resume; removed once the CSV is written. */
+	private static final Path JOURNAL_FILE = Path.of(".cache/journal/default.journal");
+	private static final String BLOCK_HELP =
+		"  --block-types LIST  resource types never loaded (default image,media,font; 'none' for no type)\n" +
+		"  --block-url REGEX   also block URLs matching REGEX (repeatable; analytics, ads and maps are blocked by default)\n" +
+		"  --no-block          load everything\n" +
+		"  --fetch MODE        browser (default) or http: plain requests with the saved session, browser on a challenge\n";
+
 	private static LocalDate parseDateOpt(String v) {
 		if (v == null || v.isBlank()) return null;
 		return LocalDate.parse(v);
 	}
 
-	private static List<BookingNormalized> filterByDate(List<BookingNormalized> list, LocalDate from, LocalDate to) {
-		if (from == null && to == null) return list;
-		List<BookingNormalized> out = new ArrayList<>();
-		for (BookingNormalized b : list) {
-			if (from != null && b.getStartDate().isBefore(from)) continue;
-			if (to != null && b.getStartDate().isAfter(to)) continue;
-			out.add(b);
-		}
-		return out;
+	/** Final check for records the source could not date before fetching them. */
+	private static Predicate<BookingView> inDateRange(DateRange range) {
+		if (range.isAll()) return b -> true;
+		return b -> range.contains(b.getStartDate());
 	}
 
 	public static void main(String[] args) throws IOException {
-		String fromArg = null, toArg = null, outArg = "./bookings.csv", emailFallback = null;
-		boolean headless = true, noHeadless = false, deleteCache = false, debug = false;
+		if (args.length > 0 && args[0].equals("serve")) {
+			serve(Arrays.copyOfRange(args, 1, args.length));
+			return;
+		}
+		if (args.length > 0 && args[0].equals("batch")) {
+			batch(Arrays.copyOfRange(args, 1, args.length));
+			return;
+		}
+		String fromArg = null, toArg = null, outArg = "./bookings.csv", emailFallback = null, rawInput = null;
+		boolean headless = true, noHeadless = false, deleteCache = false, debug = false, incremental = false, resume = false;
+		int cacheSize = 0, threads = Runtime.getRuntime().availableProcessors();
+		int filterThreads = 1, queueSize = 1024;
+		String whereArg = null;
+		CsvEngine csvEngine = CsvEngine.FAST;
+		BlockProfile blocking = BlockProfile.defaults();
+		boolean httpFetch = false, offline = false, pageCache = true;
+		int pageCacheDays = 30, pageCacheMb = 256;
 		for (int i = 0; i < args.length; i++) {
 			String a = args[i];
 			switch (a) {
@@ -42,18 +106,66 @@ public class Cli {
 				case "--no-headless": noHeadless = true; headless = false; break;
 				case "--delete-cache": deleteCache = true; break;
 				case "--debug": debug = true; break;
+				case "--incremental": incremental = true; break;
+				case "--resume": resume = true; break;
 				case "--email-fallback": emailFallback = args[++i]; break;
+				case "--raw-input": rawInput = args[++i]; break;
+				case "--cache-size": cacheSize = Integer.parseInt(args[++i]); break;
+				case "--threads": threads = Integer.parseInt(args[++i]); break;
+				case "--filter-threads": filterThreads = Integer.parseInt(args[++i]); break;
+				case "--queue-size": queueSize = Integer.parseInt(args[++i]); break;
+				case "--where": whereArg = args[++i]; break;
+				case "--csv-engine": csvEngine = CsvEngine.valueOf(args[++i].toUpperCase()); break;
+				case "--block-types": blocking = blocking.types(args[++i]); break;
+				case "--block-url": blocking = blocking.url(args[++i]); break;
+				case "--no-block": blocking = BlockProfile.NONE; break;
+				case "--fetch": httpFetch = parseFetchMode(args[++i]); break;
+				case "--offline": offline = true; break;
+				case "--no-page-cache": pageCache = false; break;
+				case "--page-cache-days": pageCacheDays = Integer.parseInt(args[++i]); break;
+				case "--page-cache-mb": pageCacheMb = Integer.parseInt(args[++i]); break;
 				case "-h": case "--help":
 					System.out.println("Export Booking.com past reservations to CSV\n" +
 						"Options:\n" +
-						"  --from YYYY-MM-DD\n  --to YYYY-MM-DD\n  --out PATH\n  --headless | --no-headless\n  --delete-cache\n  --debug\n  --email-fallback PATH\n");
+						"  --from YYYY-MM-DD\n  --to YYYY-MM-DD\n  --out PATH\n  --headless | --no-headless\n  --delete-cache\n  --debug\n  --email-fallback PATH\n  --cache-size N\n  --threads N\n  --filter-threads N\n  --queue-size N\n  --where EXPR\n  --csv-engine fast|commons\n" +
+						"  --incremental       write only reservations new or changed since the last incremental run\n" +
+						"  --resume            continue the last export that did not finish from its checkpoints\n" +
+						"  --raw-input PATH    normalize raw reservations from a JSON Lines or CSV dump (.gz too) instead of scraping\n" +
+						"  --offline           extract from responses cached by earlier runs; no network, no sign-in\n" +
+						"  --no-page-cache     do not store responses for --offline\n" +
+						"  --page-cache-days N drop cached responses older than N days (default 30)\n" +
+						"  --page-cache-mb N   keep at most N MiB of compressed responses (default 256)\n" +
+						BLOCK_HELP +
+						"Commands:\n" +
+						"  serve             keep running and take export jobs over local HTTP (serve --help)\n" +
+						"  batch             export every account in a manifest (batch --help)\n");
 					return;
 			}
 		}
 
-		Path storage = Path.of(".cache/session.json");
+		Where where = null;
+		if (whereArg != null) {
+			try {
+				where = Where.compile(whereArg);
+			} catch (IllegalArgumentException e) {
+				System.err.println(e.getMessage());
+				System.exit(2);
+			}
+		}
+
 		if (deleteCache) {
-			java.nio.file.Files.deleteIfExists(storage);
+			Files.deleteIfExists(SESSION_FILE);
+			if (Files.isDirectory(SESSIONS_DIR)) {
+				try (DirectoryStream<Path> sessions = Files.newDirectoryStream(SESSIONS_DIR, "*.json")) {
+					for (Path f : sessions) Files.delete(f);
+				}
+			}
+			if (Files.isDirectory(PAGE_CACHE_DIR)) {
+				try (DirectoryStream<Path> pages = Files.newDirectoryStream(PAGE_CACHE_DIR, "*.bin")) {
+					for (Path f : pages) Files.delete(f);
+				}
+			}
+			Files.deleteIfExists(JOURNAL_FILE);
 			System.out.println("Cache deleted");
 			return;
 		}
@@ -61,28 +173,289 @@ public class Cli {
 		String email = System.getenv("BOOKING_EMAIL");
 		String password = System.getenv("BOOKING_PASSWORD");
 
-		List<BookingRaw> raws = new ArrayList<>();
-		if (emailFallback != null) {
+		ReservationSource source = ReservationSource.empty();
+		Path indexFile = ExportIndex.file(INDEX_DIR, email != null ? email : RateLimiters.DEFAULT_ACCOUNT);
+		ExportIndex index = incremental ? ExportIndex.load(indexFile) : null;
+		DateRange range = DateRange.of(parseDateOpt(fromArg), parseDateOpt(toArg));
+		FetchJournal journal = null;
+		Duration pageTtl = Duration.ofDays(pageCacheDays);
+		long pageBytes = pageCacheMb * 1024L * 1024L;
+		RawFileSource raw = null;
+		if (rawInput != null) {
+			try {
+				raw = new RawFileSource(Path.of(rawInput));
+			} catch (IllegalArgumentException e) {
+				System.err.println(e.getMessage());
+				System.exit(2);
+			}
+			source = raw;
+		} else if (emailFallback != null) {
 			System.out.println("Email fallback parsing not implemented in this version.");
+		} else if (offline) {
+			ExportIndex offlineIndex = index;
+			source = (r, out) -> {
+				try (PageCache pages = PageCache.open(PAGE_CACHE_DIR, pageTtl, pageBytes)) {
+					ListingSource<BookingRaw> cached = new CachedReservationSource(pages, RateLimiters.DEFAULT_ACCOUNT).incremental(offlineIndex);
+					try {
+						cached.fetch(r, out);
+					} finally {
+						System.out.println("  " + cached);
+						System.out.println("  " + pages);
+					}
+				}
+			};
 		} else {
 			if (email == null || password == null) {
 				System.err.println("BOOKING_EMAIL and BOOKING_PASSWORD must be set.");
 				System.exit(2);
 			}
-			System.out.println("Scraping not implemented in Java version yet; producing empty output.");
-			// TODO: implement Playwright-based scraping in Java similar to Python version.
+			boolean launchHeadless = headless;
+			BlockProfile launchBlocking = blocking;
+			boolean launchHttp = httpFetch;
+			// a checkpoint only applies to a run reading the same listing the same way
+			journal = FetchJournal.open(JOURNAL_FILE, (httpFetch ? "http " : "browser ") + range + (incremental ? " incremental" : ""), resume);
+			if (journal.isResumed()) System.out.println("Resuming: " + journal);
+			else if (resume) System.out.println("No checkpoints of an unfinished export with these options; starting over.");
+			ExportIndex launchIndex = index;
+			FetchJournal launchJournal = journal;
+			boolean launchPageCache = pageCache;
+			// the browser is launched on the fetch thread, which then makes every Playwright call
+			source = (r, out) -> {
+				try (RateLimiters limiters = new RateLimiters(1.0, 1, Path.of(RATE_STATE_DIR));
+						PageCache pages = launchPageCache ? PageCache.open(PAGE_CACHE_DIR, pageTtl, pageBytes) : null;
+						BrowserPool browsers = new BrowserPool(1, launchHeadless, launchBlocking);
+						BrowserPool.Lease lease = browsers.acquire()) {
+					ListingSource<BookingRaw> scraper = scrapeSource(new ExportJob(0, r, null, null, launchIndex), lease, limiters, launchHttp, pages)
+						.checkpointTo(launchJournal);
+					try {
+						scraper.fetch(r, out);
+					} finally {
+						System.out.println("  " + scraper);
+						System.out.println("  " + lease.blockStats());
+						if (pages != null) System.out.println("  " + pages);
+					}
+				}
+			};
 		}
 
-		List<BookingNormalized> normalized = new ArrayList<>();
-		for (BookingRaw r : raws) {
-			try { normalized.add(NormalizerUtil.normalize(r)); } catch (Exception ignored) {}
+		NormalizeCache cache = cacheSize > 0 ? new NormalizeCache(cacheSize) : null;
+		PipelineOptions options = new PipelineOptions().normalizeThreads(threads).filterThreads(filterThreads)
+			.queueCapacity(queueSize).cache(cache);
+		// a record counts as exported only once its row is written
+		if (index != null) options.onWritten(index::record);
+		Predicate<BookingView> filter = inDateRange(range);
+		if (where != null) {
+			options.rawFilter(where.rawFilter());
+			filter = filter.and(where.residual());
+			if (debug) System.out.println("Filter: " + where);
 		}
 
-		LocalDate from = parseDateOpt(fromArg);
-		LocalDate to = parseDateOpt(toArg);
-		normalized = filterByDate(normalized, from, to);
+		PipelineResult result;
+		try (CsvSink sink = Exporter.open(Path.of(outArg), FlushPolicy.everyRows(FLUSH_ROWS), csvEngine)) {
+			result = new Pipeline(options).run(source, range, filter, sink);
+			sink.commit();
+		} catch (InterruptedException e) {
+			Thread.currentThread().interrupt();
+			System.err.println("Interrupted; rows written so far are in " + Exporter.partial(Path.of(outArg)));
+			if (journal != null) System.err.println("Progress is checkpointed; rerun with --resume to continue.");
+			return;
+		} catch (IOException | RuntimeException e) {
+			System.err.println("Export failed; rows written so far are in " + Exporter.partial(Path.of(outArg)));
+			if (journal != null) System.err.println("Progress is checkpointed; rerun with --resume to continue.");
+			throw e;
+		} finally {
+			if (journal != null) journal.close();
+		}
+		for (Reject r : result.getRejects()) {
+			if (debug) System.err.println("  " + r);
+		}
+		if (!result.getRejects().isEmpty()) System.err.println("Skipped " + result.getRejects().size() + " bookings that could not be normalized.");
+		for (StageStats stage : result.getStages()) System.out.println("  " + stage);
+		if (raw != null) System.out.println("  " + raw);
+		if (debug && cache != null) System.out.println("Normalize cache: " + cache);
+		System.out.println("Wrote " + result.getWritten() + " rows to " + outArg);
+		if (index != null) {
+			// only now that the rows are on disk do they count as exported
+			index.save(indexFile);
+			System.out.println("Incremental " + index);
+		}
+		if (journal != null) {
+			if (debug) System.out.println("Checkpoint " + journal);
+			journal.delete();
+		}
+	}
 
-		Exporter.writeCsv(normalized, Path.of(outArg));
-		System.out.println("Wrote " + normalized.size() + " rows to " + outArg);
+	/** Long-running mode: keeps the JVM, browsers and caches warm and takes export jobs over local HTTP. */
+	private static void serve(String[] args) throws IOException {
+		int port = 8765, poolSize = 2, cacheSize = 10_000, threads = Runtime.getRuntime().availableProcessors();
+		double rate = 1.0;
+		int burst = 1;
+		String rateDir = RATE_STATE_DIR;
+		boolean headless = true;
+		BlockProfile blocking = BlockProfile.defaults();
+		boolean httpFetch = false;
+		for (int i = 0; i < args.length; i++) {
+			String a = args[i];
+			switch (a) {
+				case "--port": port = Integer.parseInt(args[++i]); break;
+				case "--pool-size": poolSize = Integer.parseInt(args[++i]); break;
+				case "--rate": rate = Double.parseDouble(args[++i]); break;
+				case "--burst": burst = Integer.parseInt(args[++i]); break;
+				case "--rate-state-dir": rateDir = args[++i]; break;
+				case "--block-types": blocking = blocking.types(args[++i]); break;
+				case "--block-url": blocking = blocking.url(args[++i]); break;
+				case "--no-block": blocking = BlockProfile.NONE; break;
+				case "--fetch": httpFetch = parseFetchMode(args[++i]); break;
+				case "--headless": headless = true; break;
+				case "--no-headless": headless = false; break;
+				case "--cache-size": cacheSize = Integer.parseInt(args[++i]); break;
+				case "--threads": threads = Integer.parseInt(args[++i]); break;
+				case "-h": case "--help":
+					System.out.println("Serve export jobs on http://127.0.0.1:PORT/export?from=&to=&where=\n" +
+						"Options:\n" +
+						"  --port N\n  --pool-size N\n  --rate REQ_PER_SEC\n  --burst N\n  --rate-state-dir DIR\n  --headless | --no-headless\n  --cache-size N\n  --threads N\n" +
+						BLOCK_HELP);
+					return;
+			}
+		}
+		if (System.getenv("BOOKING_EMAIL") == null || System.getenv("BOOKING_PASSWORD") == null) {
+			System.err.println("BOOKING_EMAIL and BOOKING_PASSWORD must be set.");
+			System.exit(2);
+		}
+
+		// one cache for all jobs: repeated date and price strings stay parsed between exports
+		NormalizeCache cache = cacheSize > 0 ? new NormalizeCache(cacheSize) : null;
+		int normalizeThreads = threads;
+		boolean http = httpFetch;
+		BrowserPool browsers = new BrowserPool(poolSize, headless, blocking);
+		RateLimiters limiters = new RateLimiters(rate, burst, Path.of(rateDir));
+		ExportServer server = new ExportServer(new InetSocketAddress(InetAddress.getLoopbackAddress(), port), browsers,
+			limiters, (job, lease, l) -> scrapeSource(job, lease, l, http, null), () -> new PipelineOptions().normalizeThreads(normalizeThreads).cache(cache));
+		CountDownLatch stopped = new CountDownLatch(1);
+		Runtime.getRuntime().addShutdownHook(new Thread(() -> {
+			try {
+				server.close();
+				browsers.close();
+				limiters.close();
+			} catch (InterruptedException e) {
+				Thread.currentThread().interrupt();
+			} catch (IOException e) {
+				System.err.println("Closing rate limit state failed: " + e);
+			}
+			stopped.countDown();
+		}));
+		try {
+			browsers.warmUp();
+			server.start();
+			System.out.println("Serving on http://" + server.getAddress().getHostString() + ":" + server.getAddress().getPort());
+			stopped.await();
+		} catch (InterruptedException e) {
+			Thread.currentThread().interrupt();
+		}
+	}
+
+	/** Exports every account listed in a manifest, sharing browsers between them. */
+	private static void batch(String[] args) throws IOException {
+		String manifestArg = null, secretsArg = null, outDir = ".", fromArg = null, toArg = null, whereArg = null;
+		int concurrency = 2, threads = 2, cacheSize = 10_000;
+		double rate = 1.0;
+		int burst = 1;
+		String rateDir = RATE_STATE_DIR;
+		boolean headless = true;
+		BlockProfile blocking = BlockProfile.defaults();
+		boolean httpFetch = false, incremental = false;
+		for (int i = 0; i < args.length; i++) {
+			String a = args[i];
+			switch (a) {
+				case "--manifest": manifestArg = args[++i]; break;
+				case "--secrets": secretsArg = args[++i]; break;
+				case "--out-dir": outDir = args[++i]; break;
+				case "--concurrency": concurrency = Integer.parseInt(args[++i]); break;
+				case "--from": fromArg = args[++i]; break;
+				case "--to": toArg = args[++i]; break;
+				case "--where": whereArg = args[++i]; break;
+				case "--rate": rate = Double.parseDouble(args[++i]); break;
+				case "--burst": burst = Integer.parseInt(args[++i]); break;
+				case "--rate-state-dir": rateDir = args[++i]; break;
+				case "--block-types": blocking = blocking.types(args[++i]); break;
+				case "--block-url": blocking = blocking.url(args[++i]); break;
+				case "--no-block": blocking = BlockProfile.NONE; break;
+				case "--fetch": httpFetch = parseFetchMode(args[++i]); break;
+				case "--headless": headless = true; break;
+				case "--no-headless": headless = false; break;
+				case "--threads": threads = Integer.parseInt(args[++i]); break;
+				case "--cache-size": cacheSize = Integer.parseInt(args[++i]); break;
+				case "--incremental": incremental = true; break;
+				case "-h": case "--help":
+					System.out.println("Export every account in a manifest (one 'name [output.csv]' per line)\n" +
+						"Options:\n" +
+						"  --manifest PATH\n  --secrets PATH\n  --out-dir DIR\n  --concurrency N\n  --from YYYY-MM-DD\n  --to YYYY-MM-DD\n" +
+						"  --where EXPR\n  --rate REQ_PER_SEC\n  --burst N\n  --rate-state-dir DIR\n  --headless | --no-headless\n  --threads N\n  --cache-size N\n" +
+						"  --incremental     write only reservations new or changed since each account's last incremental run\n" +
+						BLOCK_HELP);
+					return;
+			}
+		}
+		if (manifestArg == null) {
+			System.err.println("--manifest is required.");
+			System.exit(2);
+		}
+		List<Account> accounts;
+		DateRange range;
+		Where where = null;
+		try {
+			accounts = AccountManifest.read(Path.of(manifestArg), secretsArg == null ? null : Path.of(secretsArg), Path.of(outDir));
+			range = DateRange.of(parseDateOpt(fromArg), parseDateOpt(toArg));
+			if (whereArg != null) where = Where.compile(whereArg);
+		} catch (IllegalArgumentException e) {
+			System.err.println(e.getMessage());
+			System.exit(2);
+			return;
+		}
+
+		NormalizeCache cache = cacheSize > 0 ? new NormalizeCache(cacheSize) : null;
+		int normalizeThreads = threads;
+		boolean http = httpFetch;
+		List<AccountResult> results;
+		try (RateLimiters limiters = new RateLimiters(rate, burst, Path.of(rateDir));
+				BrowserPool browsers = new BrowserPool(concurrency, headless, blocking)) {
+			BatchExporter exporter = new BatchExporter(browsers, (job, lease, l) -> scrapeSource(job, lease, l, http, null), limiters,
+				() -> new PipelineOptions().normalizeThreads(normalizeThreads).cache(cache), concurrency).incremental(incremental ? INDEX_DIR : null);
+			results = exporter.run(accounts, range, where);
+			for (RateLimiter l : limiters.all()) System.out.println("  " + l);
+		} catch (InterruptedException e) {
+			Thread.currentThread().interrupt();
+			System.err.println("Interrupted");
+			return;
+		}
+		long failed = results.stream().filter(r -> !r.isOk()).count();
+		for (AccountResult r : results) System.out.println(r);
+		System.out.println(results.size() - failed + " of " + results.size() + " accounts exported.");
+		if (failed > 0) System.exit(1);
+	}
+
+	/**
+	 * @param http read with plain HTTP requests first and only use the browser when challenged
+	 * @param pages nullable; store every response read, for --offline
+	 */
+	private static ListingSource<BookingRaw> scrapeSource(ExportJob job, BrowserPool.Lease browser, RateLimiters limiters, boolean http,
+			PageCache pages) {
+		ExportIndex index = job.getIndex(); // nullable; emit only reservations it does not have in the same form
+		Account a = job.getAccount();
+		String name = a == null ? RateLimiters.DEFAULT_ACCOUNT : a.getName();
+		SessionStore session = new SessionStore(a == null ? SESSION_FILE : SESSIONS_DIR.resolve(name.replaceAll("[^A-Za-z0-9._-]", "_") + ".json"));
+		ReservationScraper scraper = a == null
+			? new ReservationScraper(browser, name, System.getenv("BOOKING_EMAIL"), System.getenv("BOOKING_PASSWORD"), limiters, session)
+			: new ReservationScraper(browser, name, a.getEmail(), a.getPassword(), limiters, session);
+		scraper.cacheTo(pages).incremental(index);
+		return http ? new HttpReservationSource(name, session, limiters, scraper).cacheTo(pages).incremental(index) : scraper;
+	}
+
+	private static boolean parseFetchMode(String mode) {
+		switch (mode) {
+			case "http": return true;
+			case "browser": return false;
+			default: throw new IllegalArgumentException("--fetch must be browser or http: " + mode);
+		}
 	}
-}
\ No newline at end of file
+}
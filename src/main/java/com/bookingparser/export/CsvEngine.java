@@ -0,0 +1,9 @@
+package com.bookingparser.export;
+
+/** Which writer a {@link CsvSink} uses; both produce identical bytes. */
+public enum CsvEngine {
+	/** commons-csv CSVPrinter with CSVFormat.DEFAULT. */
+	COMMONS,
+	/** {@link FastCsvWriter}, specialized for the six export columns. */
+	FAST
+}
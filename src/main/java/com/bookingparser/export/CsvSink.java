@@ -0,0 +1,236 @@
+package com.bookingparser.export;
+
+import com.bookingparser.model.BookingTable;
+import com.bookingparser.model.BookingView;
+import org.apache.commons.csv.CSVFormat;
+import org.apache.commons.csv.CSVPrinter;
+
+import java.io.BufferedWriter;
+import java.io.FilterOutputStream;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.OutputStreamWriter;
+import java.io.UncheckedIOException;
+import java.io.Writer;
+import java.nio.channels.FileChannel;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.AtomicMoveNotSupportedException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardCopyOption;
+import java.nio.file.StandardOpenOption;
+import java.time.Instant;
+import java.util.Iterator;
+import java.util.stream.Stream;
+
+/**
+ * Streaming CSV output: the file is opened once with the header, rows are written as they arrive,
+ * and memory stays flat however many bookings pass through. Obtain one via {@link Exporter#open}.
+ * <p>
+ * A sink on a path writes to {@link Exporter#partial} next to it and only {@link #commit} moves
+ * that file into place, atomically, so the output is either the previous file or a complete
+ * export. Closed without a commit, e.g. because the run failed, it leaves the partial file: the
+ * header and every row flushed so far. A sidecar ({@link Exporter#progress}), rewritten on each
+ * flush, records how many rows and bytes of it are complete; a hard crash can only leave a torn
+ * row after that point.
+ */
+public class CsvSink implements AutoCloseable {
+	private final Path output;
+	private final Counting counter; // null for a sink over a caller's writer
+	private final Writer writer;
+	/** Exactly one of printer and fast is set, per the {@link CsvEngine} the sink was opened with. */
+	private final CSVPrinter printer;
+	private final FastCsvWriter fast;
+	private final FlushPolicy flushPolicy;
+	private long rows;
+	private int rowsSinceFlush;
+	private long lastFlush;
+	private boolean committed;
+	private boolean closed;
+
+	CsvSink(Path output, FlushPolicy flushPolicy) throws IOException {
+		this(output, flushPolicy, CsvEngine.FAST);
+	}
+
+	CsvSink(Path output, FlushPolicy flushPolicy, CsvEngine engine) throws IOException {
+		this(output, newStream(output), flushPolicy, engine);
+	}
+
+	private CsvSink(Path output, Counting counter, FlushPolicy flushPolicy, CsvEngine engine) throws IOException {
+		this(output, counter, new BufferedWriter(new OutputStreamWriter(counter, StandardCharsets.UTF_8)), flushPolicy, engine);
+	}
+
+	CsvSink(Writer writer, FlushPolicy flushPolicy, CsvEngine engine) throws IOException {
+		this(null, null, writer, flushPolicy, engine);
+	}
+
+	private CsvSink(Path output, Counting counter, Writer writer, FlushPolicy flushPolicy, CsvEngine engine) throws IOException {
+		this.output = output;
+		this.counter = counter;
+		this.flushPolicy = flushPolicy;
+		this.writer = writer;
+		try {
+			if (engine == CsvEngine.FAST) {
+				this.printer = null;
+				this.fast = new FastCsvWriter(writer);
+				fast.writeHeader();
+			} else {
+				this.printer = new CSVPrinter(writer, CSVFormat.DEFAULT.builder().setHeader(Exporter.HEADER).build());
+				this.fast = null;
+			}
+		} catch (IOException e) {
+			writer.close();
+			throw e;
+		}
+		this.lastFlush = System.nanoTime();
+	}
+
+	private static Counting newStream(Path output) throws IOException {
+		Path parent = output.toAbsolutePath().getParent();
+		if (parent != null) Files.createDirectories(parent);
+		Files.deleteIfExists(Exporter.progress(output));
+		return new Counting(Files.newOutputStream(Exporter.partial(output)));
+	}
+
+	public void write(BookingView b) throws IOException {
+		if (fast != null) fast.writeRow(b);
+		else printer.printRecord((Object[]) b.toCsvRow());
+		written();
+	}
+
+	/** Writes one table row straight from its columns. */
+	public void write(BookingTable table, int row) throws IOException {
+		if (fast != null) fast.writeRow(table, row);
+		else printer.printRecord(table.city(row), table.country(row), table.hotelName(row),
+			table.startDate(row), table.endDate(row), table.priceText(row));
+		written();
+	}
+
+	public void writeAll(BookingTable table) throws IOException {
+		for (int i = 0; i < table.size(); i++) write(table, i);
+	}
+
+	public void writeAll(Iterator<? extends BookingView> bookings) throws IOException {
+		while (bookings.hasNext()) write(bookings.next());
+	}
+
+	public void writeAll(Stream<? extends BookingView> bookings) throws IOException {
+		try {
+			bookings.forEachOrdered(b -> {
+				try {
+					write(b);
+				} catch (IOException e) {
+					throw new UncheckedIOException(e);
+				}
+			});
+		} catch (UncheckedIOException e) {
+			throw e.getCause();
+		}
+	}
+
+	private void written() throws IOException {
+		rows++;
+		rowsSinceFlush++;
+		long now = flushPolicy.timed() ? System.nanoTime() : 0;
+		if (flushPolicy.due(rowsSinceFlush, now - lastFlush)) flush();
+	}
+
+	public void flush() throws IOException {
+		if (fast != null) fast.flush();
+		else printer.flush();
+		rowsSinceFlush = 0;
+		if (flushPolicy.timed()) lastFlush = System.nanoTime();
+		if (counter != null) progress("writing");
+	}
+
+	/** Records how far the partial file is complete, replacing the sidecar atomically. */
+	private void progress(String state) throws IOException {
+		Path sidecar = Exporter.progress(output);
+		String json = "{\"state\":\"" + state + "\",\"rows\":" + rows + ",\"bytes\":" + counter.count
+			+ ",\"updated\":\"" + Instant.now() + "\"}\n";
+		Path tmp = Files.createTempFile(sidecar.toAbsolutePath().getParent(), sidecar.getFileName().toString(), ".tmp");
+		try {
+			Files.writeString(tmp, json);
+			move(tmp, sidecar);
+		} finally {
+			Files.deleteIfExists(tmp);
+		}
+	}
+
+	/**
+	 * Finishes the export: flushes, forces the partial file to disk and renames it to the output
+	 * atomically, replacing any earlier export. A sink over a caller's writer is just closed.
+	 */
+	public void commit() throws IOException {
+		if (closed) throw new IllegalStateException("Sink is already closed");
+		closeWriter();
+		closed = true;
+		if (output == null) return;
+		Path partial = Exporter.partial(output);
+		try (FileChannel ch = FileChannel.open(partial, StandardOpenOption.WRITE)) {
+			ch.force(true);
+		}
+		move(partial, output);
+		committed = true;
+		Files.deleteIfExists(Exporter.progress(output));
+	}
+
+	private static void move(Path from, Path to) throws IOException {
+		try {
+			Files.move(from, to, StandardCopyOption.REPLACE_EXISTING, StandardCopyOption.ATOMIC_MOVE);
+		} catch (AtomicMoveNotSupportedException e) {
+			Files.move(from, to, StandardCopyOption.REPLACE_EXISTING);
+		}
+	}
+
+	public long rowsWritten() {
+		return rows;
+	}
+
+	/** File being written, or null for a sink over a caller's writer. */
+	public Path getOutput() {
+		return output;
+	}
+
+	public boolean isCommitted() {
+		return committed;
+	}
+
+	/** Without a {@link #commit}, leaves the partial file and its sidecar for a sink on a path. */
+	@Override
+	public void close() throws IOException {
+		if (closed) return;
+		closed = true;
+		try {
+			closeWriter();
+		} finally {
+			if (counter != null) progress("incomplete");
+		}
+	}
+
+	private void closeWriter() throws IOException {
+		if (fast != null) fast.close();
+		else printer.close();
+	}
+
+	/** Counts the bytes that reach the file, i.e. the complete prefix after a flush. */
+	private static final class Counting extends FilterOutputStream {
+		long count;
+
+		Counting(OutputStream out) {
+			super(out);
+		}
+
+		@Override
+		public void write(int b) throws IOException {
+			out.write(b);
+			count++;
+		}
+
+		@Override
+		public void write(byte[] b, int off, int len) throws IOException {
+			out.write(b, off, len);
+			count += len;
+		}
+	}
+}
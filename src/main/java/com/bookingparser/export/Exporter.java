@@ -1,12 +1,10 @@
 package com.bookingparser.export;
 
 import com.bookingparser.model.BookingNormalized;
-import org.apache.commons.csv.CSVFormat;
-import org.apache.commons.csv.CSVPrinter;
+import com.bookingparser.model.BookingTable;
 
 import java.io.IOException;
 import java.io.Writer;
-import java.nio.file.Files;
 import java.nio.file.Path;
 import java.util.List;
 
@@ -15,14 +13,49 @@ public class Exporter {
 		"City","Country","Hotel name","Start date","End date","Total price of booking"
 	};
 
+	public static CsvSink open(Path output) throws IOException {
+		return open(output, FlushPolicy.onClose());
+	}
+
+	/** Where a sink on {@code output} writes until it is committed. */
+	public static Path partial(Path output) {
+		return output.resolveSibling(output.getFileName() + ".partial");
+	}
+
+	/** Sidecar recording how much of {@link #partial} is complete; present only while writing or after a failed export. */
+	public static Path progress(Path output) {
+		return output.resolveSibling(output.getFileName() + ".partial.json");
+	}
+
+	/** Opens a streaming sink on {@code output}; rows go out as they are written and the file appears on {@link CsvSink#commit}. */
+	public static CsvSink open(Path output, FlushPolicy flushPolicy) throws IOException {
+		return new CsvSink(output, flushPolicy);
+	}
+
+	/** Same as {@link #open(Path, FlushPolicy)} with an explicit writer; the output bytes do not depend on it. */
+	public static CsvSink open(Path output, FlushPolicy flushPolicy, CsvEngine engine) throws IOException {
+		return new CsvSink(output, flushPolicy, engine);
+	}
+
+	/** Streams CSV to {@code out}, which the sink owns and closes. */
+	public static CsvSink open(Writer out, FlushPolicy flushPolicy, CsvEngine engine) throws IOException {
+		return new CsvSink(out, flushPolicy, engine);
+	}
+
 	public static Path writeCsv(List<BookingNormalized> bookings, Path output) throws IOException {
-		Files.createDirectories(output.getParent());
-		try (Writer w = Files.newBufferedWriter(output);
-		     CSVPrinter printer = new CSVPrinter(w, CSVFormat.DEFAULT.builder().setHeader(HEADER).build())) {
-			for (BookingNormalized b : bookings) {
-				printer.printRecord((Object[]) b.toCsvRow());
-			}
+		try (CsvSink sink = open(output)) {
+			sink.writeAll(bookings.iterator());
+			sink.commit();
+		}
+		return output;
+	}
+
+	/** Writes straight from the table's columns without materializing row objects. */
+	public static Path writeCsv(BookingTable table, Path output) throws IOException {
+		try (CsvSink sink = open(output)) {
+			sink.writeAll(table);
+			sink.commit();
 		}
 		return output;
 	}
-}
\ No newline at end of file
+}
@@ -0,0 +1,240 @@
+package com.bookingparser.export;
+
+import com.bookingparser.model.BookingTable;
+import com.bookingparser.model.BookingView;
+import com.bookingparser.model.CurrencyTable;
+import com.bookingparser.model.MinorPrice;
+
+import java.io.IOException;
+import java.io.Writer;
+import java.math.BigDecimal;
+import java.time.LocalDate;
+
+/**
+ * Writer for the fixed six-column export that produces the same bytes as CSVPrinter with
+ * CSVFormat.DEFAULT, without per-row arrays or toString calls. Each field is copied into a reusable
+ * char buffer first and then scanned in place for characters that need quoting; dates are formatted
+ * from epoch days and prices from minor units directly into the buffer.
+ */
+public class FastCsvWriter implements AutoCloseable {
+	private static final int MIN_BUFFER = 1 << 10;
+	/** Longest text a price or date field can take: sign, 19 digits, point, space, code. */
+	private static final int MAX_NUMERIC_FIELD = 48;
+	private static final long[] POW10 = {1L, 10L, 100L, 1_000L, 10_000L, 100_000L, 1_000_000L, 10_000_000L, 100_000_000L};
+
+	private final Writer out;
+	private char[] buf;
+	private int pos;
+
+	public FastCsvWriter(Writer out) {
+		this(out, 1 << 16);
+	}
+
+	public FastCsvWriter(Writer out, int bufferSize) {
+		this.out = out;
+		this.buf = new char[Math.max(bufferSize, MIN_BUFFER)];
+	}
+
+	public void writeHeader() throws IOException {
+		String[] header = Exporter.HEADER;
+		for (int i = 0; i < header.length; i++) field(header[i], i == 0);
+		endRecord();
+	}
+
+	public void writeRow(BookingView b) throws IOException {
+		field(b.getCity(), true);
+		field(b.getCountry(), false);
+		field(b.getHotelName(), false);
+		date(b.getStartDate().toEpochDay());
+		date(b.getEndDate().toEpochDay());
+		price(MinorPrice.of(b.getTotalPrice()));
+		endRecord();
+	}
+
+	public void writeRow(BookingTable table, int row) throws IOException {
+		field(table.city(row), true);
+		field(table.country(row), false);
+		field(table.hotelName(row), false);
+		date(table.startEpochDay(row));
+		date(table.endEpochDay(row));
+		price(table.minorPrice(row));
+		endRecord();
+	}
+
+	private void field(String s, boolean first) throws IOException {
+		if (!first) put(',');
+		if (s == null) return; // CSVPrinter writes null values as-is, never quoted
+		int len = s.length();
+		reserve(2 * len + 2);
+		int start = pos;
+		s.getChars(0, len, buf, start);
+		pos += len;
+		quoteIfNeeded(start, first);
+	}
+
+	/**
+	 * Applies QuoteMode.MINIMAL as CSVFormat.DEFAULT does: quote an empty first field, a field starting
+	 * with a char up to '#', one containing CR, LF, comma or quote, or one ending in a char up to space.
+	 */
+	private void quoteIfNeeded(int start, boolean first) {
+		int end = pos;
+		int len = end - start;
+		boolean quote;
+		if (len == 0) {
+			quote = first;
+		} else if (buf[start] <= '#') {
+			quote = true;
+		} else {
+			// branch-free so the JIT can vectorize it
+			int special = 0;
+			for (int i = start; i < end; i++) {
+				char c = buf[i];
+				special |= (c == ',' ? 1 : 0) | (c == '"' ? 1 : 0) | (c == '\n' ? 1 : 0) | (c == '\r' ? 1 : 0);
+			}
+			quote = special != 0 || buf[end - 1] <= ' ';
+		}
+		if (!quote) return;
+
+		int quotes = 0;
+		for (int i = start; i < end; i++) {
+			if (buf[i] == '"') quotes++;
+		}
+		// shift right from the back, doubling embedded quotes, then wrap in quotes
+		int w = end + quotes + 1;
+		buf[w] = '"';
+		for (int i = end - 1; i >= start; i--) {
+			char c = buf[i];
+			buf[--w] = c;
+			if (c == '"') buf[--w] = '"';
+		}
+		buf[start] = '"';
+		pos = end + quotes + 2;
+	}
+
+	/** ISO yyyy-MM-dd for years 0..9999; other years go through LocalDate. */
+	private void date(long epochDay) throws IOException {
+		put(',');
+		// civil-from-days, shifted so the era starts on 0000-03-01
+		long z = epochDay + 719468;
+		long era = Math.floorDiv(z, 146097);
+		long doe = z - era * 146097;
+		long yoe = (doe - doe / 1460 + doe / 36524 - doe / 146096) / 365;
+		long doy = doe - (365 * yoe + yoe / 4 - yoe / 100);
+		long mp = (5 * doy + 2) / 153;
+		int day = (int) (doy - (153 * mp + 2) / 5 + 1);
+		int month = (int) (mp < 10 ? mp + 3 : mp - 9);
+		long year = yoe + era * 400 + (month <= 2 ? 1 : 0);
+		if (year < 0 || year > 9999) {
+			String s = LocalDate.ofEpochDay(epochDay).toString();
+			reserve(s.length());
+			s.getChars(0, s.length(), buf, pos);
+			pos += s.length();
+			return;
+		}
+		reserve(10);
+		int y = (int) year;
+		buf[pos] = (char) ('0' + y / 1000);
+		buf[pos + 1] = (char) ('0' + y / 100 % 10);
+		buf[pos + 2] = (char) ('0' + y / 10 % 10);
+		buf[pos + 3] = (char) ('0' + y % 10);
+		buf[pos + 4] = '-';
+		buf[pos + 5] = (char) ('0' + month / 10);
+		buf[pos + 6] = (char) ('0' + month % 10);
+		buf[pos + 7] = '-';
+		buf[pos + 8] = (char) ('0' + day / 10);
+		buf[pos + 9] = (char) ('0' + day % 10);
+		pos += 10;
+	}
+
+	private void price(MinorPrice p) throws IOException {
+		put(',');
+		String code = p.getCurrency();
+		String plain = p.fitsMinor() ? null : p.toBigDecimal().toPlainString();
+		int max = (plain != null ? plain.length() : MAX_NUMERIC_FIELD) + (code == null ? 0 : code.length() + 1);
+		// reserve everything up front: the field is quote-checked in place from start
+		reserve(2 * max + 2);
+		int start = pos;
+		if (plain == null) {
+			int scale = p.getScale();
+			long unscaled = p.getMinor() / POW10[CurrencyTable.exponent(p.getCurrencyOrdinal()) - scale];
+			if (unscaled == Long.MIN_VALUE) plain = BigDecimal.valueOf(unscaled, scale).toPlainString();
+			else appendScaled(unscaled, scale);
+		}
+		if (plain != null) {
+			plain.getChars(0, plain.length(), buf, pos);
+			pos += plain.length();
+		}
+		if (code != null) {
+			buf[pos++] = ' ';
+			code.getChars(0, code.length(), buf, pos);
+			pos += code.length();
+		}
+		quoteIfNeeded(start, false);
+	}
+
+	private void appendScaled(long unscaled, int scale) {
+		if (unscaled < 0) {
+			buf[pos++] = '-';
+			unscaled = -unscaled;
+		}
+		if (scale == 0) {
+			digits(unscaled, 1);
+		} else {
+			long p10 = POW10[scale];
+			digits(unscaled / p10, 1);
+			buf[pos++] = '.';
+			digits(unscaled % p10, scale);
+		}
+	}
+
+	/** Writes v in decimal, left-padded with zeros to at least minDigits. */
+	private void digits(long v, int minDigits) {
+		int n = 1;
+		for (long t = v; t >= 10; t /= 10) n++;
+		n = Math.max(n, minDigits);
+		for (int i = pos + n - 1; i >= pos; i--) {
+			buf[i] = (char) ('0' + v % 10);
+			v /= 10;
+		}
+		pos += n;
+	}
+
+	private void put(char c) throws IOException {
+		reserve(1);
+		buf[pos++] = c;
+	}
+
+	private void endRecord() throws IOException {
+		reserve(2);
+		buf[pos++] = '\r';
+		buf[pos++] = '\n';
+	}
+
+	/** Makes room for {@code n} more chars, draining the buffer first and growing it only for huge fields. */
+	private void reserve(int n) throws IOException {
+		if (pos + n <= buf.length) return;
+		drain();
+		if (n > buf.length) buf = new char[n];
+	}
+
+	private void drain() throws IOException {
+		if (pos > 0) {
+			out.write(buf, 0, pos);
+			pos = 0;
+		}
+	}
+
+	public void flush() throws IOException {
+		drain();
+		out.flush();
+	}
+
+	@Override
+	public void close() throws IOException {
+		try {
+			drain();
+		} finally {
+			out.close();
+		}
+	}
+}
\ No newline at end of file
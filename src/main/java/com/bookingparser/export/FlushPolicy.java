@@ -0,0 +1,41 @@
+package com.bookingparser.export;
+
+/** When a {@link CsvSink} pushes buffered rows to disk, besides on close. */
+public final class FlushPolicy {
+	private final int rows;
+	private final long intervalNanos;
+
+	private FlushPolicy(int rows, long intervalNanos) {
+		this.rows = rows;
+		this.intervalNanos = intervalNanos;
+	}
+
+	/** Only the writer's own buffer and the final close flush. */
+	public static FlushPolicy onClose() {
+		return new FlushPolicy(0, 0);
+	}
+
+	public static FlushPolicy everyRows(int rows) {
+		if (rows < 1) throw new IllegalArgumentException("rows must be >= 1: " + rows);
+		return new FlushPolicy(rows, 0);
+	}
+
+	public static FlushPolicy everyMillis(long millis) {
+		if (millis < 1) throw new IllegalArgumentException("millis must be >= 1: " + millis);
+		return new FlushPolicy(0, millis * 1_000_000L);
+	}
+
+	/** Flushes on whichever of the two limits is reached first. */
+	public static FlushPolicy everyRowsOrMillis(int rows, long millis) {
+		if (rows < 1 || millis < 1) throw new IllegalArgumentException("rows and millis must be >= 1");
+		return new FlushPolicy(rows, millis * 1_000_000L);
+	}
+
+	boolean due(int rowsSinceFlush, long nanosSinceFlush) {
+		return (rows > 0 && rowsSinceFlush >= rows) || (intervalNanos > 0 && nanosSinceFlush >= intervalNanos);
+	}
+
+	boolean timed() {
+		return intervalNanos > 0;
+	}
+}
@@ -0,0 +1,74 @@
+package com.bookingparser.filter;
+
+import com.bookingparser.model.BookingView;
+
+import java.util.ArrayList;
+import java.util.Comparator;
+import java.util.List;
+import java.util.function.Predicate;
+
+/**
+ * Node of a compiled --where expression: its predicate, a rough evaluation cost used to order
+ * siblings cheapest first, and whether it only reads fields available before normalization.
+ */
+final class Clause {
+	final Predicate<BookingView> test;
+	final int cost;
+	final boolean rawOnly;
+	final String text;
+
+	Clause(Predicate<BookingView> test, int cost, boolean rawOnly, String text) {
+		this.test = test;
+		this.cost = cost;
+		this.rawOnly = rawOnly;
+		this.text = text;
+	}
+
+	static Clause and(List<Clause> parts) {
+		return combine(parts, true);
+	}
+
+	static Clause or(List<Clause> parts) {
+		return combine(parts, false);
+	}
+
+	static Clause not(Clause c) {
+		Predicate<BookingView> p = c.test;
+		return new Clause(b -> !p.test(b), c.cost, c.rawOnly, "not " + c.text);
+	}
+
+	/** Orders the operands by cost so the cheap ones short-circuit first; they have no side effects, so order is free. */
+	private static Clause combine(List<Clause> parts, boolean and) {
+		if (parts.size() == 1) return parts.get(0);
+		List<Clause> sorted = new ArrayList<>(parts);
+		sorted.sort(Comparator.comparingInt(c -> c.cost));
+		int cost = 0;
+		boolean rawOnly = true;
+		StringBuilder text = new StringBuilder("(");
+		for (Clause c : sorted) {
+			cost += c.cost;
+			rawOnly &= c.rawOnly;
+			if (text.length() > 1) text.append(and ? " and " : " or ");
+			text.append(c.text);
+		}
+		text.append(')');
+		@SuppressWarnings("unchecked")
+		Predicate<BookingView>[] tests = sorted.stream().map(c -> c.test).toArray(Predicate[]::new);
+		Predicate<BookingView> test;
+		if (tests.length == 2) {
+			Predicate<BookingView> a = tests[0], b = tests[1];
+			test = and ? v -> a.test(v) && b.test(v) : v -> a.test(v) || b.test(v);
+		} else if (and) {
+			test = v -> {
+				for (Predicate<BookingView> t : tests) if (!t.test(v)) return false;
+				return true;
+			};
+		} else {
+			test = v -> {
+				for (Predicate<BookingView> t : tests) if (t.test(v)) return true;
+				return false;
+			};
+		}
+		return new Clause(test, cost, rawOnly, text.toString());
+	}
+}
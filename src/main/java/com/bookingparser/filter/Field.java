@@ -0,0 +1,67 @@
+package com.bookingparser.filter;
+
+import com.bookingparser.model.BookingView;
+
+import java.time.temporal.ChronoUnit;
+import java.util.Locale;
+
+/** Fields a --where expression can reference. */
+enum Field {
+	CITY(Kind.TEXT, true),
+	COUNTRY(Kind.TEXT, true),
+	HOTEL(Kind.TEXT, true),
+	CURRENCY(Kind.TEXT, false),
+	START(Kind.DATE, false),
+	END(Kind.DATE, false),
+	NIGHTS(Kind.NUMBER, false),
+	PRICE(Kind.PRICE, false);
+
+	enum Kind { TEXT, DATE, NUMBER, PRICE }
+
+	final Kind kind;
+	/** Known before dates and prices are parsed, so it can be tested on raw records. */
+	final boolean raw;
+
+	Field(Kind kind, boolean raw) {
+		this.kind = kind;
+		this.raw = raw;
+	}
+
+	static Field named(String name) {
+		switch (name.toLowerCase(Locale.ROOT)) {
+			case "city": return CITY;
+			case "country": return COUNTRY;
+			case "hotel": case "hotel_name": return HOTEL;
+			case "currency": return CURRENCY;
+			case "start": case "start_date": return START;
+			case "end": case "end_date": return END;
+			case "nights": return NIGHTS;
+			case "price": case "total_price": return PRICE;
+			default: return null;
+		}
+	}
+
+	String text(BookingView b) {
+		switch (this) {
+			case CITY: return b.getCity();
+			case COUNTRY: return b.getCountry();
+			case HOTEL: return b.getHotelName();
+			case CURRENCY: return b.getTotalPrice().getCurrency();
+			default: throw new IllegalStateException(this + " is not a text field");
+		}
+	}
+
+	/** Epoch day for dates, night count for NIGHTS. */
+	long number(BookingView b) {
+		switch (this) {
+			case START: return b.getStartDate().toEpochDay();
+			case END: return b.getEndDate().toEpochDay();
+			case NIGHTS: return ChronoUnit.DAYS.between(b.getStartDate(), b.getEndDate());
+			default: throw new IllegalStateException(this + " is not a numeric field");
+		}
+	}
+
+	String displayName() {
+		return name().toLowerCase(Locale.ROOT);
+	}
+}
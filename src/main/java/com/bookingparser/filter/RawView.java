@@ -0,0 +1,34 @@
+package com.bookingparser.filter;
+
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.model.BookingView;
+import com.bookingparser.model.Price;
+import com.bookingparser.normalize.NormalizerUtil;
+
+import java.time.LocalDate;
+
+/**
+ * The fields of a raw record that come out of normalization without parsing dates or prices,
+ * derived the same way {@link NormalizerUtil#normalize} derives them. Only clauses marked raw-only
+ * are evaluated against it.
+ */
+final class RawView implements BookingView {
+	private final BookingRaw raw;
+	private String[] cityCountry;
+
+	RawView(BookingRaw raw) {
+		this.raw = raw;
+	}
+
+	private String[] cityCountry() {
+		if (cityCountry == null) cityCountry = NormalizerUtil.extractCityCountry(raw.getAddressText(), raw.getCityText(), raw.getCountryText());
+		return cityCountry;
+	}
+
+	@Override public String getCity() { return cityCountry()[0]; }
+	@Override public String getCountry() { return cityCountry()[1]; }
+	@Override public String getHotelName() { return raw.getHotelName().trim(); }
+	@Override public LocalDate getStartDate() { throw new UnsupportedOperationException("start date is not parsed yet"); }
+	@Override public LocalDate getEndDate() { throw new UnsupportedOperationException("end date is not parsed yet"); }
+	@Override public Price getTotalPrice() { throw new UnsupportedOperationException("price is not parsed yet"); }
+}
@@ -0,0 +1,72 @@
+package com.bookingparser.filter;
+
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.model.BookingView;
+
+import java.util.ArrayList;
+import java.util.List;
+import java.util.function.Predicate;
+
+/**
+ * A --where expression, parsed once and compiled into nested predicates, for example
+ * {@code country in (France, Spain) and price > 500 EUR and nights >= 3}.
+ * <p>
+ * Operands of every and/or are reordered cheapest first: numeric and date comparisons, then string
+ * equality and set lookups, then substring matches. Top-level conjuncts that only read city,
+ * country or hotel are also available as {@link #rawFilter()}, which runs on raw records before
+ * their dates and prices are parsed. {@link #residual()} is the part that is left after it.
+ * Text comparisons ignore case. A price with a currency only matches bookings in that currency.
+ */
+public final class Where implements Predicate<BookingView> {
+	private static final Clause TRUE = new Clause(b -> true, 0, true, "true");
+
+	private final Clause all;
+	private final Clause raw;
+	private final Clause residual;
+
+	private Where(List<Clause> conjuncts) {
+		List<Clause> rawParts = new ArrayList<>();
+		List<Clause> rest = new ArrayList<>();
+		for (Clause c : conjuncts) (c.rawOnly ? rawParts : rest).add(c);
+		this.all = Clause.and(conjuncts);
+		this.raw = rawParts.isEmpty() ? TRUE : Clause.and(rawParts);
+		this.residual = rest.isEmpty() ? TRUE : Clause.and(rest);
+	}
+
+	/** @throws IllegalArgumentException with the column of the problem when the expression is invalid */
+	public static Where compile(String expression) {
+		return new Where(WhereParser.parse(expression));
+	}
+
+	@Override
+	public boolean test(BookingView b) {
+		return all.test.test(b);
+	}
+
+	/**
+	 * The conjuncts that need no date or price parsing, as a test on raw records. A record whose
+	 * location cannot be derived passes, so normalization reports it as a reject instead.
+	 */
+	public Predicate<BookingRaw> rawFilter() {
+		if (raw == TRUE) return r -> true;
+		Predicate<BookingView> test = raw.test;
+		return r -> {
+			try {
+				return test.test(new RawView(r));
+			} catch (RuntimeException e) {
+				return true;
+			}
+		};
+	}
+
+	/** What is left to test on normalized bookings once {@link #rawFilter()} has passed. */
+	public Predicate<BookingView> residual() {
+		return residual.test;
+	}
+
+	/** The expression in evaluation order. */
+	@Override
+	public String toString() {
+		return all.text;
+	}
+}
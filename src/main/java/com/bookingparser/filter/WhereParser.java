@@ -0,0 +1,309 @@
+package com.bookingparser.filter;
+
+import com.bookingparser.model.BookingView;
+import com.bookingparser.normalize.NormalizerUtil;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.time.format.DateTimeParseException;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Locale;
+import java.util.Set;
+import java.util.function.Predicate;
+
+/**
+ * Recursive-descent parser for --where expressions, compiling each comparison straight into a
+ * {@link Clause}:
+ * <pre>
+ *   expr       := and ("or" and)*
+ *   and        := unary ("and" unary)*
+ *   unary      := "not" unary | "(" expr ")" | comparison
+ *   comparison := field op value | field ["not"] "in" "(" value ("," value)* ")"
+ *   op         := = | != | &lt;&gt; | &lt; | &lt;= | &gt; | &gt;= | ~
+ * </pre>
+ * Values are quoted strings or runs of bare words ("United Kingdom", "500 EUR").
+ */
+final class WhereParser {
+	private enum Type { WORD, STRING, OP, LPAREN, RPAREN, COMMA, EOF }
+
+	private static final class Token {
+		final Type type;
+		final String text;
+		final int pos;
+
+		Token(Type type, String text, int pos) {
+			this.type = type;
+			this.text = text;
+			this.pos = pos;
+		}
+	}
+
+	private final String source;
+	private final List<Token> tokens;
+	private int next;
+
+	private WhereParser(String source) {
+		this.source = source;
+		this.tokens = tokenize(source);
+	}
+
+	/**
+	 * Top-level conjuncts of the expression, each compiled; there is at least one. Keeping them
+	 * apart lets the caller move the ones that only read raw fields ahead of normalization.
+	 */
+	static List<Clause> parse(String expression) {
+		WhereParser p = new WhereParser(expression);
+		List<List<Clause>> disjuncts = p.disjuncts();
+		if (p.peek().type != Type.EOF) throw p.error(p.peek(), "unexpected '" + p.peek().text + "'");
+		return disjuncts.size() == 1 ? disjuncts.get(0) : List.of(or(disjuncts));
+	}
+
+	private static Clause or(List<List<Clause>> disjuncts) {
+		List<Clause> parts = new ArrayList<>(disjuncts.size());
+		for (List<Clause> d : disjuncts) parts.add(Clause.and(d));
+		return Clause.or(parts);
+	}
+
+	private List<List<Clause>> disjuncts() {
+		List<List<Clause>> parts = new ArrayList<>();
+		parts.add(conjuncts());
+		while (keyword("or")) parts.add(conjuncts());
+		return parts;
+	}
+
+	private List<Clause> conjuncts() {
+		List<Clause> parts = new ArrayList<>();
+		parts.add(unary());
+		while (keyword("and")) parts.add(unary());
+		return parts;
+	}
+
+	private Clause unary() {
+		if (keyword("not")) return Clause.not(unary());
+		if (peek().type == Type.LPAREN) {
+			next++;
+			Clause c = or(disjuncts());
+			expect(Type.RPAREN, "')'");
+			return c;
+		}
+		return comparison();
+	}
+
+	private Clause comparison() {
+		Token name = peek();
+		if (name.type != Type.WORD) throw error(name, "expected a field name");
+		Field field = Field.named(name.text);
+		if (field == null) throw error(name, "unknown field '" + name.text + "'");
+		next++;
+		boolean negate = keyword("not");
+		if (negate || keyword("in")) {
+			if (negate && !keyword("in")) throw error(peek(), "expected 'in' after 'not'");
+			Clause c = in(field, name);
+			return negate ? Clause.not(c) : c;
+		}
+		Token op = peek();
+		if (op.type != Type.OP) throw error(op, "expected an operator after '" + name.text + "'");
+		next++;
+		Token at = peek();
+		return compare(field, op.text.equals("==") ? "=" : op.text.equals("<>") ? "!=" : op.text, value(), at);
+	}
+
+	private Clause in(Field field, Token at) {
+		expect(Type.LPAREN, "'(' after 'in'");
+		List<String> values = new ArrayList<>();
+		do {
+			values.add(value());
+		} while (accept(Type.COMMA));
+		expect(Type.RPAREN, "')'");
+		String text = field.displayName() + " in (" + String.join(", ", values) + ")";
+		switch (field.kind) {
+			case TEXT: {
+				Set<String> set = new HashSet<>();
+				for (String v : values) set.add(v.toLowerCase(Locale.ROOT));
+				return new Clause(b -> {
+					String s = field.text(b);
+					return s != null && set.contains(s.toLowerCase(Locale.ROOT));
+				}, 3, field.raw, text);
+			}
+			case DATE:
+			case NUMBER: {
+				long[] sorted = new long[values.size()];
+				for (int i = 0; i < sorted.length; i++) sorted[i] = number(field, values.get(i), at);
+				Arrays.sort(sorted);
+				return new Clause(b -> Arrays.binarySearch(sorted, field.number(b)) >= 0, 2, false, text);
+			}
+			default:
+				throw error(at, "'in' is not supported for " + field.displayName());
+		}
+	}
+
+	private Clause compare(Field field, String op, String value, Token at) {
+		String text = field.displayName() + " " + op + " " + value;
+		switch (field.kind) {
+			case TEXT: {
+				Predicate<BookingView> test;
+				switch (op) {
+					case "=": test = b -> value.equalsIgnoreCase(field.text(b)); break;
+					case "!=": test = b -> !value.equalsIgnoreCase(field.text(b)); break;
+					case "~": {
+						String needle = value.toLowerCase(Locale.ROOT);
+						test = b -> {
+							String s = field.text(b);
+							return s != null && s.toLowerCase(Locale.ROOT).contains(needle);
+						};
+						return new Clause(test, 4, field.raw, text);
+					}
+					default: throw error(at, "'" + op + "' is not supported for " + field.displayName());
+				}
+				return new Clause(test, 2, field.raw, text);
+			}
+			case DATE:
+			case NUMBER: {
+				long v = number(field, value, at);
+				int cost = field == Field.NIGHTS ? 2 : 1;
+				return new Clause(ordered(op, at, b -> Long.compare(field.number(b), v)), cost, false, text);
+			}
+			case PRICE: {
+				if (op.equals("~")) throw error(at, "'~' is not supported for price");
+				NormalizerUtil.ParsedPrice p;
+				try {
+					p = NormalizerUtil.parsePrice(value);
+				} catch (IllegalArgumentException e) {
+					throw error(at, "invalid price '" + value + "'");
+				}
+				BigDecimal amount = p.value;
+				String currency = p.currency;
+				Predicate<BookingView> byValue = ordered(op, at, b -> b.getTotalPrice().getValue().compareTo(amount));
+				if (currency == null) return new Clause(byValue, 1, false, text);
+				// an amount in a given currency only matches prices in that currency; nothing is converted
+				return new Clause(b -> currency.equals(b.getTotalPrice().getCurrency()) && byValue.test(b), 2, false, text);
+			}
+			default:
+				throw new IllegalStateException(field.kind.toString());
+		}
+	}
+
+	private interface Comparison {
+		int compare(BookingView b);
+	}
+
+	private Predicate<BookingView> ordered(String op, Token at, Comparison c) {
+		switch (op) {
+			case "=": return b -> c.compare(b) == 0;
+			case "!=": return b -> c.compare(b) != 0;
+			case "<": return b -> c.compare(b) < 0;
+			case "<=": return b -> c.compare(b) <= 0;
+			case ">": return b -> c.compare(b) > 0;
+			case ">=": return b -> c.compare(b) >= 0;
+			default: throw error(at, "'" + op + "' is not supported here");
+		}
+	}
+
+	private long number(Field field, String value, Token at) {
+		try {
+			return field.kind == Field.Kind.DATE ? LocalDate.parse(value).toEpochDay() : Long.parseLong(value);
+		} catch (DateTimeParseException | NumberFormatException e) {
+			throw error(at, "invalid " + (field.kind == Field.Kind.DATE ? "date (expected YYYY-MM-DD)" : "number") + " '" + value + "'");
+		}
+	}
+
+	/** A quoted string, or bare words up to the next operator, comma, parenthesis, 'and' or 'or'. */
+	private String value() {
+		Token t = peek();
+		if (t.type == Type.STRING) {
+			next++;
+			return t.text;
+		}
+		StringBuilder sb = new StringBuilder();
+		while (peek().type == Type.WORD && !isKeyword(peek(), "and") && !isKeyword(peek(), "or")) {
+			if (sb.length() > 0) sb.append(' ');
+			sb.append(peek().text);
+			next++;
+		}
+		if (sb.length() == 0) throw error(t, "expected a value");
+		return sb.toString();
+	}
+
+	private Token peek() {
+		return tokens.get(next);
+	}
+
+	private boolean accept(Type type) {
+		if (peek().type != type) return false;
+		next++;
+		return true;
+	}
+
+	private void expect(Type type, String what) {
+		if (!accept(type)) throw error(peek(), "expected " + what);
+	}
+
+	private boolean keyword(String word) {
+		if (!isKeyword(peek(), word)) return false;
+		next++;
+		return true;
+	}
+
+	private static boolean isKeyword(Token t, String word) {
+		return t.type == Type.WORD && t.text.equalsIgnoreCase(word);
+	}
+
+	private IllegalArgumentException error(Token at, String message) {
+		return new IllegalArgumentException("Invalid filter at column " + (at.pos + 1) + ": " + message + " in \"" + source + "\"");
+	}
+
+	/** A thousands comma, as in 1,500, belongs to the number; "(1,2)" is still a list. */
+	private static boolean isGroupComma(String s, int i) {
+		if (s.charAt(i) != ',' || i == 0 || !Character.isDigit(s.charAt(i - 1)) || i + 3 >= s.length()) return false;
+		for (int k = 1; k <= 3; k++) {
+			if (!Character.isDigit(s.charAt(i + k))) return false;
+		}
+		return i + 4 == s.length() || !Character.isDigit(s.charAt(i + 4));
+	}
+
+	private static List<Token> tokenize(String s) {
+		List<Token> out = new ArrayList<>();
+		int i = 0, len = s.length();
+		while (i < len) {
+			char c = s.charAt(i);
+			int start = i;
+			if (Character.isWhitespace(c)) {
+				i++;
+			} else if (c == '(') {
+				out.add(new Token(Type.LPAREN, "(", i++));
+			} else if (c == ')') {
+				out.add(new Token(Type.RPAREN, ")", i++));
+			} else if (c == ',') {
+				out.add(new Token(Type.COMMA, ",", i++));
+			} else if (c == '\'' || c == '"') {
+				StringBuilder sb = new StringBuilder();
+				i++;
+				while (true) {
+					if (i >= len) throw new IllegalArgumentException("Invalid filter at column " + (start + 1) + ": unterminated string in \"" + s + "\"");
+					char d = s.charAt(i++);
+					if (d == c) {
+						if (i < len && s.charAt(i) == c) sb.append(s.charAt(i++)); // doubled quote
+						else break;
+					} else {
+						sb.append(d);
+					}
+				}
+				out.add(new Token(Type.STRING, sb.toString(), start));
+			} else if ("=!<>~".indexOf(c) >= 0) {
+				i++;
+				if (i < len && (s.charAt(i) == '=' || (c == '<' && s.charAt(i) == '>'))) i++;
+				String op = s.substring(start, i);
+				if (op.equals("!")) throw new IllegalArgumentException("Invalid filter at column " + (start + 1) + ": expected '!=' in \"" + s + "\"");
+				out.add(new Token(Type.OP, op, start));
+			} else {
+				while (i < len && !Character.isWhitespace(s.charAt(i)) && ("(),'\"=!<>~".indexOf(s.charAt(i)) < 0 || isGroupComma(s, i))) i++;
+				out.add(new Token(Type.WORD, s.substring(start, i), start));
+			}
+		}
+		out.add(new Token(Type.EOF, "end of input", len));
+		return out;
+	}
+}
@@ -2,7 +2,7 @@ package com.bookingparser.model;
 
 import java.time.LocalDate;
 
-public class BookingNormalized {
+public class BookingNormalized implements BookingView {
 	private final String city;
 	private final String country;
 	private final String hotelName;
@@ -27,6 +27,7 @@ public class BookingNormalized {
 	public LocalDate getEndDate() { return endDate; }
 	public Price getTotalPrice() { return totalPrice; }
 
+	@Override
 	public String[] toCsvRow() {
 		return new String[] {
 			city,
@@ -0,0 +1,229 @@
+package com.bookingparser.model;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.HashMap;
+import java.util.Iterator;
+import java.util.List;
+import java.util.Map;
+import java.util.NoSuchElementException;
+import java.util.function.IntPredicate;
+
+/**
+ * Column store for normalized bookings. Dates are epoch days, prices are long minor units (see
+ * {@link MinorPrice}) with a per-row currency id and display scale, and city, country and hotel
+ * are dictionary-encoded ids.
+ * A booking costs a few dozen bytes instead of the 8-10 objects of a {@link BookingNormalized}.
+ * Rows are read through the column accessors or through {@link #row(int)} views.
+ */
+public class BookingTable implements Iterable<BookingView> {
+	private static final int MAX_CURRENCIES = 255;
+
+	/** Append-only string dictionary shared by tables derived from one another. */
+	static final class Dictionary {
+		private final Map<String, Integer> ids = new HashMap<>();
+		private final List<String> values = new ArrayList<>();
+
+		int id(String value) {
+			Integer id = ids.get(value);
+			if (id != null) return id;
+			int next = values.size();
+			values.add(value);
+			ids.put(value, next);
+			return next;
+		}
+
+		String value(int id) {
+			return values.get(id);
+		}
+
+		int size() {
+			return values.size();
+		}
+	}
+
+	private final Dictionary cities, countries, hotels, currencies;
+	private int size;
+	private int[] city, country, hotel;
+	private int[] startDay, endDay;
+	private long[] priceMinor;
+	private byte[] currency;
+	private byte[] priceScale;
+	/** Prices that do not fit minor units (more decimals than the currency has, or beyond long range). */
+	private final Map<Integer, BigDecimal> overflow = new HashMap<>();
+
+	public BookingTable() {
+		this(16);
+	}
+
+	public BookingTable(int initialCapacity) {
+		this(initialCapacity, new Dictionary(), new Dictionary(), new Dictionary(), newCurrencyDictionary());
+	}
+
+	private BookingTable(int initialCapacity, Dictionary cities, Dictionary countries, Dictionary hotels, Dictionary currencies) {
+		int cap = Math.max(initialCapacity, 1);
+		this.cities = cities;
+		this.countries = countries;
+		this.hotels = hotels;
+		this.currencies = currencies;
+		city = new int[cap];
+		country = new int[cap];
+		hotel = new int[cap];
+		startDay = new int[cap];
+		endDay = new int[cap];
+		priceMinor = new long[cap];
+		currency = new byte[cap];
+		priceScale = new byte[cap];
+	}
+
+	private static Dictionary newCurrencyDictionary() {
+		Dictionary d = new Dictionary();
+		d.id(""); // id 0: no currency
+		return d;
+	}
+
+	public static BookingTable from(Iterable<? extends BookingView> bookings) {
+		BookingTable t = new BookingTable();
+		for (BookingView b : bookings) t.add(b);
+		return t;
+	}
+
+	public void add(BookingView b) {
+		add(b.getCity(), b.getCountry(), b.getHotelName(), b.getStartDate(), b.getEndDate(), b.getTotalPrice());
+	}
+
+	public void add(String cityName, String countryName, String hotelName, LocalDate start, LocalDate end, Price price) {
+		ensureCapacity(size + 1);
+		int row = size;
+		city[row] = cities.id(cityName);
+		country[row] = countries.id(countryName);
+		hotel[row] = hotels.id(hotelName);
+		startDay[row] = Math.toIntExact(start.toEpochDay());
+		endDay[row] = Math.toIntExact(end.toEpochDay());
+		String code = price.getCurrency() == null || price.getCurrency().isBlank() ? "" : price.getCurrency();
+		int cur = currencies.id(code);
+		if (cur > MAX_CURRENCIES) throw new IllegalStateException("More than " + MAX_CURRENCIES + " currencies in one table");
+		currency[row] = (byte) cur;
+		MinorPrice mp = MinorPrice.of(price);
+		if (mp.fitsMinor()) {
+			priceMinor[row] = mp.getMinor();
+			priceScale[row] = (byte) mp.getScale();
+		} else {
+			overflow.put(row, price.getValue());
+		}
+		size++;
+	}
+
+	private void ensureCapacity(int needed) {
+		if (needed <= city.length) return;
+		int cap = Math.max(needed, city.length * 2);
+		city = Arrays.copyOf(city, cap);
+		country = Arrays.copyOf(country, cap);
+		hotel = Arrays.copyOf(hotel, cap);
+		startDay = Arrays.copyOf(startDay, cap);
+		endDay = Arrays.copyOf(endDay, cap);
+		priceMinor = Arrays.copyOf(priceMinor, cap);
+		currency = Arrays.copyOf(currency, cap);
+		priceScale = Arrays.copyOf(priceScale, cap);
+	}
+
+	public int size() { return size; }
+
+	public String city(int row) { return cities.value(city[checkRow(row)]); }
+	public String country(int row) { return countries.value(country[checkRow(row)]); }
+	public String hotelName(int row) { return hotels.value(hotel[checkRow(row)]); }
+	public int startEpochDay(int row) { return startDay[checkRow(row)]; }
+	public int endEpochDay(int row) { return endDay[checkRow(row)]; }
+	public LocalDate startDate(int row) { return LocalDate.ofEpochDay(startEpochDay(row)); }
+	public LocalDate endDate(int row) { return LocalDate.ofEpochDay(endEpochDay(row)); }
+
+	/** Currency code of the row's price, or null when the price had none. */
+	public String currency(int row) {
+		String code = currencies.value(currency[checkRow(row)] & 0xff);
+		return code.isEmpty() ? null : code;
+	}
+
+	public MinorPrice minorPrice(int row) {
+		String code = currency(row);
+		BigDecimal big = overflow.get(row);
+		if (big != null) return MinorPrice.of(big, code);
+		return MinorPrice.ofMinor(priceMinor[row], code, priceScale[row]);
+	}
+
+	public Price price(int row) {
+		return minorPrice(row).toPrice();
+	}
+
+	/** The row's price as Price.toString() would print it, formatted from the minor units. */
+	public String priceText(int row) {
+		return minorPrice(row).toString();
+	}
+
+	/** New table holding the rows that match, sharing this table's dictionaries. */
+	public BookingTable filter(IntPredicate rowPredicate) {
+		BookingTable out = new BookingTable(16, cities, countries, hotels, currencies);
+		for (int i = 0; i < size; i++) {
+			if (!rowPredicate.test(i)) continue;
+			out.ensureCapacity(out.size + 1);
+			int r = out.size++;
+			out.city[r] = city[i];
+			out.country[r] = country[i];
+			out.hotel[r] = hotel[i];
+			out.startDay[r] = startDay[i];
+			out.endDay[r] = endDay[i];
+			out.priceMinor[r] = priceMinor[i];
+			out.currency[r] = currency[i];
+			out.priceScale[r] = priceScale[i];
+			BigDecimal big = overflow.get(i);
+			if (big != null) out.overflow.put(r, big);
+		}
+		return out;
+	}
+
+	public BookingView row(int row) {
+		return new Row(this, checkRow(row));
+	}
+
+	@Override
+	public Iterator<BookingView> iterator() {
+		return new Iterator<>() {
+			private int next;
+
+			@Override
+			public boolean hasNext() {
+				return next < size;
+			}
+
+			@Override
+			public BookingView next() {
+				if (next >= size) throw new NoSuchElementException();
+				return new Row(BookingTable.this, next++);
+			}
+		};
+	}
+
+	private int checkRow(int row) {
+		if (row < 0 || row >= size) throw new IndexOutOfBoundsException("row " + row + " of " + size);
+		return row;
+	}
+
+	/** Row view over the columns; getters decode on each call. */
+	private static final class Row implements BookingView {
+		private final BookingTable table;
+		private final int row;
+
+		Row(BookingTable table, int row) {
+			this.table = table;
+			this.row = row;
+		}
+
+		@Override public String getCity() { return table.city(row); }
+		@Override public String getCountry() { return table.country(row); }
+		@Override public String getHotelName() { return table.hotelName(row); }
+		@Override public LocalDate getStartDate() { return table.startDate(row); }
+		@Override public LocalDate getEndDate() { return table.endDate(row); }
+		@Override public Price getTotalPrice() { return table.price(row); }
+	}
+}
\ No newline at end of file
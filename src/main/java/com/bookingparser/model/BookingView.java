@@ -0,0 +1,24 @@
+package com.bookingparser.model;
+
+import java.time.LocalDate;
+
+/** Read-only view of a normalized booking, backed either by an object or by a {@link BookingTable} row. */
+public interface BookingView {
+	String getCity();
+	String getCountry();
+	String getHotelName();
+	LocalDate getStartDate();
+	LocalDate getEndDate();
+	Price getTotalPrice();
+
+	default String[] toCsvRow() {
+		return new String[] {
+			getCity(),
+			getCountry(),
+			getHotelName(),
+			getStartDate().toString(),
+			getEndDate().toString(),
+			getTotalPrice().toString()
+		};
+	}
+}
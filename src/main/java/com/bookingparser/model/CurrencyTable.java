@@ -0,0 +1,73 @@
+package com.bookingparser.model;
+
+import java.util.Arrays;
+import java.util.Currency;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+
+/**
+ * Currency ordinals and minor-unit exponents. Ordinal 0 means "no currency"; ISO 4217 codes get
+ * fixed ordinals in code order, and any other code is appended the first time it is seen.
+ * Exponents come from ISO 4217 (JPY 0, EUR 2, KWD/BHD 3), defaulting to 2 where none is defined.
+ */
+public final class CurrencyTable {
+	private static final int DEFAULT_EXPONENT = 2;
+
+	private static volatile String[] codes;
+	private static volatile byte[] exponents;
+	private static final Map<String, Integer> ORDINALS = new ConcurrentHashMap<>();
+
+	static {
+		String[] iso = Currency.getAvailableCurrencies().stream().map(Currency::getCurrencyCode).sorted().toArray(String[]::new);
+		String[] c = new String[iso.length + 1];
+		byte[] e = new byte[iso.length + 1];
+		c[0] = "";
+		e[0] = DEFAULT_EXPONENT;
+		for (int i = 0; i < iso.length; i++) {
+			int digits = Currency.getInstance(iso[i]).getDefaultFractionDigits();
+			c[i + 1] = iso[i];
+			e[i + 1] = (byte) (digits < 0 ? DEFAULT_EXPONENT : digits);
+			ORDINALS.put(iso[i], i + 1);
+		}
+		codes = c;
+		exponents = e;
+	}
+
+	private CurrencyTable() {}
+
+	/** Ordinal for a currency code; null or blank maps to 0. */
+	public static int ordinal(String code) {
+		if (code == null || code.isBlank()) return 0;
+		Integer ord = ORDINALS.get(code);
+		if (ord != null) return ord;
+		synchronized (ORDINALS) {
+			ord = ORDINALS.get(code);
+			if (ord != null) return ord;
+			int next = codes.length;
+			if (next > Short.MAX_VALUE) throw new IllegalStateException("Too many distinct currency codes");
+			String[] c = Arrays.copyOf(codes, next + 1);
+			byte[] e = Arrays.copyOf(exponents, next + 1);
+			c[next] = code;
+			e[next] = DEFAULT_EXPONENT;
+			exponents = e;
+			codes = c;
+			ORDINALS.put(code, next);
+			return next;
+		}
+	}
+
+	/** Currency code for an ordinal, or null for ordinal 0. */
+	public static String code(int ordinal) {
+		return ordinal == 0 ? null : codes[ordinal];
+	}
+
+	public static int exponent(int ordinal) {
+		return exponents[ordinal];
+	}
+
+	/** Exponent for a code, without registering it: unknown codes, often from untrusted input, get the default. */
+	public static int exponent(String code) {
+		Integer ord = code == null ? null : ORDINALS.get(code);
+		return ord == null ? DEFAULT_EXPONENT : exponents[ord];
+	}
+}
@@ -0,0 +1,161 @@
+package com.bookingparser.model;
+
+import java.math.BigDecimal;
+
+/**
+ * Price held as a long count of minor units (cents, yen, fils) plus a currency ordinal from
+ * {@link CurrencyTable}. The display scale is kept so {@link #toString()} prints exactly what
+ * {@link Price#toString()} prints for the same value. Values with more decimals than the currency
+ * has, or beyond the long range, fall back to a BigDecimal.
+ */
+public final class MinorPrice implements Comparable<MinorPrice> {
+	private static final long[] POW10 = {1L, 10L, 100L, 1_000L, 10_000L, 100_000L, 1_000_000L, 10_000_000L, 100_000_000L};
+
+	private final long minor;
+	private final short currency;
+	private final byte scale;
+	private final BigDecimal big; // non-null only when the value does not fit minor units
+
+	private MinorPrice(long minor, int currency, int scale, BigDecimal big) {
+		this.minor = minor;
+		this.currency = (short) currency;
+		this.scale = (byte) scale;
+		this.big = big;
+	}
+
+	public static MinorPrice of(BigDecimal value, String currency) {
+		return of(value, CurrencyTable.ordinal(currency));
+	}
+
+	public static MinorPrice of(Price price) {
+		return of(price.getValue(), price.getCurrency());
+	}
+
+	/** {@code minor} units of the currency, displayed with {@code scale} decimals (0..exponent). */
+	public static MinorPrice ofMinor(long minor, String currency, int scale) {
+		int ord = CurrencyTable.ordinal(currency);
+		int exp = CurrencyTable.exponent(ord);
+		if (scale < 0 || scale > exp) throw new IllegalArgumentException("scale " + scale + " outside 0.." + exp);
+		if (minor % POW10[exp - scale] != 0) throw new IllegalArgumentException(minor + " minor units need more than " + scale + " decimals");
+		return new MinorPrice(minor, ord, scale, null);
+	}
+
+	private static MinorPrice of(BigDecimal value, int ord) {
+		int exp = CurrencyTable.exponent(ord);
+		int s = value.scale();
+		if (s >= 0 && s <= exp && value.precision() - s <= 18 - exp) {
+			return new MinorPrice(value.movePointRight(exp).longValueExact(), ord, s, null);
+		}
+		return new MinorPrice(0, ord, 0, value);
+	}
+
+	/** False when the value is held as a BigDecimal and {@link #getMinor()} is unavailable. */
+	public boolean fitsMinor() {
+		return big == null;
+	}
+
+	public long getMinor() {
+		if (big != null) throw new ArithmeticException("Price " + big + " does not fit minor units");
+		return minor;
+	}
+
+	public int getScale() {
+		return big != null ? big.scale() : scale;
+	}
+
+	public String getCurrency() {
+		return CurrencyTable.code(currency);
+	}
+
+	public int getCurrencyOrdinal() {
+		return currency;
+	}
+
+	public BigDecimal toBigDecimal() {
+		if (big != null) return big;
+		return BigDecimal.valueOf(minor / POW10[CurrencyTable.exponent(currency) - scale], scale);
+	}
+
+	public Price toPrice() {
+		return new Price(toBigDecimal(), getCurrency());
+	}
+
+	/** Exact sum in the same currency; the result keeps the larger display scale, like BigDecimal.add. */
+	public MinorPrice add(MinorPrice other) {
+		requireSameCurrency(other);
+		if (big == null && other.big == null) {
+			long sum = minor + other.minor;
+			if (((minor ^ sum) & (other.minor ^ sum)) >= 0) {
+				return new MinorPrice(sum, currency, Math.max(scale, other.scale), null);
+			}
+		}
+		return of(toBigDecimal().add(other.toBigDecimal()), currency);
+	}
+
+	/** Compares amounts in the same currency, ignoring display scale. */
+	@Override
+	public int compareTo(MinorPrice other) {
+		requireSameCurrency(other);
+		if (big == null && other.big == null) return Long.compare(minor, other.minor);
+		return toBigDecimal().compareTo(other.toBigDecimal());
+	}
+
+	private void requireSameCurrency(MinorPrice other) {
+		if (currency != other.currency) {
+			throw new IllegalArgumentException("Currency mismatch: " + getCurrency() + " vs " + other.getCurrency());
+		}
+	}
+
+	/** Same text as {@code toPrice().toString()}: plain amount, then a space and the code when there is one. */
+	@Override
+	public String toString() {
+		StringBuilder sb = new StringBuilder(24);
+		appendTo(sb);
+		return sb.toString();
+	}
+
+	public void appendTo(StringBuilder sb) {
+		if (big != null) {
+			sb.append(big.toPlainString());
+		} else {
+			long unscaled = minor / POW10[CurrencyTable.exponent(currency) - scale];
+			appendScaled(sb, unscaled, scale);
+		}
+		if (currency != 0) sb.append(' ').append(CurrencyTable.code(currency));
+	}
+
+	private static void appendScaled(StringBuilder sb, long unscaled, int scale) {
+		if (scale == 0) {
+			sb.append(unscaled);
+			return;
+		}
+		if (unscaled < 0) {
+			sb.append('-');
+			if (unscaled == Long.MIN_VALUE) {
+				sb.append(BigDecimal.valueOf(unscaled, scale).negate().toPlainString());
+				return;
+			}
+			unscaled = -unscaled;
+		}
+		long p = POW10[scale];
+		long frac = unscaled % p;
+		sb.append(unscaled / p).append('.');
+		for (long q = p / 10; q > 1 && q > frac; q /= 10) sb.append('0');
+		sb.append(frac);
+	}
+
+	@Override
+	public boolean equals(Object o) {
+		if (this == o) return true;
+		if (!(o instanceof MinorPrice)) return false;
+		MinorPrice p = (MinorPrice) o;
+		if (currency != p.currency) return false;
+		if (big == null && p.big == null) return minor == p.minor && scale == p.scale;
+		return toBigDecimal().equals(p.toBigDecimal());
+	}
+
+	@Override
+	public int hashCode() {
+		return 31 * currency + toBigDecimal().hashCode();
+	}
+}
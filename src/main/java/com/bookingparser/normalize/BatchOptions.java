@@ -0,0 +1,48 @@
+package com.bookingparser.normalize;
+
+import java.util.concurrent.ExecutorService;
+
+/** Settings for {@link NormalizerUtil#normalizeAll}. */
+public class BatchOptions {
+	private int parallelism = Runtime.getRuntime().availableProcessors();
+	private int chunkSize = 4096;
+	private boolean preserveOrder = true;
+	private ExecutorService executor;
+	private NormalizeCache cache;
+
+	/** Worker threads for a pool created per call; ignored when an executor is supplied. 1 runs inline. */
+	public BatchOptions parallelism(int parallelism) {
+		if (parallelism < 1) throw new IllegalArgumentException("parallelism must be >= 1: " + parallelism);
+		this.parallelism = parallelism;
+		return this;
+	}
+
+	public BatchOptions chunkSize(int chunkSize) {
+		if (chunkSize < 1) throw new IllegalArgumentException("chunkSize must be >= 1: " + chunkSize);
+		this.chunkSize = chunkSize;
+		return this;
+	}
+
+	/** When false, chunks are collected in completion order. */
+	public BatchOptions preserveOrder(boolean preserveOrder) {
+		this.preserveOrder = preserveOrder;
+		return this;
+	}
+
+	/** Shared pool to run on; the caller keeps ownership and must shut it down. */
+	public BatchOptions executor(ExecutorService executor) {
+		this.executor = executor;
+		return this;
+	}
+
+	public BatchOptions cache(NormalizeCache cache) {
+		this.cache = cache;
+		return this;
+	}
+
+	public int getParallelism() { return parallelism; }
+	public int getChunkSize() { return chunkSize; }
+	public boolean isPreserveOrder() { return preserveOrder; }
+	public ExecutorService getExecutor() { return executor; }
+	public NormalizeCache getCache() { return cache; }
+}
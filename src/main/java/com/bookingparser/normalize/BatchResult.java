@@ -0,0 +1,19 @@
+package com.bookingparser.normalize;
+
+import com.bookingparser.model.BookingNormalized;
+
+import java.util.List;
+
+/** Output of {@link NormalizerUtil#normalizeAll}: normalized bookings plus the records that were rejected. */
+public class BatchResult {
+	private final List<BookingNormalized> accepted;
+	private final List<Reject> rejects;
+
+	public BatchResult(List<BookingNormalized> accepted, List<Reject> rejects) {
+		this.accepted = accepted;
+		this.rejects = rejects;
+	}
+
+	public List<BookingNormalized> getAccepted() { return accepted; }
+	public List<Reject> getRejects() { return rejects; }
+}
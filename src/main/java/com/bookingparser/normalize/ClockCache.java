@@ -0,0 +1,91 @@
+package com.bookingparser.normalize;
+
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.LongAdder;
+import java.util.function.Function;
+
+/**
+ * Bounded, thread-safe memo cache with CLOCK (second-chance) eviction. Lookups are lock-free and
+ * only set a reference bit; inserts take a short lock to advance the clock hand.
+ */
+public final class ClockCache<K, V> {
+	private static final class Slot<K, V> {
+		final K key;
+		final V value;
+		volatile boolean referenced;
+
+		Slot(K key, V value) {
+			this.key = key;
+			this.value = value;
+		}
+	}
+
+	private final int capacity;
+	private final ConcurrentHashMap<K, Slot<K, V>> map;
+	private final Slot<K, V>[] ring;
+	private int hand;
+	private final LongAdder hits = new LongAdder();
+	private final LongAdder misses = new LongAdder();
+	private final LongAdder evictions = new LongAdder();
+
+	@SuppressWarnings("unchecked")
+	public ClockCache(int capacity) {
+		if (capacity <= 0) throw new IllegalArgumentException("capacity must be positive: " + capacity);
+		this.capacity = capacity;
+		this.map = new ConcurrentHashMap<>(Math.min(capacity, 1 << 16));
+		this.ring = (Slot<K, V>[]) new Slot[capacity];
+	}
+
+	public V get(K key) {
+		Slot<K, V> s = map.get(key);
+		if (s == null) {
+			misses.increment();
+			return null;
+		}
+		if (!s.referenced) s.referenced = true;
+		hits.increment();
+		return s.value;
+	}
+
+	/** Returns the cached value, computing and caching it on a miss. Exceptions from the loader are not cached. */
+	public V get(K key, Function<? super K, ? extends V> loader) {
+		V v = get(key);
+		if (v != null) return v;
+		v = loader.apply(key);
+		if (v != null) put(key, v);
+		return v;
+	}
+
+	public void put(K key, V value) {
+		synchronized (ring) {
+			if (map.containsKey(key)) return;
+			while (true) {
+				Slot<K, V> cur = ring[hand];
+				if (cur == null) break;
+				if (cur.referenced) {
+					cur.referenced = false;
+					hand = (hand + 1) % capacity;
+					continue;
+				}
+				map.remove(cur.key);
+				evictions.increment();
+				break;
+			}
+			Slot<K, V> slot = new Slot<>(key, value);
+			ring[hand] = slot;
+			map.put(key, slot);
+			hand = (hand + 1) % capacity;
+		}
+	}
+
+	public int capacity() { return capacity; }
+	public int size() { return map.size(); }
+	public long hits() { return hits.sum(); }
+	public long misses() { return misses.sum(); }
+	public long evictions() { return evictions.sum(); }
+
+	@Override
+	public String toString() {
+		return "size=" + size() + "/" + capacity + " hits=" + hits() + " misses=" + misses() + " evictions=" + evictions();
+	}
+}
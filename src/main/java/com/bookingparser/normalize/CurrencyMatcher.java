@@ -0,0 +1,161 @@
+package com.bookingparser.normalize;
+
+import java.util.ArrayDeque;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Currency;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.TreeMap;
+
+/**
+ * Aho-Corasick automaton over every ISO 4217 code plus common CLDR currency symbols. It is built
+ * once and fed one char at a time, so finding currencies costs one scan of the text whatever the
+ * table size. Callers keep the longest accepted match; see {@link #longestAt}.
+ */
+final class CurrencyMatcher {
+	/** CLDR symbols and widespread local spellings. Patterns must not contain digits, '.' or ','. */
+	private static final String[][] SYMBOLS = {
+		{"$", "USD"}, {"US$", "USD"}, {"€", "EUR"}, {"£", "GBP"},
+		{"C$", "CAD"}, {"CA$", "CAD"}, {"A$", "AUD"}, {"AU$", "AUD"}, {"NZ$", "NZD"},
+		{"HK$", "HKD"}, {"S$", "SGD"}, {"SG$", "SGD"}, {"NT$", "TWD"}, {"MX$", "MXN"},
+		{"COL$", "COP"}, {"R$", "BRL"}, {"₺", "TRY"}, {"TL", "TRY"}, {"₽", "RUB"}, {"руб", "RUB"},
+		{"zł", "PLN"}, {"₹", "INR"}, {"¥", "JPY"}, {"JP¥", "JPY"}, {"円", "JPY"}, {"CN¥", "CNY"},
+		{"元", "CNY"}, {"RMB", "CNY"}, {"₩", "KRW"}, {"₪", "ILS"}, {"₫", "VND"}, {"฿", "THB"},
+		{"₱", "PHP"}, {"₴", "UAH"}, {"грн", "UAH"}, {"₦", "NGN"}, {"₵", "GHS"}, {"₸", "KZT"},
+		{"₾", "GEL"}, {"₼", "AZN"}, {"₡", "CRC"}, {"₲", "PYG"}, {"₭", "LAK"}, {"₮", "MNT"},
+		{"৳", "BDT"}, {"Kč", "CZK"}, {"Ft", "HUF"}, {"lei", "RON"}, {"лв", "BGN"}, {"Rp", "IDR"},
+		{"RM", "MYR"}, {"E£", "EGP"}, {"KSh", "KES"}, {"R", "ZAR"}, {"S/", "PEN"},
+	};
+
+	/** Test and no-currency codes that only ever show up as ordinary words. */
+	private static final List<String> EXCLUDED_CODES = List.of("XXX", "XTS");
+
+	static final class Entry {
+		final String text;
+		final String code;
+		final boolean iso;
+
+		Entry(String text, String code, boolean iso) {
+			this.text = text;
+			this.code = code;
+			this.iso = iso;
+		}
+
+		int length() {
+			return text.length();
+		}
+
+		/** True when this entry is a better overall match than {@code other}. */
+		boolean beats(Entry other) {
+			if (other == null || length() > other.length()) return true;
+			return length() == other.length() && iso && !other.iso;
+		}
+	}
+
+	static final class Node {
+		private char[] keys = new char[0];
+		private Node[] children = new Node[0];
+		private Node fail;
+		/** Pattern ending exactly here, if any. */
+		private Entry entry;
+		/** Nearest node on the fail chain that ends a pattern. */
+		private Node output;
+
+		private Node child(char c) {
+			int i = Arrays.binarySearch(keys, c);
+			return i >= 0 ? children[i] : null;
+		}
+	}
+
+	static final CurrencyMatcher DEFAULT = new CurrencyMatcher(defaultEntries());
+
+	private final Node root = new Node();
+
+	CurrencyMatcher(List<Entry> entries) {
+		Map<Node, TreeMap<Character, Node>> building = new HashMap<>();
+		for (Entry e : entries) {
+			Node n = root;
+			for (int i = 0; i < e.text.length(); i++) {
+				n = building.computeIfAbsent(n, k -> new TreeMap<>()).computeIfAbsent(e.text.charAt(i), k -> new Node());
+			}
+			if (n.entry == null || e.iso) n.entry = e;
+		}
+		for (Map.Entry<Node, TreeMap<Character, Node>> b : building.entrySet()) {
+			Node n = b.getKey();
+			TreeMap<Character, Node> kids = b.getValue();
+			n.keys = new char[kids.size()];
+			n.children = new Node[kids.size()];
+			int i = 0;
+			for (Map.Entry<Character, Node> k : kids.entrySet()) {
+				n.keys[i] = k.getKey();
+				n.children[i++] = k.getValue();
+			}
+		}
+		// breadth-first fail links
+		ArrayDeque<Node> queue = new ArrayDeque<>();
+		root.fail = root;
+		for (Node c : root.children) {
+			c.fail = root;
+			queue.add(c);
+		}
+		while (!queue.isEmpty()) {
+			Node n = queue.poll();
+			n.output = n.fail.entry != null ? n.fail : n.fail.output;
+			for (int i = 0; i < n.keys.length; i++) {
+				Node c = n.children[i];
+				c.fail = step(n.fail, n.keys[i]);
+				queue.add(c);
+			}
+		}
+	}
+
+	private static List<Entry> defaultEntries() {
+		List<Entry> entries = new ArrayList<>();
+		for (Currency c : Currency.getAvailableCurrencies()) {
+			String code = c.getCurrencyCode();
+			if (!EXCLUDED_CODES.contains(code)) entries.add(new Entry(code, code, true));
+		}
+		for (String[] s : SYMBOLS) entries.add(new Entry(s[0], s[1], false));
+		return entries;
+	}
+
+	Node root() {
+		return root;
+	}
+
+	Node step(Node n, char c) {
+		while (true) {
+			Node next = n.child(c);
+			if (next != null) return next;
+			if (n == root) return root;
+			n = n.fail;
+		}
+	}
+
+	/**
+	 * Longest pattern ending just before {@code end} in state {@code n} that also sits on word
+	 * boundaries: ISO codes follow regex \b rules, letter-edged symbols must not touch other letters.
+	 */
+	Entry longestAt(Node n, CharSequence s, int end) {
+		for (Node o = n.entry != null ? n : n.output; o != null; o = o.output) {
+			Entry e = o.entry;
+			if (bounded(e, s, end - e.length(), end)) return e;
+		}
+		return null;
+	}
+
+	private static boolean bounded(Entry e, CharSequence s, int start, int end) {
+		char before = start > 0 ? s.charAt(start - 1) : ' ';
+		char after = end < s.length() ? s.charAt(end) : ' ';
+		if (e.iso) return !isWord(before) && !isWord(after);
+		if (Character.isLetter(e.text.charAt(0)) && Character.isLetter(before)) return false;
+		return !(Character.isLetter(e.text.charAt(e.length() - 1)) && Character.isLetter(after));
+	}
+
+	/** Word characters as java.util.regex treats them for \b. */
+	private static boolean isWord(char c) {
+		return c == '_' || Character.isLetterOrDigit(c);
+	}
+}
\ No newline at end of file
@@ -0,0 +1,137 @@
+package com.bookingparser.normalize;
+
+import java.time.LocalDate;
+
+/**
+ * Exception-free date parser. The input is classified once into a shape signature
+ * ('d' digit run, 'a' letter run, ' ' whitespace run, punctuation kept as-is) and
+ * dispatched straight to the parser for that shape. Letter runs are walked through
+ * {@link MonthTrie} while they are scanned, so month words in every locale resolve in
+ * the same left-to-right pass; filler words and abbreviation dots ("janv.", "12.")
+ * are left out of the signature.
+ */
+final class DateShapeParser {
+	private static final int MAX_SYMBOLS = 12;
+	private static final int MAX_TOKENS = 6;
+
+	private DateShapeParser() {}
+
+	/** Returns the parsed date, or null when the text has no recognised shape. */
+	static LocalDate parse(String text) {
+		int len = text.length();
+		char[] shape = new char[MAX_SYMBOLS];
+		int[] tokStart = new int[MAX_TOKENS];
+		int[] tokEnd = new int[MAX_TOKENS];
+		int[] tokMonth = new int[MAX_TOKENS];
+		int symbols = 0, tokens = 0;
+		char lastRun = 0;
+		int i = 0;
+		while (i < len) {
+			char c = text.charAt(i);
+			int j = i + 1;
+			char sym;
+			int month = 0;
+			if (isDigit(c)) {
+				while (j < len && isDigit(text.charAt(j))) j++;
+				sym = 'd';
+			} else if (Character.isLetter(c)) {
+				MonthTrie.Node n = MonthTrie.ROOT.next(MonthTrie.fold(c));
+				while (j < len && Character.isLetter(text.charAt(j))) {
+					if (n != null) n = n.next(MonthTrie.fold(text.charAt(j)));
+					j++;
+				}
+				sym = 'a';
+				if (n != null && n.filler) {
+					lastRun = sym;
+					i = j;
+					continue;
+				}
+				month = MonthTrie.month(n);
+			} else if (Character.isWhitespace(c)) {
+				while (j < len && Character.isWhitespace(text.charAt(j))) j++;
+				sym = ' ';
+			} else if (c == '-' || c == ',' || c == '.' || c == '/') {
+				sym = c;
+			} else {
+				return findIso(text);
+			}
+			char prevRun = lastRun;
+			int start = i;
+			lastRun = sym;
+			i = j;
+			if (sym == ' ' && (symbols == 0 || shape[symbols - 1] == ' ')) continue;
+			if (sym == '.' && (prevRun == 'd' || prevRun == 'a') && (j == len || Character.isWhitespace(text.charAt(j)))) continue;
+			if (symbols == MAX_SYMBOLS) return findIso(text);
+			if (sym == 'd' || sym == 'a') {
+				if (tokens == MAX_TOKENS) return findIso(text);
+				tokStart[tokens] = start;
+				tokEnd[tokens] = j;
+				tokMonth[tokens++] = month;
+			}
+			shape[symbols++] = sym;
+		}
+		if (symbols > 0 && shape[symbols - 1] == ' ') symbols--;
+
+		LocalDate d = null;
+		switch (new String(shape, 0, symbols)) {
+			case "d-d-d":
+				d = isoDate(text, tokStart, tokEnd);
+				break;
+			case "d a d":
+				d = namedMonth(text, tokStart[0], tokEnd[0], tokMonth[1], tokStart[2], tokEnd[2]);
+				break;
+			case "a d, d":
+			case "a d d":
+				d = namedMonth(text, tokStart[1], tokEnd[1], tokMonth[0], tokStart[2], tokEnd[2]);
+				break;
+			default:
+				break;
+		}
+		return d != null ? d : findIso(text);
+	}
+
+	private static LocalDate isoDate(String text, int[] tokStart, int[] tokEnd) {
+		if (tokEnd[0] - tokStart[0] != 4 || tokEnd[1] - tokStart[1] != 2 || tokEnd[2] - tokStart[2] != 2) return null;
+		return strictDate(digits(text, tokStart[0], tokEnd[0]), digits(text, tokStart[1], tokEnd[1]), digits(text, tokStart[2], tokEnd[2]));
+	}
+
+	private static LocalDate namedMonth(String text, int dayStart, int dayEnd, int month, int yearStart, int yearEnd) {
+		int dayLen = dayEnd - dayStart;
+		if (month == 0 || dayLen < 1 || dayLen > 2 || yearEnd - yearStart != 4) return null;
+		int day = digits(text, dayStart, dayEnd);
+		if (day < 1 || day > 31) return null;
+		int year = digits(text, yearStart, yearEnd);
+		// same as ResolverStyle.SMART: a day past the end of the month snaps to its last day
+		int last = LocalDate.of(year, month, 1).lengthOfMonth();
+		return LocalDate.of(year, month, Math.min(day, last));
+	}
+
+	/** Finds the first embedded yyyy-mm-dd, mirroring the old regex fallback. */
+	static LocalDate findIso(String text) {
+		int len = text.length();
+		for (int i = 0; i + 10 <= len; i++) {
+			if (isDigit(text.charAt(i)) && isDigit(text.charAt(i + 1)) && isDigit(text.charAt(i + 2)) && isDigit(text.charAt(i + 3))
+				&& text.charAt(i + 4) == '-' && isDigit(text.charAt(i + 5)) && isDigit(text.charAt(i + 6))
+				&& text.charAt(i + 7) == '-' && isDigit(text.charAt(i + 8)) && isDigit(text.charAt(i + 9))) {
+				return strictDate(digits(text, i, i + 4), digits(text, i + 5, i + 7), digits(text, i + 8, i + 10));
+			}
+		}
+		return null;
+	}
+
+	private static LocalDate strictDate(int year, int month, int day) {
+		if (month < 1 || month > 12 || day < 1) return null;
+		if (day > LocalDate.of(year, month, 1).lengthOfMonth()) return null;
+		return LocalDate.of(year, month, day);
+	}
+
+	private static int digits(String text, int start, int end) {
+		int v = 0;
+		for (int i = start; i < end; i++) v = v * 10 + (text.charAt(i) - '0');
+		return v;
+	}
+
+	private static boolean isDigit(char c) {
+		return c >= '0' && c <= '9';
+	}
+}
\ No newline at end of file
@@ -0,0 +1,23 @@
+package com.bookingparser.normalize;
+
+import java.time.LocalDate;
+import java.util.Locale;
+
+/**
+ * Locale-aware date parser. Month words in any supported locale are resolved through the shared
+ * {@link MonthTrie}, where every word names one month whichever locale it comes from, so locale
+ * detection needs no state and the parser is a set of static functions.
+ */
+public final class LocaleDateParser {
+	private LocaleDateParser() {}
+
+	public static LocalDate parse(String text) {
+		LocalDate d = DateShapeParser.parse(text.trim());
+		if (d == null) throw new IllegalArgumentException("Unable to parse date: " + text);
+		return d;
+	}
+
+	public static Locale[] supportedLocales() {
+		return MonthTrie.LOCALES.clone();
+	}
+}
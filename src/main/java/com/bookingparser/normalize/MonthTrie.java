@@ -0,0 +1,108 @@
+package com.bookingparser.normalize;
+
+import java.util.Arrays;
+import java.util.Locale;
+
+/**
+ * One prebuilt trie of month names, abbreviations and genitive forms for every supported locale.
+ * Keys are case-folded (see {@link #fold(char)}), so a lookup is a single walk over the word.
+ * A word shared by several locales ("mar", "mai", "sept") names the same month in all of them,
+ * which {@link #build} checks, so a word maps to one month and no locale has to be guessed.
+ */
+final class MonthTrie {
+	static final Locale[] LOCALES = {
+		Locale.ENGLISH, Locale.FRENCH, Locale.GERMAN, Locale.forLanguageTag("es"),
+		Locale.forLanguageTag("pl"), Locale.forLanguageTag("tr"), Locale.forLanguageTag("ru")
+	};
+
+	private static final String[][] MONTH_WORDS = {
+		// en
+		{"january jan", "february feb", "march mar", "april apr", "may", "june jun",
+		 "july jul", "august aug", "september sep sept", "october oct", "november nov", "december dec"},
+		// fr
+		{"janvier janv", "février févr fevrier fevr", "mars", "avril avr", "mai", "juin",
+		 "juillet juil", "août aout", "septembre sept", "octobre oct", "novembre nov", "décembre déc decembre dec"},
+		// de
+		{"januar jan jänner jän", "februar feb", "märz mär maerz", "april apr", "mai", "juni jun",
+		 "juli jul", "august aug", "september sep sept", "oktober okt", "november nov", "dezember dez"},
+		// es
+		{"enero ene", "febrero feb", "marzo mar", "abril abr", "mayo may", "junio jun",
+		 "julio jul", "agosto ago", "septiembre setiembre sep sept", "octubre oct", "noviembre nov", "diciembre dic"},
+		// pl
+		{"styczeń stycznia sty", "luty lutego lut", "marzec marca mar", "kwiecień kwietnia kwi", "maj maja", "czerwiec czerwca cze",
+		 "lipiec lipca lip", "sierpień sierpnia sie", "wrzesień września wrz", "październik października paź", "listopad listopada lis", "grudzień grudnia gru"},
+		// tr
+		{"ocak oca", "şubat şub", "mart mar", "nisan nis", "mayıs may", "haziran haz",
+		 "temmuz tem", "ağustos ağu", "eylül eyl", "ekim eki", "kasım kas", "aralık ara"},
+		// ru
+		{"январь января янв", "февраль февраля фев февр", "март марта мар", "апрель апреля апр", "май мая", "июнь июня июн",
+		 "июль июля июл", "август августа авг", "сентябрь сентября сен сент", "октябрь октября окт", "ноябрь ноября ноя нояб", "декабрь декабря дек"},
+	};
+
+	/** Words that may sit between the day, month and year ("12 de enero de 2024", "12 января 2024 г."). */
+	private static final String[] FILLERS = {"of", "de", "del", "г", "года", "r", "roku"};
+
+	static final class Node {
+		private char[] keys = new char[0];
+		private Node[] next = new Node[0];
+		/** Month (1-12) this word names, 0 when it is not a month word. */
+		byte month;
+		boolean filler;
+
+		Node next(char c) {
+			char[] k = keys;
+			for (int i = 0; i < k.length; i++) {
+				if (k[i] == c) return next[i];
+			}
+			return null;
+		}
+
+		private Node child(char c) {
+			Node n = next(c);
+			if (n != null) return n;
+			int len = keys.length;
+			keys = Arrays.copyOf(keys, len + 1);
+			next = Arrays.copyOf(next, len + 1);
+			keys[len] = c;
+			return next[len] = new Node();
+		}
+	}
+
+	static final Node ROOT = build();
+
+	private MonthTrie() {}
+
+	private static Node build() {
+		Node root = new Node();
+		for (int loc = 0; loc < MONTH_WORDS.length; loc++) {
+			for (int m = 0; m < 12; m++) {
+				for (String word : MONTH_WORDS[loc][m].split(" ")) {
+					Node n = insert(root, word);
+					if (n.month != 0 && n.month != m + 1) {
+						throw new IllegalStateException("'" + word + "' names different months in different locales");
+					}
+					n.month = (byte) (m + 1);
+				}
+			}
+		}
+		for (String word : FILLERS) insert(root, word).filler = true;
+		return root;
+	}
+
+	private static Node insert(Node root, String word) {
+		Node n = root;
+		for (int i = 0; i < word.length(); i++) n = n.child(fold(word.charAt(i)));
+		return n;
+	}
+
+	/** Case folding shared by build and lookup; Turkish dotless i folds to plain i. */
+	static char fold(char c) {
+		char l = Character.toLowerCase(c);
+		return l == 'ı' ? 'i' : l;
+	}
+
+	/** Month (1-12) for a terminal node, or 0 when the node is not a month word. */
+	static int month(Node n) {
+		return n == null ? 0 : n.month;
+	}
+}
\ No newline at end of file
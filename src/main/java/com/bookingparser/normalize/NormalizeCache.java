@@ -0,0 +1,54 @@
+package com.bookingparser.normalize;
+
+import java.time.LocalDate;
+
+/**
+ * Optional memoization in front of the field parsers, keyed by the raw text. Dates, prices and
+ * places get their own {@link ClockCache} so each can be sized and inspected separately.
+ * One instance can back any number of normalizing threads.
+ */
+public final class NormalizeCache {
+	private static final char KEY_SEP = '\u0000';
+
+	private final ClockCache<String, LocalDate> dates;
+	private final ClockCache<String, NormalizerUtil.ParsedPrice> prices;
+	private final ClockCache<String, String[]> places;
+
+	public NormalizeCache(int capacity) {
+		this(capacity, capacity, capacity);
+	}
+
+	public NormalizeCache(int dateCapacity, int priceCapacity, int placeCapacity) {
+		this.dates = new ClockCache<>(dateCapacity);
+		this.prices = new ClockCache<>(priceCapacity);
+		this.places = new ClockCache<>(placeCapacity);
+	}
+
+	public LocalDate parseDate(String text) {
+		if (text == null) return NormalizerUtil.parseDate(text);
+		return dates.get(text, NormalizerUtil::parseDate);
+	}
+
+	public NormalizerUtil.ParsedPrice parsePrice(String text) {
+		if (text == null) return NormalizerUtil.parsePrice(text);
+		return prices.get(text, NormalizerUtil::parsePrice);
+	}
+
+	public String[] extractCityCountry(String addressText, String explicitCity, String explicitCountry) {
+		// extractCityCountry treats null and "" alike, so they can share a key
+		String key = (addressText == null ? "" : addressText) + KEY_SEP
+			+ (explicitCity == null ? "" : explicitCity) + KEY_SEP
+			+ (explicitCountry == null ? "" : explicitCountry);
+		String[] cc = places.get(key, k -> NormalizerUtil.extractCityCountry(addressText, explicitCity, explicitCountry));
+		return cc.clone();
+	}
+
+	public ClockCache<String, LocalDate> dates() { return dates; }
+	public ClockCache<String, NormalizerUtil.ParsedPrice> prices() { return prices; }
+	public ClockCache<String, String[]> places() { return places; }
+
+	@Override
+	public String toString() {
+		return "dates[" + dates + "] prices[" + prices + "] places[" + places + "]";
+	}
+}
@@ -0,0 +1,15 @@
+package com.bookingparser.normalize;
+
+/** Raised by {@link NormalizerUtil#normalize} with the name of the field that could not be normalized. */
+public class NormalizeException extends IllegalArgumentException {
+	private final String field;
+
+	public NormalizeException(String field, Throwable cause) {
+		super(field + ": " + cause.getMessage(), cause);
+		this.field = field;
+	}
+
+	public String getField() {
+		return field;
+	}
+}
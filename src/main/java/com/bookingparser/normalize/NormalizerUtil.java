@@ -7,53 +7,12 @@ import com.bookingparser.model.Price;
 import java.math.BigDecimal;
 import java.text.Normalizer;
 import java.time.LocalDate;
-import java.time.format.DateTimeFormatter;
-import java.time.format.DateTimeParseException;
 import java.util.*;
-import java.util.regex.Matcher;
-import java.util.regex.Pattern;
+import java.util.concurrent.*;
 
 public class NormalizerUtil {
-	private static final Map<String, String> SYMBOL_TO_CODE = new LinkedHashMap<>();
-	static {
-		SYMBOL_TO_CODE.put("$", "USD");
-		SYMBOL_TO_CODE.put("€", "EUR");
-		SYMBOL_TO_CODE.put("£", "GBP");
-		SYMBOL_TO_CODE.put("CHF", "CHF");
-		SYMBOL_TO_CODE.put("C$", "CAD");
-		SYMBOL_TO_CODE.put("CA$", "CAD");
-		SYMBOL_TO_CODE.put("A$", "AUD");
-		SYMBOL_TO_CODE.put("AU$", "AUD");
-		SYMBOL_TO_CODE.put("₺", "TRY");
-		SYMBOL_TO_CODE.put("₽", "RUB");
-		SYMBOL_TO_CODE.put("zł", "PLN");
-		SYMBOL_TO_CODE.put("R$", "BRL");
-		SYMBOL_TO_CODE.put("₹", "INR");
-		SYMBOL_TO_CODE.put("¥", "JPY");
-		SYMBOL_TO_CODE.put("₩", "KRW");
-	}
-
-	private static final Pattern PRICE_NUMERIC = Pattern.compile("(?<!\\d)(?:\\d{1,3}(?:[.,]\\d{3})+|\\d+)(?:[.,]\\d{2})?(?!\\d)");
-
-	private static final List<DateTimeFormatter> DATE_FORMATS = Arrays.asList(
-		DateTimeFormatter.ISO_LOCAL_DATE,
-		DateTimeFormatter.ofPattern("d MMM uuuu"),
-		DateTimeFormatter.ofPattern("MMM d, uuuu"),
-		DateTimeFormatter.ofPattern("d MMMM uuuu"),
-		DateTimeFormatter.ofPattern("MMM d uuuu")
-	);
-
 	public static LocalDate parseDate(String text) {
-		String cleaned = text.trim();
-		for (DateTimeFormatter fmt : DATE_FORMATS) {
-			try { return LocalDate.parse(cleaned, fmt); } catch (DateTimeParseException ignored) {}
-		}
-		// try to extract a yyyy-mm-dd inside the string
-		Matcher m = Pattern.compile("(\\d{4}-\\d{2}-\\d{2})").matcher(cleaned);
-		if (m.find()) {
-			return LocalDate.parse(m.group(1));
-		}
-		throw new IllegalArgumentException("Unable to parse date: " + text);
+		return LocaleDateParser.parse(text);
 	}
 
 	public static class ParsedPrice {
@@ -62,40 +21,8 @@ public class NormalizerUtil {
 		public ParsedPrice(BigDecimal v, String c) { this.value = v; this.currency = c; }
 	}
 
-	private static String normalizeNumeric(String raw) {
-		if (raw.contains(",") && raw.contains(".")) {
-			int lastComma = raw.lastIndexOf(',');
-			int lastDot = raw.lastIndexOf('.');
-			if (lastComma > lastDot) {
-				return raw.replace(".", "").replace(',', '.');
-			} else {
-				return raw.replace(",", "");
-			}
-		} else if (raw.contains(",")) {
-			String[] parts = raw.split(",");
-			if (parts[parts.length - 1].length() == 3 && Arrays.stream(parts).allMatch(p -> p.chars().allMatch(Character::isDigit))) {
-				return String.join("", parts);
-			} else {
-				return raw.replace(',', '.');
-			}
-		} else {
-			return raw;
-		}
-	}
-
 	public static ParsedPrice parsePrice(String text) {
-		String cleaned = text == null ? "" : text.trim();
-		String currency = null;
-		Matcher code = Pattern.compile("\\b([A-Z]{3})\\b").matcher(cleaned);
-		if (code.find()) currency = code.group(1);
-		for (Map.Entry<String,String> e : SYMBOL_TO_CODE.entrySet()) {
-			if (cleaned.contains(e.getKey())) { if (currency == null) currency = e.getValue(); break; }
-		}
-		Matcher num = PRICE_NUMERIC.matcher(cleaned);
-		if (!num.find()) throw new IllegalArgumentException("Unable to extract numeric price from: " + text);
-		String normalized = normalizeNumeric(num.group(0));
-		BigDecimal value = new BigDecimal(normalized);
-		return new ParsedPrice(value, currency);
+		return PriceScanner.scan(text);
 	}
 
 	public static String[] extractCityCountry(String addressText, String explicitCity, String explicitCountry) {
@@ -115,10 +42,100 @@ public class NormalizerUtil {
 	}
 
 	public static BookingNormalized normalize(BookingRaw raw) {
-		LocalDate start = parseDate(raw.getStartDateText());
-		LocalDate end = parseDate(raw.getEndDateText());
-		ParsedPrice pp = parsePrice(raw.getTotalPriceText());
-		String[] cc = extractCityCountry(raw.getAddressText(), raw.getCityText(), raw.getCountryText());
-		return new BookingNormalized(cc[0], cc[1], raw.getHotelName().trim(), start, end, new Price(pp.value, pp.currency));
+		return normalize(raw, null);
+	}
+
+	/**
+	 * As {@link #normalize(BookingRaw)}, memoizing field parses in {@code cache} when it is non-null.
+	 * Failures surface as {@link NormalizeException} naming the field.
+	 */
+	public static BookingNormalized normalize(BookingRaw raw, NormalizeCache cache) {
+		String field = "startDate";
+		try {
+			LocalDate start = cache == null ? parseDate(raw.getStartDateText()) : cache.parseDate(raw.getStartDateText());
+			field = "endDate";
+			LocalDate end = cache == null ? parseDate(raw.getEndDateText()) : cache.parseDate(raw.getEndDateText());
+			field = "totalPrice";
+			ParsedPrice pp = cache == null ? parsePrice(raw.getTotalPriceText()) : cache.parsePrice(raw.getTotalPriceText());
+			field = "location";
+			String[] cc = cache == null
+				? extractCityCountry(raw.getAddressText(), raw.getCityText(), raw.getCountryText())
+				: cache.extractCityCountry(raw.getAddressText(), raw.getCityText(), raw.getCountryText());
+			field = "hotelName";
+			String hotel = raw.getHotelName().trim();
+			return new BookingNormalized(cc[0], cc[1], hotel, start, end, new Price(pp.value, pp.currency));
+		} catch (RuntimeException e) {
+			throw new NormalizeException(field, e);
+		}
+	}
+
+	/**
+	 * Normalizes a batch in chunks on a worker pool. Every record ends up either accepted or in the
+	 * rejects list; with {@code preserveOrder} the accepted list matches a serial loop over the input.
+	 */
+	public static BatchResult normalizeAll(Iterable<BookingRaw> raws, BatchOptions options) {
+		List<BookingRaw> input;
+		if (raws instanceof List) {
+			input = (List<BookingRaw>) raws;
+		} else {
+			input = new ArrayList<>();
+			raws.forEach(input::add);
+		}
+		int chunkSize = options.getChunkSize();
+		int chunks = (input.size() + chunkSize - 1) / chunkSize;
+		ExecutorService executor = options.getExecutor();
+		if (chunks <= 1 || (executor == null && options.getParallelism() == 1)) {
+			return normalizeRange(input, 0, input.size(), options);
+		}
+
+		boolean ownPool = executor == null;
+		if (ownPool) executor = new ForkJoinPool(options.getParallelism());
+		try {
+			List<Callable<BatchResult>> tasks = new ArrayList<>(chunks);
+			for (int c = 0; c < chunks; c++) {
+				int from = c * chunkSize, to = Math.min(input.size(), from + chunkSize);
+				tasks.add(() -> normalizeRange(input, from, to, options));
+			}
+			List<BookingNormalized> accepted = new ArrayList<>(input.size());
+			List<Reject> rejects = new ArrayList<>();
+			if (options.isPreserveOrder()) {
+				for (Future<BatchResult> f : executor.invokeAll(tasks)) {
+					BatchResult r = f.get();
+					accepted.addAll(r.getAccepted());
+					rejects.addAll(r.getRejects());
+				}
+			} else {
+				CompletionService<BatchResult> done = new ExecutorCompletionService<>(executor);
+				for (Callable<BatchResult> t : tasks) done.submit(t);
+				for (int c = 0; c < chunks; c++) {
+					BatchResult r = done.take().get();
+					accepted.addAll(r.getAccepted());
+					rejects.addAll(r.getRejects());
+				}
+			}
+			return new BatchResult(accepted, rejects);
+		} catch (InterruptedException e) {
+			Thread.currentThread().interrupt();
+			throw new IllegalStateException("Interrupted during batch normalization", e);
+		} catch (ExecutionException e) {
+			throw new IllegalStateException("Batch normalization failed", e.getCause());
+		} finally {
+			if (ownPool) executor.shutdown();
+		}
+	}
+
+	private static BatchResult normalizeRange(List<BookingRaw> input, int from, int to, BatchOptions options) {
+		List<BookingNormalized> accepted = new ArrayList<>(to - from);
+		List<Reject> rejects = new ArrayList<>();
+		for (int i = from; i < to; i++) {
+			BookingRaw raw = input.get(i);
+			try {
+				accepted.add(normalize(raw, options.getCache()));
+			} catch (NormalizeException e) {
+				Throwable cause = e.getCause();
+				rejects.add(new Reject(i, raw, e.getField(), cause.getMessage() != null ? cause.getMessage() : cause.toString()));
+			}
+		}
+		return new BatchResult(accepted, rejects);
 	}
 }
\ No newline at end of file
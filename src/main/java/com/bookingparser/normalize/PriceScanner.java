@@ -0,0 +1,129 @@
+package com.bookingparser.normalize;
+
+import java.math.BigDecimal;
+
+/**
+ * Single pass over a price string that picks up the currency and the numeric amount together,
+ * building the BigDecimal straight from the digits. Currency codes and symbols are matched by
+ * {@link CurrencyMatcher} as the chars go by, and the longest match wins, so "C$ 120" is CAD
+ * rather than USD. The amount is the first digit run with optional 3-digit groups and a 2-digit
+ * decimal part.
+ */
+final class PriceScanner {
+	private static final int MAX_LONG_DIGITS = 18;
+
+	private PriceScanner() {}
+
+	static NormalizerUtil.ParsedPrice scan(String text) {
+		return scan(text, CurrencyMatcher.DEFAULT);
+	}
+
+	static NormalizerUtil.ParsedPrice scan(String text, CurrencyMatcher currencies) {
+		String s = text == null ? "" : text;
+		int len = s.length();
+		CurrencyMatcher.Node state = currencies.root();
+		CurrencyMatcher.Entry best = null;
+		int numStart = -1, numEnd = -1;
+		int i = 0;
+		while (i < len) {
+			char c = s.charAt(i);
+			if (numStart < 0 && isDigit(c)) {
+				// a digit here always starts a run: the previous char was scanned and was not a digit.
+				// No currency pattern contains digits or separators, so the automaton restarts after it.
+				numStart = i;
+				numEnd = numberEnd(s, i);
+				state = currencies.root();
+				i = numEnd;
+				continue;
+			}
+			state = currencies.step(state, c);
+			i++;
+			CurrencyMatcher.Entry e = currencies.longestAt(state, s, i);
+			if (e != null && e.beats(best)) best = e;
+		}
+		if (numStart < 0) throw new IllegalArgumentException("Unable to extract numeric price from: " + text);
+		return new NormalizerUtil.ParsedPrice(toDecimal(s, numStart, numEnd), best == null ? null : best.code);
+	}
+
+	/** End of the amount starting at p, per (?:\d{1,3}(?:[.,]\d{3})+|\d+)(?:[.,]\d{2})?(?!\d). */
+	private static int numberEnd(String s, int p) {
+		int len = s.length();
+		int runEnd = p;
+		while (runEnd < len && isDigit(s.charAt(runEnd))) runEnd++;
+		if (runEnd - p <= 3) {
+			int groups = 0;
+			for (int q = runEnd; q + 3 < len && isSep(s.charAt(q)) && isDigit(s.charAt(q + 1)) && isDigit(s.charAt(q + 2)) && isDigit(s.charAt(q + 3)); q += 4) {
+				groups++;
+			}
+			for (int g = groups; g >= 1; g--) {
+				int e = runEnd + 4 * g;
+				int dec = decimalEnd(s, e);
+				if (dec > 0) return dec;
+				if (e == len || !isDigit(s.charAt(e))) return e;
+			}
+		}
+		int dec = decimalEnd(s, runEnd);
+		return dec > 0 ? dec : runEnd;
+	}
+
+	private static int decimalEnd(String s, int q) {
+		int len = s.length();
+		if (q + 2 < len && isSep(s.charAt(q)) && isDigit(s.charAt(q + 1)) && isDigit(s.charAt(q + 2))
+			&& (q + 3 == len || !isDigit(s.charAt(q + 3)))) {
+			return q + 3;
+		}
+		return -1;
+	}
+
+	/**
+	 * Same separator rules as before: with both separators the later one is the decimal point;
+	 * commas alone are thousands separators when the last group has three digits.
+	 */
+	private static BigDecimal toDecimal(String s, int start, int end) {
+		int lastComma = -1, lastDot = -1, commas = 0, dots = 0, digits = 0;
+		for (int i = start; i < end; i++) {
+			char c = s.charAt(i);
+			if (c == ',') { lastComma = i; commas++; }
+			else if (c == '.') { lastDot = i; dots++; }
+			else digits++;
+		}
+		char point;
+		if (commas > 0 && dots > 0) point = lastComma > lastDot ? ',' : '.';
+		else if (commas > 0) point = end - lastComma - 1 == 3 ? 0 : ',';
+		else point = dots > 0 ? '.' : 0;
+		int points = point == ',' ? commas : point == '.' ? dots : 0;
+		if (points > 1) throw new NumberFormatException("Invalid price amount: " + s.substring(start, end));
+
+		if (digits > MAX_LONG_DIGITS) {
+			char[] buf = new char[digits + points];
+			int n = 0;
+			for (int i = start; i < end; i++) {
+				char c = s.charAt(i);
+				if (isDigit(c)) buf[n++] = c;
+				else if (c == point) buf[n++] = '.';
+			}
+			return new BigDecimal(buf, 0, n);
+		}
+		long unscaled = 0;
+		int scale = 0;
+		boolean fraction = false;
+		for (int i = start; i < end; i++) {
+			char c = s.charAt(i);
+			if (isDigit(c)) {
+				unscaled = unscaled * 10 + (c - '0');
+				if (fraction) scale++;
+			} else if (c == point) {
+				fraction = true;
+			}
+		}
+		return BigDecimal.valueOf(unscaled, scale);
+	}
+
+	private static boolean isDigit(char c) {
+		return c >= '0' && c <= '9';
+	}
+
+	private static boolean isSep(char c) {
+		return c == '.' || c == ',';
+	}
+}
\ No newline at end of file
@@ -0,0 +1,28 @@
+package com.bookingparser.normalize;
+
+import com.bookingparser.model.BookingRaw;
+
+/** A record that failed normalization: its position in the input, the offending field and why. */
+public class Reject {
+	private final long index;
+	private final BookingRaw raw;
+	private final String field;
+	private final String reason;
+
+	public Reject(long index, BookingRaw raw, String field, String reason) {
+		this.index = index;
+		this.raw = raw;
+		this.field = field;
+		this.reason = reason;
+	}
+
+	public long getIndex() { return index; }
+	public BookingRaw getRaw() { return raw; }
+	public String getField() { return field; }
+	public String getReason() { return reason; }
+
+	@Override
+	public String toString() {
+		return "#" + index + " " + field + ": " + reason;
+	}
+}
@@ -0,0 +1,224 @@
+package com.bookingparser.pipeline;
+
+import com.bookingparser.export.CsvSink;
+import com.bookingparser.model.BookingNormalized;
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.normalize.NormalizeException;
+import com.bookingparser.normalize.NormalizerUtil;
+import com.bookingparser.normalize.Reject;
+import com.bookingparser.source.DateRange;
+import com.bookingparser.source.ReservationSource;
+
+import java.io.IOException;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Map;
+import java.util.concurrent.ArrayBlockingQueue;
+import java.util.concurrent.BlockingQueue;
+import java.util.concurrent.Callable;
+import java.util.concurrent.CompletionService;
+import java.util.concurrent.ExecutionException;
+import java.util.concurrent.ExecutorCompletionService;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Semaphore;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.function.Consumer;
+import java.util.function.Predicate;
+
+/**
+ * Runs fetch → normalize → filter → write as concurrent stages joined by bounded queues, so
+ * normalization and CSV output overlap with slow page fetching and a slow stage holds back the
+ * ones before it instead of letting records pile up. Each record carries its source sequence
+ * number; records that are rejected or filtered out travel on as empty slots so the writer can
+ * keep source order. End of input is signalled with one poison pill per downstream worker.
+ * <p>
+ * At most {@link PipelineOptions#queueCapacity} records are in flight between fetch and write,
+ * counting the ones the writer holds back behind a slow earlier record, so one record stuck in
+ * normalization cannot make the writer buffer the rest of the source.
+ */
+public class Pipeline {
+	/** A record, its position in the source and the raw record it came from; {@code value} is null for a dropped record. */
+	private static final class Item<T> {
+		final long seq;
+		final T value;
+		final BookingRaw raw;
+
+		Item(long seq, T value, BookingRaw raw) {
+			this.seq = seq;
+			this.value = value;
+			this.raw = raw;
+		}
+	}
+
+	private static final Item<?> END = new Item<>(-1, null, null);
+
+	private final PipelineOptions options;
+
+	public Pipeline(PipelineOptions options) {
+		this.options = options;
+	}
+
+	public PipelineResult run(ReservationSource source, Predicate<? super BookingNormalized> filter, CsvSink sink)
+			throws IOException, InterruptedException {
+		return run(source, DateRange.ALL, filter, sink);
+	}
+
+	/**
+	 * Streams every record from {@code source} through normalization and {@code filter} into
+	 * {@code sink}. {@code range} is passed down to the source so it can skip out-of-range records
+	 * before fetching them. The first stage failure cancels the others and is rethrown here.
+	 */
+	public PipelineResult run(ReservationSource source, DateRange range, Predicate<? super BookingNormalized> filter, CsvSink sink)
+			throws IOException, InterruptedException {
+		int capacity = options.getQueueCapacity();
+		int normalizers = options.getNormalizeThreads();
+		int filters = options.getFilterThreads();
+		BlockingQueue<Item<BookingRaw>> raws = new ArrayBlockingQueue<>(capacity);
+		BlockingQueue<Item<BookingNormalized>> normalized = new ArrayBlockingQueue<>(capacity);
+		BlockingQueue<Item<BookingNormalized>> accepted = new ArrayBlockingQueue<>(capacity);
+
+		long start = System.nanoTime();
+		StageStats fetchStats = new StageStats("fetch", 1, 0, start);
+		StageStats normalizeStats = new StageStats("normalize", normalizers, capacity, start);
+		StageStats filterStats = new StageStats("filter", filters, capacity, start);
+		StageStats writeStats = new StageStats("write", 1, capacity, start);
+		List<Reject> rejects = Collections.synchronizedList(new ArrayList<>());
+		AtomicInteger normalizersLeft = new AtomicInteger(normalizers);
+		AtomicInteger filtersLeft = new AtomicInteger(filters);
+		Semaphore inFlight = new Semaphore(capacity);
+
+		List<Callable<Void>> tasks = new ArrayList<>();
+		tasks.add(() -> {
+			long[] seq = {0};
+			source.fetch(range, raw -> {
+				fetchStats.received();
+				// released by the writer once this record is written or dropped
+				inFlight.acquire();
+				put(raws, new Item<>(seq[0]++, raw, raw), fetchStats);
+			});
+			endOf(raws, normalizers);
+			fetchStats.finished();
+			return null;
+		});
+		for (int t = 0; t < normalizers; t++) {
+			tasks.add(() -> {
+				Predicate<? super BookingRaw> rawFilter = options.getRawFilter();
+				for (Item<BookingRaw> item; (item = take(raws, normalizeStats)) != END; ) {
+					BookingNormalized b = null;
+					if (rawFilter != null && !rawFilter.test(item.value)) {
+						put(normalized, new Item<>(item.seq, null, null), normalizeStats);
+						continue;
+					}
+					try {
+						b = NormalizerUtil.normalize(item.value, options.getCache());
+					} catch (NormalizeException e) {
+						Throwable cause = e.getCause();
+						rejects.add(new Reject(item.seq, item.value, e.getField(), cause.getMessage() != null ? cause.getMessage() : cause.toString()));
+					}
+					put(normalized, new Item<>(item.seq, b, item.raw), normalizeStats);
+				}
+				if (normalizersLeft.decrementAndGet() == 0) endOf(normalized, filters);
+				normalizeStats.finished();
+				return null;
+			});
+		}
+		for (int t = 0; t < filters; t++) {
+			tasks.add(() -> {
+				for (Item<BookingNormalized> item; (item = take(normalized, filterStats)) != END; ) {
+					boolean keep = item.value != null && filter.test(item.value);
+					put(accepted, keep ? item : new Item<>(item.seq, null, null), filterStats);
+				}
+				if (filtersLeft.decrementAndGet() == 0) endOf(accepted, 1);
+				filterStats.finished();
+				return null;
+			});
+		}
+		tasks.add(() -> {
+			write(accepted, sink, inFlight, writeStats);
+			writeStats.finished();
+			return null;
+		});
+
+		runAll(tasks);
+		return new PipelineResult(sink.rowsWritten(), new ArrayList<>(rejects), List.of(fetchStats, normalizeStats, filterStats, writeStats));
+	}
+
+	private void write(BlockingQueue<Item<BookingNormalized>> in, CsvSink sink, Semaphore inFlight, StageStats stats)
+			throws IOException, InterruptedException {
+		// out of order arrivals wait here; they keep their permits, so there are fewer than queueCapacity
+		Map<Long, Item<BookingNormalized>> pending = new HashMap<>();
+		long next = 0;
+		for (Item<BookingNormalized> item; (item = take(in, stats)) != END; ) {
+			if (!options.isPreserveOrder()) {
+				if (item.value != null) written(sink, item, stats);
+				inFlight.release();
+				continue;
+			}
+			if (item.seq != next) {
+				pending.put(item.seq, item);
+				continue;
+			}
+			do {
+				if (item.value != null) written(sink, item, stats);
+				inFlight.release();
+				next++;
+			} while ((item = pending.remove(next)) != null);
+		}
+		sink.flush();
+	}
+
+	private void written(CsvSink sink, Item<BookingNormalized> item, StageStats stats) throws IOException {
+		sink.write(item.value);
+		Consumer<? super BookingRaw> onWritten = options.getOnWritten();
+		if (onWritten != null) onWritten.accept(item.raw);
+		stats.put(true, 0);
+	}
+
+	private void runAll(List<Callable<Void>> tasks) throws IOException, InterruptedException {
+		AtomicInteger ids = new AtomicInteger();
+		ExecutorService pool = Executors.newFixedThreadPool(tasks.size(), r -> {
+			Thread t = new Thread(r, "pipeline-" + ids.incrementAndGet());
+			t.setDaemon(true);
+			return t;
+		});
+		try {
+			CompletionService<Void> done = new ExecutorCompletionService<>(pool);
+			for (Callable<Void> task : tasks) done.submit(task);
+			for (int i = 0; i < tasks.size(); i++) {
+				try {
+					done.take().get();
+				} catch (ExecutionException e) {
+					Throwable cause = e.getCause();
+					if (cause instanceof IOException) throw (IOException) cause;
+					if (cause instanceof RuntimeException) throw (RuntimeException) cause;
+					if (cause instanceof Error) throw (Error) cause;
+					throw new IllegalStateException("Pipeline stage failed", cause);
+				}
+			}
+		} finally {
+			pool.shutdownNow();
+		}
+	}
+
+	@SuppressWarnings("unchecked")
+	private static <T> void endOf(BlockingQueue<Item<T>> queue, int consumers) throws InterruptedException {
+		for (int i = 0; i < consumers; i++) queue.put((Item<T>) END);
+	}
+
+	private static <T> Item<T> take(BlockingQueue<Item<T>> queue, StageStats stats) throws InterruptedException {
+		int depth = queue.size();
+		long t0 = System.nanoTime();
+		Item<T> item = queue.take();
+		if (item != END) stats.took(item.value != null, depth, System.nanoTime() - t0);
+		return item;
+	}
+
+	private static <T> void put(BlockingQueue<Item<T>> queue, Item<T> item, StageStats stats) throws InterruptedException {
+		long t0 = System.nanoTime();
+		queue.put(item);
+		stats.put(item.value != null, System.nanoTime() - t0);
+	}
+}
@@ -0,0 +1,68 @@
+package com.bookingparser.pipeline;
+
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.normalize.NormalizeCache;
+
+import java.util.function.Consumer;
+import java.util.function.Predicate;
+
+/** Settings for {@link Pipeline}. Fetch and write always run on one thread each. */
+public class PipelineOptions {
+	private int normalizeThreads = Runtime.getRuntime().availableProcessors();
+	private int filterThreads = 1;
+	private int queueCapacity = 1024;
+	private boolean preserveOrder = true;
+	private NormalizeCache cache;
+	private Predicate<? super BookingRaw> rawFilter;
+	private Consumer<? super BookingRaw> onWritten;
+
+	public PipelineOptions normalizeThreads(int normalizeThreads) {
+		if (normalizeThreads < 1) throw new IllegalArgumentException("normalizeThreads must be >= 1: " + normalizeThreads);
+		this.normalizeThreads = normalizeThreads;
+		return this;
+	}
+
+	public PipelineOptions filterThreads(int filterThreads) {
+		if (filterThreads < 1) throw new IllegalArgumentException("filterThreads must be >= 1: " + filterThreads);
+		this.filterThreads = filterThreads;
+		return this;
+	}
+
+	/** Capacity of each queue between stages, and the most records in flight from fetch to write; a full queue blocks the stage feeding it. */
+	public PipelineOptions queueCapacity(int queueCapacity) {
+		if (queueCapacity < 1) throw new IllegalArgumentException("queueCapacity must be >= 1: " + queueCapacity);
+		this.queueCapacity = queueCapacity;
+		return this;
+	}
+
+	/** When false, rows are written in completion order instead of source order. */
+	public PipelineOptions preserveOrder(boolean preserveOrder) {
+		this.preserveOrder = preserveOrder;
+		return this;
+	}
+
+	public PipelineOptions cache(NormalizeCache cache) {
+		this.cache = cache;
+		return this;
+	}
+
+	/** Test run in the normalize stage before a record is normalized; records failing it are dropped unparsed. */
+	public PipelineOptions rawFilter(Predicate<? super BookingRaw> rawFilter) {
+		this.rawFilter = rawFilter;
+		return this;
+	}
+
+	/** Called on the write stage with the raw record behind each row once the sink has taken it, e.g. {@link com.bookingparser.source.ExportIndex#record}. */
+	public PipelineOptions onWritten(Consumer<? super BookingRaw> onWritten) {
+		this.onWritten = onWritten;
+		return this;
+	}
+
+	public int getNormalizeThreads() { return normalizeThreads; }
+	public int getFilterThreads() { return filterThreads; }
+	public int getQueueCapacity() { return queueCapacity; }
+	public boolean isPreserveOrder() { return preserveOrder; }
+	public NormalizeCache getCache() { return cache; }
+	public Predicate<? super BookingRaw> getRawFilter() { return rawFilter; }
+	public Consumer<? super BookingRaw> getOnWritten() { return onWritten; }
+}
@@ -0,0 +1,22 @@
+package com.bookingparser.pipeline;
+
+import com.bookingparser.normalize.Reject;
+
+import java.util.List;
+
+/** Output of {@link Pipeline#run}: rows written, rejected records and per-stage counters in stage order. */
+public class PipelineResult {
+	private final long written;
+	private final List<Reject> rejects;
+	private final List<StageStats> stages;
+
+	public PipelineResult(long written, List<Reject> rejects, List<StageStats> stages) {
+		this.written = written;
+		this.rejects = rejects;
+		this.stages = stages;
+	}
+
+	public long getWritten() { return written; }
+	public List<Reject> getRejects() { return rejects; }
+	public List<StageStats> getStages() { return stages; }
+}
@@ -0,0 +1,85 @@
+package com.bookingparser.pipeline;
+
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.concurrent.atomic.LongAdder;
+
+/**
+ * Counters for one pipeline stage. Queue depth is sampled on every take from the stage's input
+ * queue; starved is time spent waiting for input, blocked is time spent waiting for room downstream.
+ */
+public class StageStats {
+	private final String name;
+	private final int threads;
+	private final int queueCapacity;
+	private final LongAdder in = new LongAdder();
+	private final LongAdder out = new LongAdder();
+	private final LongAdder depthSum = new LongAdder();
+	private final LongAdder depthSamples = new LongAdder();
+	private final AtomicLong maxDepth = new AtomicLong();
+	private final LongAdder starvedNanos = new LongAdder();
+	private final LongAdder blockedNanos = new LongAdder();
+	private final long startNanos;
+	private final AtomicLong endNanos = new AtomicLong();
+
+	StageStats(String name, int threads, int queueCapacity, long startNanos) {
+		this.name = name;
+		this.threads = threads;
+		this.queueCapacity = queueCapacity;
+		this.startNanos = startNanos;
+	}
+
+	void took(boolean record, int depth, long waitNanos) {
+		if (record) in.increment();
+		depthSum.add(depth);
+		depthSamples.increment();
+		maxDepth.accumulateAndGet(depth, Math::max);
+		starvedNanos.add(waitNanos);
+	}
+
+	void received() {
+		in.increment();
+	}
+
+	/** Counts a record handed downstream; dropped records only add their wait. */
+	void put(boolean record, long waitNanos) {
+		if (record) out.increment();
+		blockedNanos.add(waitNanos);
+	}
+
+	void finished() {
+		endNanos.accumulateAndGet(System.nanoTime(), Math::max);
+	}
+
+	public String getName() { return name; }
+	public int getThreads() { return threads; }
+	/** Capacity of the input queue, 0 for the source stage. */
+	public int getQueueCapacity() { return queueCapacity; }
+	public long getIn() { return in.sum(); }
+	public long getOut() { return out.sum(); }
+	public long getMaxQueueDepth() { return maxDepth.get(); }
+	public long getStarvedNanos() { return starvedNanos.sum(); }
+	public long getBlockedNanos() { return blockedNanos.sum(); }
+
+	public double getAverageQueueDepth() {
+		long samples = depthSamples.sum();
+		return samples == 0 ? 0 : (double) depthSum.sum() / samples;
+	}
+
+	public long getElapsedNanos() {
+		long end = endNanos.get();
+		return (end == 0 ? System.nanoTime() : end) - startNanos;
+	}
+
+	/** Records out per second of stage wall time. */
+	public double getThroughput() {
+		long elapsed = getElapsedNanos();
+		return elapsed <= 0 ? 0 : getOut() / (elapsed / 1e9);
+	}
+
+	@Override
+	public String toString() {
+		String queue = queueCapacity == 0 ? "-" : String.format("avg %.1f max %d/%d", getAverageQueueDepth(), getMaxQueueDepth(), queueCapacity);
+		return String.format("%-9s x%-2d %,9d in %,9d out %,10.1f/s  queue %-22s starved %.1fs blocked %.1fs",
+			name, threads, getIn(), getOut(), getThroughput(), queue, getStarvedNanos() / 1e9, getBlockedNanos() / 1e9);
+	}
+}
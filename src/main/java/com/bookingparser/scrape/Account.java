@@ -0,0 +1,28 @@
+package com.bookingparser.scrape;
+
+import java.nio.file.Path;
+
+/** A Booking.com login and where its export goes. Credentials never appear in {@link #toString()}. */
+public class Account {
+	private final String name;
+	private final String email;
+	private final String password;
+	private final Path output;
+
+	public Account(String name, String email, String password, Path output) {
+		this.name = name;
+		this.email = email;
+		this.password = password;
+		this.output = output;
+	}
+
+	public String getName() { return name; }
+	public String getEmail() { return email; }
+	public String getPassword() { return password; }
+	public Path getOutput() { return output; }
+
+	@Override
+	public String toString() {
+		return "account " + name;
+	}
+}
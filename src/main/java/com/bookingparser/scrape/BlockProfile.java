@@ -0,0 +1,98 @@
+package com.bookingparser.scrape;
+
+import com.microsoft.playwright.BrowserContext;
+import com.microsoft.playwright.Request;
+
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.LinkedHashSet;
+import java.util.List;
+import java.util.Locale;
+import java.util.Set;
+import java.util.regex.Pattern;
+
+/**
+ * Which requests a scraping context refuses to send: whole resource types (images, fonts, media)
+ * and URLs matching any of a list of patterns (analytics, ads, maps). None of them carry booking
+ * fields, and aborting them before they leave the browser saves their round trips and bytes.
+ * Documents, scripts, XHR and fetch are only blocked when a URL pattern says so, because the
+ * reservation data arrives through them. Instances are immutable.
+ */
+public final class BlockProfile {
+	/** Blocks nothing and installs no route, so Playwright's HTTP cache stays on. */
+	public static final BlockProfile NONE = new BlockProfile(Set.of(), List.of());
+
+	private static final Set<String> DEFAULT_TYPES = Set.of("image", "media", "font");
+	private static final Set<String> NEVER_BY_TYPE = Set.of("document", "script", "xhr", "fetch");
+	private static final List<String> DEFAULT_URLS = List.of(
+		"google-analytics\\.com", "googletagmanager\\.com", "doubleclick\\.net", "googlesyndication\\.com",
+		"googleadservices\\.com", "connect\\.facebook\\.net", "facebook\\.com/tr", "hotjar\\.com", "bat\\.bing\\.com",
+		"criteo\\.(com|net)", "maps\\.googleapis\\.com", "maps\\.gstatic\\.com", "/maps/(api|vt)/", "mapbox\\.com");
+
+	private final Set<String> types;
+	private final List<Pattern> urls;
+
+	private BlockProfile(Set<String> types, List<Pattern> urls) {
+		this.types = types;
+		this.urls = urls;
+	}
+
+	/** Images, media, fonts and the usual analytics, ad and map hosts. */
+	public static BlockProfile defaults() {
+		List<Pattern> urls = new ArrayList<>();
+		for (String u : DEFAULT_URLS) urls.add(Pattern.compile(u, Pattern.CASE_INSENSITIVE));
+		return new BlockProfile(DEFAULT_TYPES, Collections.unmodifiableList(urls));
+	}
+
+	/** Same URL patterns, blocking the comma-separated resource types instead; "none" blocks no type. */
+	public BlockProfile types(String csv) {
+		Set<String> out = new LinkedHashSet<>();
+		for (String t : csv.split(",")) {
+			String type = t.trim().toLowerCase(Locale.ROOT);
+			if (type.isEmpty() || type.equals("none")) continue;
+			if (NEVER_BY_TYPE.contains(type)) throw new IllegalArgumentException("Resource type " + type + " carries reservation data and cannot be blocked");
+			out.add(type);
+		}
+		return new BlockProfile(Collections.unmodifiableSet(out), urls);
+	}
+
+	/** This profile plus one more URL pattern (a regular expression, found anywhere in the URL). */
+	public BlockProfile url(String regex) {
+		List<Pattern> out = new ArrayList<>(urls);
+		out.add(Pattern.compile(regex, Pattern.CASE_INSENSITIVE));
+		return new BlockProfile(types, Collections.unmodifiableList(out));
+	}
+
+	public boolean blocks(String resourceType, String url) {
+		if (types.contains(resourceType)) return true;
+		for (Pattern p : urls) {
+			if (p.matcher(url).find()) return true;
+		}
+		return false;
+	}
+
+	public boolean isNone() {
+		return types.isEmpty() && urls.isEmpty();
+	}
+
+	/** Routes every request of {@code context} through this profile and counts the outcome in {@code stats}. */
+	public void install(BrowserContext context, BlockStats stats) {
+		context.onResponse(r -> stats.allowed(r.headers().get("content-length")));
+		if (isNone()) return;
+		context.route("**/*", route -> {
+			Request req = route.request();
+			if (blocks(req.resourceType(), req.url())) {
+				stats.blocked(req.resourceType());
+				route.abort("blockedbyclient");
+			} else {
+				route.resume();
+			}
+		});
+	}
+
+	@Override
+	public String toString() {
+		if (isNone()) return "block nothing";
+		return "block types " + (types.isEmpty() ? "none" : String.join(",", types)) + " and " + urls.size() + " URL patterns";
+	}
+}
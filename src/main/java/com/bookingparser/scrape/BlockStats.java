@@ -0,0 +1,56 @@
+package com.bookingparser.scrape;
+
+import java.util.Map;
+import java.util.TreeMap;
+import java.util.concurrent.ConcurrentHashMap;
+import java.util.concurrent.atomic.LongAdder;
+
+/**
+ * What a {@link BlockProfile} let through and stopped in one browser context. Blocked requests are
+ * never sent, so their size is never known; bytes saved show up as the difference in bytes received
+ * against a run with --no-block.
+ */
+public class BlockStats {
+	private final LongAdder allowed = new LongAdder();
+	private final LongAdder bytes = new LongAdder();
+	private final Map<String, LongAdder> blocked = new ConcurrentHashMap<>();
+
+	void allowed(String contentLength) {
+		allowed.increment();
+		if (contentLength == null) return;
+		try {
+			bytes.add(Long.parseLong(contentLength.trim()));
+		} catch (NumberFormatException e) {
+			// missing or malformed length: count the request, not its size
+		}
+	}
+
+	void blocked(String resourceType) {
+		blocked.computeIfAbsent(resourceType, k -> new LongAdder()).increment();
+	}
+
+	public long getAllowed() { return allowed.sum(); }
+	/** Bytes received by allowed responses, as declared in their Content-Length. */
+	public long getBytesReceived() { return bytes.sum(); }
+
+	public long getBlocked() {
+		long n = 0;
+		for (LongAdder a : blocked.values()) n += a.sum();
+		return n;
+	}
+
+	/** Blocked requests by resource type. */
+	public Map<String, Long> getBlockedByType() {
+		Map<String, Long> out = new TreeMap<>();
+		blocked.forEach((k, v) -> out.put(k, v.sum()));
+		return out;
+	}
+
+	@Override
+	public String toString() {
+		StringBuilder sb = new StringBuilder("requests: ").append(getAllowed()).append(" allowed, ").append(getBlocked()).append(" blocked");
+		Map<String, Long> byType = getBlockedByType();
+		if (!byType.isEmpty()) sb.append(' ').append(byType);
+		return sb.append(String.format(", %.1f KiB received", getBytesReceived() / 1024.0)).toString();
+	}
+}
@@ -0,0 +1,148 @@
+package com.bookingparser.scrape;
+
+import com.microsoft.playwright.Browser;
+import com.microsoft.playwright.BrowserContext;
+import com.microsoft.playwright.BrowserType;
+import com.microsoft.playwright.Playwright;
+
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.ArrayBlockingQueue;
+import java.util.concurrent.BlockingQueue;
+
+/**
+ * Fixed set of launched browsers handed out one job at a time. Driver extraction and browser launch
+ * are paid once per slot; each lease gets a fresh context, so cookies and storage never carry over
+ * from one job to the next. Playwright objects are not thread-safe, so a slot is only ever used by
+ * the thread holding its lease. Every context routes its requests through the pool's
+ * {@link BlockProfile}.
+ */
+public class BrowserPool implements AutoCloseable {
+	private static final class Slot {
+		Playwright playwright;
+		Browser browser;
+	}
+
+	private final boolean headless;
+	private final BlockProfile blocking;
+	private final List<Slot> slots = new ArrayList<>();
+	private final BlockingQueue<Slot> idle;
+	private volatile boolean closed;
+
+	public BrowserPool(int size, boolean headless) {
+		this(size, headless, BlockProfile.defaults());
+	}
+
+	public BrowserPool(int size, boolean headless, BlockProfile blocking) {
+		if (size < 1) throw new IllegalArgumentException("size must be >= 1: " + size);
+		this.headless = headless;
+		this.blocking = blocking;
+		this.idle = new ArrayBlockingQueue<>(size);
+		for (int i = 0; i < size; i++) {
+			Slot s = new Slot();
+			slots.add(s);
+			idle.add(s);
+		}
+	}
+
+	/** Launches every browser now instead of on first use. */
+	public void warmUp() throws InterruptedException {
+		List<Lease> leases = new ArrayList<>();
+		try {
+			for (int i = 0; i < slots.size(); i++) {
+				Lease l = acquire();
+				leases.add(l);
+				l.browser();
+			}
+		} finally {
+			for (Lease l : leases) l.close();
+		}
+	}
+
+	/**
+	 * Waits for a free slot. Its browser is launched on the lease's first use, so jobs that never
+	 * need one (HTTP fetch without a challenge) never pay for it.
+	 */
+	public Lease acquire() throws InterruptedException {
+		if (closed) throw new IllegalStateException("Browser pool is closed");
+		return new Lease(idle.take());
+	}
+
+	public int size() {
+		return slots.size();
+	}
+
+	public int available() {
+		return idle.size();
+	}
+
+	private void launch(Slot s) {
+		shutDown(s);
+		s.playwright = Playwright.create();
+		s.browser = s.playwright.chromium().launch(new BrowserType.LaunchOptions().setHeadless(headless));
+	}
+
+	private static void shutDown(Slot s) {
+		if (s.playwright != null) s.playwright.close();
+		s.playwright = null;
+		s.browser = null;
+	}
+
+	@Override
+	public void close() throws InterruptedException {
+		closed = true;
+		// wait for running jobs to hand their browsers back
+		for (int i = 0; i < slots.size(); i++) shutDown(idle.take());
+	}
+
+	/** Exclusive use of one browser; closing it closes the context and returns the browser. */
+	public final class Lease implements AutoCloseable {
+		private final Slot slot;
+		private final BlockStats blockStats = new BlockStats();
+		private BrowserContext context;
+		private boolean released;
+
+		private Lease(Slot slot) {
+			this.slot = slot;
+		}
+
+		public Browser browser() {
+			if (slot.browser == null || !slot.browser.isConnected()) launch(slot);
+			return slot.browser;
+		}
+
+		/** The lease's own context, created on first call. */
+		public BrowserContext context() {
+			return context(null);
+		}
+
+		/** The lease's own context, created on first call with the cookies and storage saved in {@code storageState} if that file exists. */
+		public BrowserContext context(Path storageState) {
+			if (context == null) {
+				Browser.NewContextOptions options = new Browser.NewContextOptions();
+				if (storageState != null && Files.isRegularFile(storageState)) options.setStorageStatePath(storageState);
+				context = browser().newContext(options);
+				blocking.install(context, blockStats);
+			}
+			return context;
+		}
+
+		/** Requests allowed and blocked in this lease's context. */
+		public BlockStats blockStats() {
+			return blockStats;
+		}
+
+		@Override
+		public void close() {
+			if (released) return;
+			released = true;
+			try {
+				if (context != null) context.close();
+			} finally {
+				idle.add(slot);
+			}
+		}
+	}
+}
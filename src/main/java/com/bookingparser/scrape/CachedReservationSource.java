@@ -0,0 +1,68 @@
+package com.bookingparser.scrape;
+
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.source.ListingSource;
+
+import java.io.IOException;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Set;
+
+/**
+ * Replays the responses a {@link PageCache} holds for one account through {@link ReservationJson},
+ * without any network access: after a parser fix, a whole export can be rebuilt from what earlier
+ * runs downloaded. Each stored response that yields new reservations is one page, oldest first.
+ */
+public class CachedReservationSource extends ListingSource<BookingRaw> {
+	private final PageCache cache;
+	private final String account;
+	private final Set<String> seen = new HashSet<>();
+	private List<String> bodies;
+	private int next;
+
+	public CachedReservationSource(PageCache cache, String account) {
+		this.cache = cache;
+		this.account = account;
+	}
+
+	@Override
+	protected List<BookingRaw> page(int p) throws IOException {
+		if (p == 0) {
+			bodies = cache.bodies(account);
+			next = 0;
+			seen.clear();
+			if (bodies.isEmpty()) throw new IOException("Nothing cached for " + account + "; run once without --offline first");
+		}
+		while (next < bodies.size()) {
+			List<BookingRaw> out = new ArrayList<>();
+			for (BookingRaw raw : extract(bodies.get(next++))) {
+				if (seen.add(ReservationJson.key(raw))) out.add(raw);
+			}
+			// an empty page ends the listing, so responses with nothing new are skipped, not returned
+			if (!out.isEmpty()) return out;
+		}
+		return List.of();
+	}
+
+	private static List<BookingRaw> extract(String body) {
+		String s = body.stripLeading();
+		if (!s.startsWith("{") && !s.startsWith("[")) return ReservationJson.extractFromHtml(body);
+		try {
+			return ReservationJson.extract(body);
+		} catch (IllegalArgumentException e) {
+			return List.of();
+		}
+	}
+
+	@Override
+	protected LocalDate startDate(BookingRaw entry) {
+		return ReservationJson.isoDate(entry.getStartDateText());
+	}
+
+	@Override
+	protected BookingRaw details(BookingRaw entry) {
+		return entry;
+	}
+}
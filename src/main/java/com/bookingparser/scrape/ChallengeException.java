@@ -0,0 +1,10 @@
+package com.bookingparser.scrape;
+
+import java.io.IOException;
+
+/** The site answered a plain HTTP request with a sign-in redirect, a CAPTCHA or a bot check instead of data. */
+public class ChallengeException extends IOException {
+	public ChallengeException(String message) {
+		super(message);
+	}
+}
@@ -0,0 +1,213 @@
+package com.bookingparser.scrape;
+
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.source.DateRange;
+import com.bookingparser.source.ListingSource;
+import com.bookingparser.source.ReservationSource;
+
+import java.io.ByteArrayInputStream;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.UncheckedIOException;
+import java.net.URI;
+import java.net.http.HttpClient;
+import java.net.http.HttpRequest;
+import java.net.http.HttpResponse;
+import java.nio.charset.Charset;
+import java.nio.charset.IllegalCharsetNameException;
+import java.nio.charset.StandardCharsets;
+import java.nio.charset.UnsupportedCharsetException;
+import java.time.Duration;
+import java.time.Instant;
+import java.time.LocalDate;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Locale;
+import java.util.Set;
+import java.util.regex.Matcher;
+import java.util.regex.Pattern;
+import java.util.zip.GZIPInputStream;
+import java.util.zip.InflaterInputStream;
+
+/**
+ * Reads the reservation listing with plain HTTP requests carrying the cookies of the saved browser
+ * session, with no rendering at all. Reservations come from the response itself when it is JSON, or
+ * from the JSON blocks embedded in the page when it is HTML, read by {@link ReservationJson}.
+ * <p>
+ * When the site answers with a sign-in redirect or a bot check, or when there is no saved session
+ * yet, the rest of the export is handed to {@code fallback} (normally a {@link ReservationScraper}),
+ * and records already emitted are not emitted again.
+ * <p>
+ * With a {@link PageCache} every page read is also stored for {@code --offline} runs.
+ */
+public class HttpReservationSource extends ListingSource<BookingRaw> {
+	/** Shared by every source, so connections (HTTP/2 where the server offers it) are reused across pages and jobs. */
+	private static final HttpClient CLIENT = HttpClient.newBuilder()
+		.version(HttpClient.Version.HTTP_2)
+		.followRedirects(HttpClient.Redirect.NEVER)
+		.connectTimeout(Duration.ofSeconds(20))
+		.build();
+	private static final Duration REQUEST_TIMEOUT = Duration.ofSeconds(30);
+	private static final String USER_AGENT = "booking-parser/0.1 (java.net.http)";
+	private static final Pattern CHALLENGE = Pattern.compile("captcha|challenge-platform|px-captcha|awswaf|cf-chl", Pattern.CASE_INSENSITIVE);
+	private static final Pattern CHARSET = Pattern.compile("charset=\"?([\\w.:-]+)", Pattern.CASE_INSENSITIVE);
+
+	private final String account;
+	private final SessionStore session;
+	private final RateLimiters limiters;
+	private final ReservationSource fallback; // nullable: challenges fail the export
+	private final Set<String> seen = new HashSet<>();
+	private PageCache cache; // nullable
+	private boolean sessionChecked;
+	private String fellBackBecause;
+	private long bytes;
+
+	public HttpReservationSource(String account, SessionStore session, RateLimiters limiters, ReservationSource fallback) {
+		this.account = account;
+		this.session = session;
+		this.limiters = limiters;
+		this.fallback = fallback;
+	}
+
+	/** Stores every page read in {@code cache}; null turns it off. */
+	public HttpReservationSource cacheTo(PageCache cache) {
+		this.cache = cache;
+		return this;
+	}
+
+	@Override
+	public void fetch(DateRange range, Emitter out) throws IOException, InterruptedException {
+		Set<String> sent = new HashSet<>();
+		sessionChecked = false;
+		try {
+			super.fetch(range, raw -> {
+				sent.add(ReservationJson.key(raw));
+				out.emit(raw);
+			});
+		} catch (ChallengeException e) {
+			if (fallback == null) throw e;
+			fellBackBecause = e.getMessage();
+			try {
+				fallback.fetch(range, raw -> {
+					if (sent.contains(ReservationJson.key(raw))) return;
+					out.emit(raw);
+					try {
+						checkpoint(raw);
+					} catch (IOException ce) {
+						throw new UncheckedIOException(ce);
+					}
+				});
+			} catch (UncheckedIOException ce) {
+				throw ce.getCause();
+			}
+		}
+	}
+
+	@Override
+	protected List<BookingRaw> page(int p) throws IOException, InterruptedException {
+		if (!sessionChecked) {
+			// checked on the first request rather than up front, so a resumed fetch replays its checkpoints first
+			SessionStore.Status status = session.check();
+			if (status == SessionStore.Status.MISSING || status == SessionStore.Status.EXPIRED) {
+				throw new ChallengeException("no usable saved session (" + status.name().toLowerCase(Locale.ROOT) + ")");
+			}
+			sessionChecked = true;
+		}
+		String url = ReservationScraper.RESERVATIONS_URL + (p == 0 ? "" : "?page=" + (p + 1));
+		URI uri = URI.create(url);
+		limiters.acquire(account, url);
+		String cookies = session.cookieHeader(uri.getHost(), Instant.now());
+		if (cookies.isEmpty()) throw new ChallengeException("no saved cookies for " + uri.getHost());
+		HttpRequest request = HttpRequest.newBuilder(uri)
+			.timeout(REQUEST_TIMEOUT)
+			.header("User-Agent", USER_AGENT)
+			.header("Accept", "application/json, text/html;q=0.9")
+			.header("Accept-Encoding", "gzip, deflate")
+			.header("Cookie", cookies)
+			.GET()
+			.build();
+		HttpResponse<byte[]> response = CLIENT.send(request, HttpResponse.BodyHandlers.ofByteArray());
+		int status = response.statusCode();
+		if (status / 100 == 3) {
+			String location = response.headers().firstValue("Location").orElse("?");
+			throw new ChallengeException("redirected to " + location);
+		}
+		if (status == 401 || status == 403 || status == 429 || status == 503) throw new ChallengeException("HTTP " + status);
+		if (status != 200) throw new IOException("GET " + url + " returned HTTP " + status);
+		bytes += response.body().length;
+		String contentType = response.headers().firstValue("Content-Type").orElse("");
+		String body = new String(decode(response), charset(contentType));
+		List<BookingRaw> found;
+		if (contentType.contains("json")) {
+			if (cache != null) cache.put(account, url, null, body);
+			try {
+				found = ReservationJson.extract(body);
+			} catch (IllegalArgumentException e) {
+				throw new IOException("GET " + url + ": " + e.getMessage(), e);
+			}
+		} else {
+			found = ReservationJson.extractFromHtml(body);
+			if (found.isEmpty() && CHALLENGE.matcher(body).find()) throw new ChallengeException("bot check on " + url);
+			if (cache != null) cache.put(account, url, null, body);
+		}
+		// a page number the site ignores brings back the same trips, which ends the listing
+		found.removeIf(raw -> !seen.add(ReservationJson.key(raw)));
+		return found;
+	}
+
+	private static byte[] decode(HttpResponse<byte[]> response) throws IOException {
+		String encoding = response.headers().firstValue("Content-Encoding").orElse("identity").trim().toLowerCase(Locale.ROOT);
+		InputStream in;
+		switch (encoding) {
+			case "gzip": in = new GZIPInputStream(new ByteArrayInputStream(response.body())); break;
+			case "deflate": in = new InflaterInputStream(new ByteArrayInputStream(response.body())); break;
+			case "identity": return response.body();
+			default: throw new IOException("Unsupported Content-Encoding " + encoding);
+		}
+		try (InputStream s = in) {
+			return s.readAllBytes();
+		}
+	}
+
+	private static Charset charset(String contentType) {
+		Matcher m = CHARSET.matcher(contentType);
+		if (!m.find()) return StandardCharsets.UTF_8;
+		try {
+			return Charset.forName(m.group(1));
+		} catch (IllegalCharsetNameException | UnsupportedCharsetException e) {
+			return StandardCharsets.UTF_8;
+		}
+	}
+
+	/** Pages are addressed by number, so a resumed export starts after the last finished one. */
+	@Override
+	protected boolean seekable() {
+		return true;
+	}
+
+	@Override
+	protected LocalDate startDate(BookingRaw entry) {
+		return ReservationJson.isoDate(entry.getStartDateText());
+	}
+
+	@Override
+	protected BookingRaw details(BookingRaw entry) {
+		return entry;
+	}
+
+	/** Compressed bytes received. */
+	public long bytesReceived() {
+		return bytes;
+	}
+
+	/** Why the export moved to the browser, or null if it did not. */
+	public String fellBackBecause() {
+		return fellBackBecause;
+	}
+
+	@Override
+	public String toString() {
+		String s = super.toString() + String.format(", %.1f KiB received", bytes / 1024.0);
+		return fellBackBecause == null ? s : s + "; fell back to browser (" + fellBackBecause + "): " + fallback;
+	}
+}
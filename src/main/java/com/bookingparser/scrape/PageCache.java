@@ -0,0 +1,425 @@
+package com.bookingparser.scrape;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.EOFException;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.UTFDataFormatException;
+import java.nio.ByteBuffer;
+import java.nio.channels.FileChannel;
+import java.nio.channels.FileLock;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.AtomicMoveNotSupportedException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardCopyOption;
+import java.nio.file.StandardOpenOption;
+import java.nio.file.attribute.PosixFilePermissions;
+import java.security.MessageDigest;
+import java.security.NoSuchAlgorithmException;
+import java.time.Duration;
+import java.util.ArrayList;
+import java.util.Comparator;
+import java.util.HashMap;
+import java.util.HexFormat;
+import java.util.List;
+import java.util.Map;
+import java.util.zip.GZIPInputStream;
+import java.util.zip.GZIPOutputStream;
+
+/**
+ * Response bodies the scrapers have read, kept on disk so extraction can be rerun without the
+ * network ({@code --offline}). Bodies are content-addressed: each distinct body is stored once,
+ * gzip-compressed, in an append-only data file, under the SHA-256 of its text. Entries map a key
+ * (account, URL and request body) to a body hash. The index of entries and blob offsets lives in
+ * memory and is written on {@link #close}, so a lookup is one map probe and one positional read.
+ * Every store is also appended to a small log that {@link #open} replays, so a run that dies
+ * without closing keeps what it stored. A body read back is checked against its hash, and one that
+ * no longer matches is dropped and counts as a miss.
+ * <p>
+ * One process uses a cache directory at a time: {@link #open} takes an exclusive lock on its
+ * {@code cache.lock}, waiting while another process holds it, and {@link #close} releases it.
+ * <p>
+ * On close, entries older than the TTL are dropped, then the oldest entries go until the live
+ * bodies fit in the size limit. The data file is compacted whenever that freed anything. The
+ * index names the data file it belongs to, so a crash mid-compaction leaves the previous pair intact.
+ * Bodies hold reservation details, so the files are readable only by their owner.
+ */
+public class PageCache implements AutoCloseable {
+	private static final int MAGIC = 0x42504743; // "BPGC"
+	private static final String INDEX = "index.bin";
+	private static final String LOG = "index.log";
+	private static final String LOCK = "cache.lock";
+	private static final byte LOG_BLOB = 'B';
+	private static final byte LOG_ENTRY = 'E';
+
+	private static final class Blob {
+		final long offset;
+		final int length; // compressed
+
+		Blob(long offset, int length) {
+			this.offset = offset;
+			this.length = length;
+		}
+	}
+
+	private static final class Entry {
+		final String key;
+		final String sha;
+		final long storedAt;
+		final long seq;
+
+		Entry(String key, String sha, long storedAt, long seq) {
+			this.key = key;
+			this.sha = sha;
+			this.storedAt = storedAt;
+			this.seq = seq;
+		}
+	}
+
+	private final Path dir;
+	private final long ttlMillis;
+	private final long maxBytes;
+	private final Map<String, Blob> blobs = new HashMap<>();
+	private final Map<String, Entry> entries = new HashMap<>();
+	private FileChannel lockFile;
+	private String dataName;
+	private FileChannel data;
+	private FileChannel log; // stores since the index was written, for the data file it names
+	private long seq;
+	private long hits;
+	private long misses;
+	private boolean closed;
+
+	private PageCache(Path dir, Duration ttl, long maxBytes) {
+		this.dir = dir;
+		this.ttlMillis = ttl.toMillis();
+		this.maxBytes = maxBytes;
+	}
+
+	/** Opens the cache in {@code dir}, creating it if needed. */
+	public static PageCache open(Path dir, Duration ttl, long maxBytes) throws IOException {
+		if (ttl.isNegative() || ttl.isZero()) throw new IllegalArgumentException("ttl must be > 0: " + ttl);
+		if (maxBytes < 1) throw new IllegalArgumentException("maxBytes must be >= 1: " + maxBytes);
+		Files.createDirectories(dir);
+		PageCache c = new PageCache(dir, ttl, maxBytes);
+		c.lockFile = FileChannel.open(dir.resolve(LOCK), StandardOpenOption.CREATE, StandardOpenOption.WRITE);
+		try {
+			// held until close; the channel's lock excludes other processes, and overlaps within this one fail
+			c.lockFile.lock();
+			c.readIndex();
+			c.data = FileChannel.open(dir.resolve(c.dataName), StandardOpenOption.CREATE, StandardOpenOption.READ, StandardOpenOption.WRITE);
+			ownerOnly(dir.resolve(c.dataName));
+			c.replayLog();
+		} catch (IOException | RuntimeException e) {
+			if (c.data != null) c.data.close();
+			if (c.log != null) c.log.close();
+			c.lockFile.close();
+			throw e;
+		}
+		return c;
+	}
+
+	/** Stores {@code body} as the response to {@code url} (and {@code postData}, if any) for {@code account}. */
+	public synchronized void put(String account, String url, String postData, String body) throws IOException {
+		byte[] text = body.getBytes(StandardCharsets.UTF_8);
+		String sha = sha256(text);
+		ByteArrayOutputStream record = new ByteArrayOutputStream();
+		DataOutputStream out = new DataOutputStream(record);
+		if (!blobs.containsKey(sha)) {
+			byte[] packed = gzip(text);
+			long at = data.size();
+			data.write(ByteBuffer.wrap(packed), at);
+			blobs.put(sha, new Blob(at, packed.length));
+			out.writeByte(LOG_BLOB);
+			out.writeUTF(sha);
+			out.writeLong(at);
+			out.writeInt(packed.length);
+		}
+		String key = key(account, url, postData);
+		Entry e = new Entry(key, sha, System.currentTimeMillis(), ++seq);
+		entries.put(key, e);
+		out.writeByte(LOG_ENTRY);
+		out.writeUTF(e.key);
+		out.writeUTF(e.sha);
+		out.writeLong(e.storedAt);
+		out.writeLong(e.seq);
+		// after the body, so a logged blob is always on disk
+		ByteBuffer buf = ByteBuffer.wrap(record.toByteArray());
+		while (buf.hasRemaining()) log.write(buf, log.size());
+	}
+
+	/** The stored body, or null when there is none, it is older than the TTL or it no longer matches its hash. */
+	public synchronized String get(String account, String url, String postData) throws IOException {
+		Entry e = entries.get(key(account, url, postData));
+		String body = e == null || expired(e, System.currentTimeMillis()) ? null : read(e);
+		if (body == null) misses++;
+		else hits++;
+		return body;
+	}
+
+	/** Every unexpired body stored for {@code account}, oldest first. */
+	public synchronized List<String> bodies(String account) throws IOException {
+		String prefix = account + ' ';
+		long now = System.currentTimeMillis();
+		List<Entry> mine = new ArrayList<>();
+		for (Entry e : entries.values()) {
+			if (e.key.startsWith(prefix) && !expired(e, now)) mine.add(e);
+		}
+		mine.sort(Comparator.comparingLong(e -> e.seq));
+		List<String> out = new ArrayList<>(mine.size());
+		for (Entry e : mine) {
+			String body = read(e);
+			if (body != null) out.add(body);
+		}
+		hits += out.size();
+		misses += mine.size() - out.size();
+		return out;
+	}
+
+	public synchronized int size() {
+		return entries.size();
+	}
+
+	private boolean expired(Entry e, long now) {
+		return now - e.storedAt > ttlMillis;
+	}
+
+	/** The body of {@code e}, or null when its stored bytes are cut short or no longer hash to it; the body is then forgotten. */
+	private String read(Entry e) throws IOException {
+		Blob b = blobs.get(e.sha);
+		if (b == null) return null;
+		ByteBuffer buf = ByteBuffer.allocate(b.length);
+		byte[] text = null;
+		while (buf.hasRemaining()) {
+			if (data.read(buf, b.offset + buf.position()) < 0) break;
+		}
+		if (!buf.hasRemaining()) {
+			try (InputStream in = new GZIPInputStream(new ByteArrayInputStream(buf.array()))) {
+				text = in.readAllBytes();
+			} catch (IOException corrupt) {
+				// not gzip any more; the bytes are in memory, so this is not an I/O failure
+			}
+		}
+		if (text == null || !sha256(text).equals(e.sha)) {
+			blobs.remove(e.sha);
+			entries.values().removeIf(x -> x.sha.equals(e.sha));
+			return null;
+		}
+		return new String(text, StandardCharsets.UTF_8);
+	}
+
+	private static String key(String account, String url, String postData) {
+		// GraphQL posts every query to one URL; the request body tells them apart
+		return account + ' ' + url + (postData == null || postData.isEmpty() ? "" : " #" + sha256(postData.getBytes(StandardCharsets.UTF_8)));
+	}
+
+	private void readIndex() throws IOException {
+		Path index = dir.resolve(INDEX);
+		dataName = "data-0.bin";
+		if (!Files.exists(index)) return;
+		try (DataInputStream in = new DataInputStream(new ByteArrayInputStream(Files.readAllBytes(index)))) {
+			if (in.readInt() != MAGIC) throw new IOException("Not a page cache index: " + index);
+			dataName = in.readUTF();
+			seq = in.readLong();
+			int nb = in.readInt();
+			for (int i = 0; i < nb; i++) blobs.put(in.readUTF(), new Blob(in.readLong(), in.readInt()));
+			int ne = in.readInt();
+			for (int i = 0; i < ne; i++) {
+				Entry e = new Entry(in.readUTF(), in.readUTF(), in.readLong(), in.readLong());
+				if (blobs.containsKey(e.sha)) entries.put(e.key, e);
+			}
+		}
+	}
+
+	/**
+	 * Adds the stores logged since the index was written, when the log belongs to the same data file.
+	 * A record cut short by a crash, or naming bytes the data file does not have, ends the replay and
+	 * is truncated away.
+	 */
+	private void replayLog() throws IOException {
+		Path file = dir.resolve(LOG);
+		byte[] bytes = Files.exists(file) ? Files.readAllBytes(file) : new byte[0];
+		long good = 0;
+		try (DataInputStream in = new DataInputStream(new ByteArrayInputStream(bytes))) {
+			if (bytes.length > 0 && in.readInt() == MAGIC && in.readUTF().equals(dataName)) {
+				good = bytes.length - in.available();
+				long dataSize = data.size();
+				while (in.available() > 0) {
+					byte type = in.readByte();
+					if (type == LOG_BLOB) {
+						String sha = in.readUTF();
+						Blob b = new Blob(in.readLong(), in.readInt());
+						if (b.offset + b.length > dataSize) break;
+						blobs.put(sha, b);
+					} else if (type == LOG_ENTRY) {
+						Entry e = new Entry(in.readUTF(), in.readUTF(), in.readLong(), in.readLong());
+						if (blobs.containsKey(e.sha)) entries.put(e.key, e);
+						seq = Math.max(seq, e.seq);
+					} else {
+						break;
+					}
+					good = bytes.length - in.available();
+				}
+			}
+		} catch (EOFException | UTFDataFormatException torn) {
+			// keep what was read up to the last whole record
+		}
+		log = FileChannel.open(file, StandardOpenOption.CREATE, StandardOpenOption.READ, StandardOpenOption.WRITE);
+		ownerOnly(file);
+		if (good > 0) log.truncate(good);
+		else resetLog();
+	}
+
+	/** Empties the log and starts it for the current data file. */
+	private void resetLog() throws IOException {
+		ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+		try (DataOutputStream out = new DataOutputStream(bytes)) {
+			out.writeInt(MAGIC);
+			out.writeUTF(dataName);
+		}
+		log.truncate(0);
+		ByteBuffer buf = ByteBuffer.wrap(bytes.toByteArray());
+		while (buf.hasRemaining()) log.write(buf, buf.position());
+	}
+
+	/** Evicts, compacts if anything was evicted, writes the index and releases the cache to other processes. */
+	@Override
+	public synchronized void close() throws IOException {
+		if (closed) return;
+		closed = true;
+		try {
+			if (evict()) compact(); // writes the index itself
+			else writeIndex();
+			// a crash before this replays stores the index already has, which changes nothing
+			resetLog();
+		} finally {
+			try {
+				data.close();
+				log.close();
+			} finally {
+				lockFile.close(); // releases the lock
+			}
+		}
+	}
+
+	private boolean evict() throws IOException {
+		long now = System.currentTimeMillis();
+		boolean changed = entries.values().removeIf(e -> expired(e, now));
+		Map<String, Integer> refs = new HashMap<>();
+		for (Entry e : entries.values()) refs.merge(e.sha, 1, Integer::sum);
+		long live = 0;
+		for (String sha : refs.keySet()) live += blobs.get(sha).length;
+		if (live > maxBytes) {
+			List<Entry> oldest = new ArrayList<>(entries.values());
+			oldest.sort(Comparator.comparingLong(e -> e.seq));
+			for (Entry e : oldest) {
+				if (live <= maxBytes) break;
+				entries.remove(e.key);
+				if (refs.merge(e.sha, -1, Integer::sum) == 0) {
+					refs.remove(e.sha);
+					live -= blobs.get(e.sha).length;
+				}
+			}
+			changed = true;
+		}
+		changed |= blobs.keySet().retainAll(refs.keySet());
+		return changed || live < data.size() / 2;
+	}
+
+	private void compact() throws IOException {
+		int generation = Integer.parseInt(dataName.substring(5, dataName.length() - 4)) + 1;
+		String next = "data-" + generation + ".bin";
+		Map<String, Blob> moved = new HashMap<>();
+		try (FileChannel out = FileChannel.open(dir.resolve(next), StandardOpenOption.CREATE, StandardOpenOption.TRUNCATE_EXISTING,
+				StandardOpenOption.WRITE)) {
+			ownerOnly(dir.resolve(next));
+			long at = 0;
+			for (Map.Entry<String, Blob> b : blobs.entrySet()) {
+				ByteBuffer buf = ByteBuffer.allocate(b.getValue().length);
+				while (buf.hasRemaining()) {
+					if (data.read(buf, b.getValue().offset + buf.position()) < 0) throw new IOException("Page cache data is truncated in " + dir);
+				}
+				buf.flip();
+				while (buf.hasRemaining()) at += out.write(buf, at);
+				moved.put(b.getKey(), new Blob(at - b.getValue().length, b.getValue().length));
+			}
+			out.force(true);
+		}
+		String old = dataName;
+		blobs.clear();
+		blobs.putAll(moved);
+		dataName = next;
+		writeIndex();
+		data.close();
+		Files.deleteIfExists(dir.resolve(old));
+		data = FileChannel.open(dir.resolve(dataName), StandardOpenOption.READ, StandardOpenOption.WRITE);
+	}
+
+	private void writeIndex() throws IOException {
+		ByteArrayOutputStream bytes = new ByteArrayOutputStream();
+		try (DataOutputStream out = new DataOutputStream(bytes)) {
+			out.writeInt(MAGIC);
+			out.writeUTF(dataName);
+			out.writeLong(seq);
+			out.writeInt(blobs.size());
+			for (Map.Entry<String, Blob> b : blobs.entrySet()) {
+				out.writeUTF(b.getKey());
+				out.writeLong(b.getValue().offset);
+				out.writeInt(b.getValue().length);
+			}
+			out.writeInt(entries.size());
+			for (Entry e : entries.values()) {
+				out.writeUTF(e.key);
+				out.writeUTF(e.sha);
+				out.writeLong(e.storedAt);
+				out.writeLong(e.seq);
+			}
+		}
+		data.force(true);
+		Path tmp = Files.createTempFile(dir, INDEX, ".tmp");
+		try {
+			ownerOnly(tmp);
+			Files.write(tmp, bytes.toByteArray());
+			try {
+				Files.move(tmp, dir.resolve(INDEX), StandardCopyOption.REPLACE_EXISTING, StandardCopyOption.ATOMIC_MOVE);
+			} catch (AtomicMoveNotSupportedException e) {
+				Files.move(tmp, dir.resolve(INDEX), StandardCopyOption.REPLACE_EXISTING);
+			}
+		} finally {
+			Files.deleteIfExists(tmp);
+		}
+	}
+
+	private static void ownerOnly(Path file) throws IOException {
+		try {
+			Files.setPosixFilePermissions(file, PosixFilePermissions.fromString("rw-------"));
+		} catch (UnsupportedOperationException e) {
+			// not a POSIX file system; the directory's permissions apply
+		}
+	}
+
+	private static byte[] gzip(byte[] text) throws IOException {
+		ByteArrayOutputStream out = new ByteArrayOutputStream(text.length / 4 + 64);
+		try (GZIPOutputStream gz = new GZIPOutputStream(out)) {
+			gz.write(text);
+		}
+		return out.toByteArray();
+	}
+
+	private static String sha256(byte[] bytes) {
+		try {
+			return HexFormat.of().formatHex(MessageDigest.getInstance("SHA-256").digest(bytes));
+		} catch (NoSuchAlgorithmException e) {
+			throw new IllegalStateException(e); // every JDK has SHA-256
+		}
+	}
+
+	@Override
+	public synchronized String toString() {
+		return String.format("page cache: %d entries, %d bodies, %d hits, %d misses", entries.size(), blobs.size(), hits, misses);
+	}
+}
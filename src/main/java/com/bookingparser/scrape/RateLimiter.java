@@ -0,0 +1,154 @@
+package com.bookingparser.scrape;
+
+import java.io.IOException;
+import java.io.UncheckedIOException;
+import java.nio.ByteBuffer;
+import java.nio.channels.FileChannel;
+import java.nio.channels.FileLock;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardOpenOption;
+import java.time.Instant;
+import java.time.temporal.ChronoUnit;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.concurrent.atomic.LongAdder;
+
+/**
+ * Token bucket holding up to {@code burst} permits and refilling at {@code permitsPerSecond}.
+ * A caller takes a permit even when the bucket is empty and then waits until it would have
+ * refilled, so concurrent callers are served in reservation order and never exceed the rate.
+ * <p>
+ * With a state file the bucket lives on disk and is updated under an exclusive file lock, so every
+ * process on the machine that uses the same file shares one budget. Times are wall-clock
+ * microseconds there, because nanoTime is not comparable across processes.
+ */
+public class RateLimiter implements AutoCloseable {
+	private static final int STATE_BYTES = Double.BYTES + Long.BYTES;
+
+	private final String name;
+	private final double permitsPerMicro;
+	private final int burst;
+	private final FileChannel state; // null: in-process only
+	private double tokens;
+	private long lastMicros;
+
+	private final LongAdder acquisitions = new LongAdder();
+	private final LongAdder delayed = new LongAdder();
+	private final LongAdder waitNanos = new LongAdder();
+	private final AtomicLong maxWaitNanos = new AtomicLong();
+
+	public RateLimiter(double permitsPerSecond) {
+		this("limiter", permitsPerSecond, 1);
+	}
+
+	public RateLimiter(String name, double permitsPerSecond, int burst) {
+		this(name, permitsPerSecond, burst, null);
+	}
+
+	/** @param stateFile file shared with other processes, created if missing; null keeps the bucket in memory */
+	public RateLimiter(String name, double permitsPerSecond, int burst, Path stateFile) {
+		if (!(permitsPerSecond > 0)) throw new IllegalArgumentException("permitsPerSecond must be > 0: " + permitsPerSecond);
+		if (burst < 1) throw new IllegalArgumentException("burst must be >= 1: " + burst);
+		this.name = name;
+		this.permitsPerMicro = permitsPerSecond / 1e6;
+		this.burst = burst;
+		this.tokens = burst;
+		this.lastMicros = nowMicros();
+		if (stateFile == null) {
+			this.state = null;
+		} else {
+			try {
+				Path parent = stateFile.toAbsolutePath().getParent();
+				if (parent != null) Files.createDirectories(parent);
+				this.state = FileChannel.open(stateFile, StandardOpenOption.CREATE, StandardOpenOption.READ, StandardOpenOption.WRITE);
+			} catch (IOException e) {
+				throw new UncheckedIOException("Cannot open rate limit state " + stateFile, e);
+			}
+		}
+	}
+
+	/** Blocks until the caller may send one request. */
+	public void acquire() throws InterruptedException {
+		long wait = reserve();
+		if (wait > 0) TimeUnit.MICROSECONDS.sleep(wait);
+	}
+
+	/** Takes a permit now and completes when it may be used, without holding a thread while waiting. */
+	public CompletableFuture<Void> acquireAsync() {
+		long wait = reserve();
+		if (wait <= 0) return CompletableFuture.completedFuture(null);
+		return CompletableFuture.runAsync(() -> {}, CompletableFuture.delayedExecutor(wait, TimeUnit.MICROSECONDS));
+	}
+
+	/** Takes one permit and returns how many microseconds to wait before using it. */
+	private long reserve() {
+		long wait;
+		synchronized (this) {
+			if (state == null) {
+				wait = take(nowMicros());
+			} else {
+				wait = takeShared();
+			}
+		}
+		long nanos = TimeUnit.MICROSECONDS.toNanos(Math.max(wait, 0));
+		acquisitions.increment();
+		if (nanos > 0) delayed.increment();
+		waitNanos.add(nanos);
+		maxWaitNanos.accumulateAndGet(nanos, Math::max);
+		return wait;
+	}
+
+	private long take(long now) {
+		if (now > lastMicros) {
+			tokens = Math.min(burst, tokens + (now - lastMicros) * permitsPerMicro);
+			lastMicros = now;
+		}
+		tokens -= 1;
+		return tokens >= 0 ? 0 : (long) Math.ceil(-tokens / permitsPerMicro);
+	}
+
+	private long takeShared() {
+		// the channel lock excludes other processes; the monitor held by reserve() excludes this one's threads
+		try (FileLock lock = state.lock()) {
+			ByteBuffer buf = ByteBuffer.allocate(STATE_BYTES);
+			state.read(buf, 0);
+			if (buf.position() == STATE_BYTES) {
+				buf.flip();
+				tokens = buf.getDouble();
+				lastMicros = buf.getLong();
+			}
+			long wait = take(nowMicros());
+			buf.clear();
+			buf.putDouble(tokens).putLong(lastMicros).flip();
+			state.write(buf, 0);
+			return wait;
+		} catch (IOException e) {
+			throw new UncheckedIOException("Rate limit state for " + name + " is unreadable", e);
+		}
+	}
+
+	private static long nowMicros() {
+		return ChronoUnit.MICROS.between(Instant.EPOCH, Instant.now());
+	}
+
+	public String getName() { return name; }
+	public long getAcquisitions() { return acquisitions.sum(); }
+	/** Acquisitions that had to wait at all. */
+	public long getDelayed() { return delayed.sum(); }
+	public long getTotalWaitNanos() { return waitNanos.sum(); }
+	public long getMaxWaitNanos() { return maxWaitNanos.get(); }
+
+	@Override
+	public String toString() {
+		long n = getAcquisitions();
+		return String.format("%s: %d requests, %d delayed, wait avg %.0f ms max %.0f ms", name, n, getDelayed(),
+			n == 0 ? 0.0 : getTotalWaitNanos() / 1e6 / n, getMaxWaitNanos() / 1e6);
+	}
+
+	@Override
+	public void close() throws IOException {
+		if (state != null) state.close();
+	}
+}
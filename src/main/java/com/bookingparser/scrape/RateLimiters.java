@@ -0,0 +1,62 @@
+package com.bookingparser.scrape;
+
+import java.io.IOException;
+import java.net.URI;
+import java.nio.file.Path;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Locale;
+import java.util.Map;
+import java.util.concurrent.ConcurrentHashMap;
+
+/**
+ * One {@link RateLimiter} per (account, host), created on first use with the same rate and burst.
+ * Every navigation and fetch a source makes goes through {@link #acquire(String, String)} or the
+ * limiter from {@link #get}. With a state directory each key's bucket is a file in it, shared by
+ * every process that points at the same directory.
+ */
+public class RateLimiters implements AutoCloseable {
+	/** Key used for the account taken from BOOKING_EMAIL / BOOKING_PASSWORD. */
+	public static final String DEFAULT_ACCOUNT = "default";
+
+	private final double permitsPerSecond;
+	private final int burst;
+	private final Path stateDir; // nullable
+	private final Map<String, RateLimiter> limiters = new ConcurrentHashMap<>();
+
+	public RateLimiters(double permitsPerSecond, int burst, Path stateDir) {
+		this.permitsPerSecond = permitsPerSecond;
+		this.burst = burst;
+		this.stateDir = stateDir;
+	}
+
+	public RateLimiter get(String account, String host) {
+		String key = (account == null ? DEFAULT_ACCOUNT : account) + "@" + host.toLowerCase(Locale.ROOT);
+		return limiters.computeIfAbsent(key, k -> new RateLimiter(k, permitsPerSecond, burst,
+			stateDir == null ? null : stateDir.resolve(k.replaceAll("[^A-Za-z0-9._@-]", "_") + ".bucket")));
+	}
+
+	/** Waits for a permit for {@code url}'s host on behalf of {@code account}. */
+	public void acquire(String account, String url) throws InterruptedException {
+		String host = URI.create(url).getHost();
+		get(account, host == null ? "" : host).acquire();
+	}
+
+	/** Every limiter created so far. */
+	public List<RateLimiter> all() {
+		return new ArrayList<>(limiters.values());
+	}
+
+	@Override
+	public void close() throws IOException {
+		IOException first = null;
+		for (RateLimiter l : limiters.values()) {
+			try {
+				l.close();
+			} catch (IOException e) {
+				if (first == null) first = e;
+			}
+		}
+		if (first != null) throw first;
+	}
+}
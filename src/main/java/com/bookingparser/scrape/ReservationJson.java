@@ -0,0 +1,204 @@
+package com.bookingparser.scrape;
+
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.model.CurrencyTable;
+import com.google.gson.JsonElement;
+import com.google.gson.JsonObject;
+import com.google.gson.JsonParseException;
+import com.google.gson.JsonParser;
+import com.google.gson.JsonPrimitive;
+
+import java.math.BigDecimal;
+import java.math.RoundingMode;
+import java.time.LocalDate;
+import java.time.format.DateTimeParseException;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Map;
+import java.util.regex.Matcher;
+import java.util.regex.Pattern;
+
+/**
+ * Reads reservations out of the JSON that feeds the past-reservations page. The payloads are not a
+ * public API and differ between the REST and GraphQL endpoints, so records are found by shape: any
+ * object with a property name and check-in and check-out dates, at any depth, is one reservation.
+ * Fields may sit on the object itself or one level down (hotel, property, location, address, ...).
+ */
+public final class ReservationJson {
+	private static final String[] HOTEL = {"hotelName", "hotel_name", "propertyName", "property_name", "accommodationName", "name"};
+	private static final String[] START = {"checkin", "checkIn", "checkinDate", "checkInDate", "check_in", "startDate", "start_date", "arrivalDate"};
+	private static final String[] END = {"checkout", "checkOut", "checkoutDate", "checkOutDate", "check_out", "endDate", "end_date", "departureDate"};
+	private static final String[] PRICE = {"totalPrice", "total_price", "priceTotal", "totalAmount", "price"};
+	private static final String[] AMOUNT = {"amount", "value", "amountRounded"};
+	private static final String[] FORMATTED = {"formatted", "formattedAmount", "display", "text"};
+	private static final String[] CURRENCY = {"currency", "currencyCode", "currency_code"};
+	private static final String[] CITY = {"city", "cityName", "city_name"};
+	private static final String[] COUNTRY = {"country", "countryName", "country_name"};
+	private static final String[] ADDRESS = {"address", "addressText", "fullAddress", "formattedAddress"};
+	/** Child objects whose fields count as the parent's. */
+	private static final String[] NESTED = {"hotel", "property", "accommodation", "location", "address"};
+
+	/** JSON islands of an HTML page: application/json and ld+json script blocks. */
+	private static final Pattern SCRIPT_JSON = Pattern.compile(
+		"<script[^>]*type=[\"']application/(?:ld\\+)?json[\"'][^>]*>(.*?)</script>", Pattern.CASE_INSENSITIVE | Pattern.DOTALL);
+
+	private ReservationJson() {}
+
+	/** Every reservation in {@code json}, in document order. */
+	public static List<BookingRaw> extract(String json) {
+		JsonElement root;
+		try {
+			root = JsonParser.parseString(json);
+		} catch (JsonParseException e) {
+			throw new IllegalArgumentException("Not a JSON document: " + e.getMessage(), e);
+		}
+		List<BookingRaw> out = new ArrayList<>();
+		walk(root, out);
+		return out;
+	}
+
+	/** Every reservation in the JSON embedded in an HTML page; blocks that are not valid JSON are skipped. */
+	public static List<BookingRaw> extractFromHtml(String html) {
+		List<BookingRaw> out = new ArrayList<>();
+		Matcher m = SCRIPT_JSON.matcher(html);
+		while (m.find()) {
+			try {
+				out.addAll(extract(m.group(1)));
+			} catch (IllegalArgumentException e) {
+				// not JSON after all
+			}
+		}
+		return out;
+	}
+
+	/**
+	 * Identity of a reservation across responses: the same trip often appears in several of them.
+	 * The payloads carry no id we can rely on, so two bookings of one hotel for the same dates are
+	 * told apart by price. Only its digits count, so "412.50 EUR" and "€412.50" are the same.
+	 */
+	public static String key(BookingRaw raw) {
+		String price = raw.getTotalPriceText();
+		StringBuilder k = new StringBuilder(raw.getHotelName()).append('|').append(raw.getStartDateText())
+			.append('|').append(raw.getEndDateText()).append('|');
+		if (price != null) {
+			for (int i = 0; i < price.length(); i++) {
+				char c = price.charAt(i);
+				if (c >= '0' && c <= '9') k.append(c);
+			}
+		}
+		return k.toString();
+	}
+
+	/** The date when {@code text} is a plain ISO date, as extracted dates usually are; null otherwise. */
+	static LocalDate isoDate(String text) {
+		if (text == null || text.length() != 10) return null;
+		try {
+			return LocalDate.parse(text);
+		} catch (DateTimeParseException e) {
+			return null;
+		}
+	}
+
+	private static void walk(JsonElement e, List<BookingRaw> out) {
+		if (e.isJsonArray()) {
+			for (JsonElement child : e.getAsJsonArray()) walk(child, out);
+		} else if (e.isJsonObject()) {
+			BookingRaw raw = reservation(e.getAsJsonObject());
+			if (raw != null) {
+				out.add(raw);
+				return;
+			}
+			for (Map.Entry<String, JsonElement> child : e.getAsJsonObject().entrySet()) walk(child.getValue(), out);
+		}
+	}
+
+	private static BookingRaw reservation(JsonObject o) {
+		String start = date(text(o, START));
+		String end = date(text(o, END));
+		if (start == null || end == null) return null;
+		String hotel = text(o, HOTEL);
+		if (hotel == null) return null;
+		return new BookingRaw(hotel, text(o, ADDRESS), text(o, CITY), text(o, COUNTRY), start, end, price(o));
+	}
+
+	/** The first of {@code keys} holding a non-blank string or number, on {@code o} or a nested object. */
+	private static String text(JsonObject o, String[] keys) {
+		String v = own(o, keys);
+		if (v != null) return v;
+		for (String n : NESTED) {
+			JsonElement child = o.get(n);
+			if (child != null && child.isJsonObject()) {
+				v = own(child.getAsJsonObject(), keys);
+				if (v != null) return v;
+			}
+		}
+		return null;
+	}
+
+	private static String own(JsonObject o, String[] keys) {
+		for (String k : keys) {
+			JsonElement v = o.get(k);
+			if (v != null && v.isJsonPrimitive()) {
+				JsonPrimitive p = v.getAsJsonPrimitive();
+				if (p.isBoolean()) continue;
+				String s = p.getAsString().trim();
+				if (!s.isEmpty()) return s;
+			}
+		}
+		return null;
+	}
+
+	/** Drops the time from ISO date-times; other date texts are left to the normalizer. */
+	private static String date(String v) {
+		if (v != null && v.length() > 10 && v.charAt(10) == 'T' && v.matches("\\d{4}-\\d{2}-\\d{2}T.*")) return v.substring(0, 10);
+		return v;
+	}
+
+	/** Price as text the normalizer reads: "123.45 EUR", or the site's own formatted string. */
+	private static String price(JsonObject o) {
+		for (String k : PRICE) {
+			JsonElement v = o.get(k);
+			if (v == null || v.isJsonNull()) continue;
+			if (v.isJsonPrimitive()) {
+				JsonPrimitive p = v.getAsJsonPrimitive();
+				if (!p.isNumber()) return p.getAsString().trim();
+				String currency = own(o, CURRENCY);
+				String amount = number(p, currency);
+				return currency == null ? amount : amount + " " + currency;
+			}
+			if (v.isJsonObject()) {
+				JsonObject p = v.getAsJsonObject();
+				String currency = own(p, CURRENCY);
+				String amount = amount(p, currency);
+				if (amount != null) return currency == null ? amount : amount + " " + currency;
+				String formatted = own(p, FORMATTED);
+				if (formatted != null) return formatted;
+			}
+		}
+		return null;
+	}
+
+	/** First non-blank amount of a price object, with numbers written as {@link #number} does. */
+	private static String amount(JsonObject o, String currency) {
+		for (String k : AMOUNT) {
+			JsonElement v = o.get(k);
+			if (v == null || !v.isJsonPrimitive()) continue;
+			JsonPrimitive p = v.getAsJsonPrimitive();
+			if (p.isNumber()) return number(p, currency);
+			if (p.isBoolean()) continue;
+			String s = p.getAsString().trim();
+			if (!s.isEmpty()) return s;
+		}
+		return null;
+	}
+
+	/**
+	 * A JSON number as the normalizer reads it: 412.5 EUR becomes "412.50", with as many decimals as
+	 * the currency has minor digits. The normalizer reads at most two, so three-digit currencies
+	 * (KWD, BHD) are rounded to two rather than having "1234.567" cut to 1234.
+	 */
+	private static String number(JsonPrimitive p, String currency) {
+		int digits = Math.min(CurrencyTable.exponent(currency), 2);
+		return p.getAsBigDecimal().setScale(digits, RoundingMode.HALF_EVEN).toPlainString();
+	}
+}
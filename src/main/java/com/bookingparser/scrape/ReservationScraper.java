@@ -0,0 +1,193 @@
+package com.bookingparser.scrape;
+
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.source.ListingSource;
+import com.microsoft.playwright.Locator;
+import com.microsoft.playwright.Page;
+import com.microsoft.playwright.PlaywrightException;
+import com.microsoft.playwright.Response;
+import com.microsoft.playwright.TimeoutError;
+import com.microsoft.playwright.options.LoadState;
+
+import java.io.IOException;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Set;
+import java.util.regex.Pattern;
+
+/**
+ * Scrapes past reservations by listening to the responses that feed the reservations page instead
+ * of reading its rendered HTML. One navigation loads the first page of trips and every "load more"
+ * click the next, and each is one rate-limited request however many bookings it returns; there is
+ * no per-booking navigation. Records are taken from the captured XHR/GraphQL JSON with
+ * {@link ReservationJson}.
+ * <p>
+ * With a {@link SessionStore} the context starts from the last saved sign-in. Unless the cookies
+ * have expired locally, the scraper goes straight to the reservations page. That navigation is also
+ * the probe: only a redirect to sign-in costs a sign-in.
+ * <p>
+ * With a {@link PageCache} every response read is also stored, so a later {@code --offline} run
+ * can extract the same records again without signing in.
+ * <p>
+ * The page is opened lazily in the lease's context on the thread that runs {@link #fetch}, which
+ * keeps all Playwright calls on one thread.
+ */
+public class ReservationScraper extends ListingSource<BookingRaw> {
+	static final String SIGN_IN_URL = "https://account.booking.com/sign-in";
+	static final String RESERVATIONS_URL = "https://secure.booking.com/mytrips.html";
+	/** Responses worth reading: GraphQL and the trips/reservations endpoints. */
+	private static final Pattern FEED = Pattern.compile("graphql|/(my)?trips|reservation", Pattern.CASE_INSENSITIVE);
+	private static final String LOAD_MORE = "button:has-text(\"Load more\"), button:has-text(\"Show more\")";
+	private static final double SIGN_IN_TIMEOUT_MS = 60_000;
+
+	private final BrowserPool.Lease browser;
+	private final String account;
+	private final String email;
+	private final String password;
+	private final RateLimiters limiters;
+	private final SessionStore session; // nullable: always sign in
+	private final List<Response> captured = new ArrayList<>();
+	private final Set<String> seen = new HashSet<>();
+	private PageCache cache; // nullable
+	private Page page;
+	private long responses;
+	private boolean signedIn;
+
+	/** @param account limiter key for these credentials, {@link RateLimiters#DEFAULT_ACCOUNT} for the one from the environment */
+	public ReservationScraper(BrowserPool.Lease browser, String account, String email, String password, RateLimiters limiters,
+			SessionStore session) {
+		this.browser = browser;
+		this.account = account;
+		this.email = email;
+		this.password = password;
+		this.limiters = limiters;
+		this.session = session;
+	}
+
+	/** Stores every response read in {@code cache}; null turns it off. */
+	public ReservationScraper cacheTo(PageCache cache) {
+		this.cache = cache;
+		return this;
+	}
+
+	@Override
+	protected List<BookingRaw> page(int p) throws IOException, InterruptedException {
+		try {
+			if (p == 0) {
+				SessionStore.Status status = session == null ? SessionStore.Status.MISSING : session.check();
+				boolean reuse = status == SessionStore.Status.VALID || status == SessionStore.Status.UNKNOWN;
+				page = browser.context(reuse ? session.getFile() : null).newPage();
+				page.onResponse(this::capture);
+				if (!reuse) signIn();
+				captured.clear();
+				navigate(RESERVATIONS_URL);
+				if (reuse && onSignInPage()) {
+					signIn();
+					captured.clear();
+					navigate(RESERVATIONS_URL);
+				}
+			} else {
+				Locator more = page.locator(LOAD_MORE).first();
+				if (more.count() == 0 || !more.isVisible()) return List.of();
+				limiters.acquire(account, page.url());
+				more.click();
+				page.waitForLoadState(LoadState.NETWORKIDLE);
+			}
+			// a "load more" that brings nothing new ends the listing
+			return drain();
+		} catch (PlaywrightException e) {
+			throw new IOException("Reading reservations page " + p + " failed: " + e.getMessage(), e);
+		}
+	}
+
+	/** Signs in with the form and saves the resulting session. */
+	private void signIn() throws IOException, InterruptedException {
+		navigate(SIGN_IN_URL);
+		page.fill("input[name=username], input[type=email]", email);
+		limiters.acquire(account, page.url());
+		page.click("button[type=submit]");
+		page.fill("input[name=password], input[type=password]", password);
+		limiters.acquire(account, page.url());
+		page.click("button[type=submit]");
+		try {
+			page.waitForURL(u -> !u.contains("account.booking.com"), new Page.WaitForURLOptions().setTimeout(SIGN_IN_TIMEOUT_MS));
+		} catch (TimeoutError e) {
+			throw new IOException("Sign-in did not complete; a CAPTCHA or 2FA prompt may need --no-headless");
+		}
+		signedIn = true;
+		if (session == null) return;
+		try {
+			session.save(browser.context());
+		} catch (IOException e) {
+			// the export goes on; the next run just signs in again
+			System.err.println("Could not save " + session + ": " + e.getMessage());
+		}
+	}
+
+	private boolean onSignInPage() {
+		return page.url().contains("account.booking.com");
+	}
+
+	private void navigate(String url) throws InterruptedException {
+		limiters.acquire(account, url);
+		page.navigate(url);
+		page.waitForLoadState(LoadState.NETWORKIDLE);
+	}
+
+	/** Runs inside Playwright's event dispatch, so it only records the response; bodies are read in {@link #drain}. */
+	private void capture(Response r) {
+		String type = r.request().resourceType();
+		if (!type.equals("xhr") && !type.equals("fetch")) return;
+		String contentType = r.headers().get("content-type");
+		if (contentType == null || !contentType.contains("json") || !FEED.matcher(r.url()).find()) return;
+		captured.add(r);
+	}
+
+	private List<BookingRaw> drain() throws IOException {
+		List<BookingRaw> out = new ArrayList<>();
+		for (Response r : captured) {
+			String body;
+			try {
+				body = r.text();
+			} catch (PlaywrightException e) {
+				continue; // evicted or redirected; the page re-requests anything it needs
+			}
+			responses++;
+			if (cache != null) cache.put(account, r.url(), r.request().postData(), body);
+			List<BookingRaw> found;
+			try {
+				found = ReservationJson.extract(body);
+			} catch (IllegalArgumentException e) {
+				continue;
+			}
+			for (BookingRaw raw : found) {
+				if (seen.add(ReservationJson.key(raw))) out.add(raw);
+			}
+		}
+		captured.clear();
+		return out;
+	}
+
+	@Override
+	protected LocalDate startDate(BookingRaw entry) {
+		return ReservationJson.isoDate(entry.getStartDateText());
+	}
+
+	/** The JSON already carries every field, so there is nothing more to load. */
+	@Override
+	protected BookingRaw details(BookingRaw entry) {
+		return entry;
+	}
+
+	/** JSON responses read so far. */
+	public long responsesRead() {
+		return responses;
+	}
+
+	/** Whether this run had to sign in, i.e. no saved session was reused. */
+	public boolean signedIn() {
+		return signedIn;
+	}
+}
@@ -0,0 +1,141 @@
+package com.bookingparser.scrape;
+
+import com.google.gson.JsonElement;
+import com.google.gson.JsonObject;
+import com.google.gson.JsonParseException;
+import com.google.gson.JsonParser;
+import com.microsoft.playwright.BrowserContext;
+
+import java.io.IOException;
+import java.nio.file.AtomicMoveNotSupportedException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardCopyOption;
+import java.nio.file.attribute.PosixFilePermissions;
+import java.time.Duration;
+import java.time.Instant;
+import java.util.Locale;
+import java.util.Set;
+
+/**
+ * Playwright storage state (cookies and local storage) saved after a sign-in, so the next run can
+ * skip signing in. The file stays on this machine and is readable by its owner only where the file
+ * system supports it. {@link #check} reads cookie expiry from the file without any request, so a
+ * session known to be dead goes straight to sign-in and one that may be alive is tried first.
+ */
+public class SessionStore {
+	public enum Status {
+		/** No usable file. */
+		MISSING,
+		/** A sign-in cookie has expired or expires within a few minutes. */
+		EXPIRED,
+		/** Every sign-in cookie is persistent and unexpired. */
+		VALID,
+		/** Only session cookies, whose server-side lifetime is unknown; needs a probe. */
+		UNKNOWN
+	}
+
+	private static final Set<String> AUTH_COOKIES = Set.of("bkng", "bkng_sso_session", "bkng_sso_ses", "bkng_sso_auth");
+	private static final Duration MARGIN = Duration.ofMinutes(5);
+
+	private final Path file;
+
+	public SessionStore(Path file) {
+		this.file = file;
+	}
+
+	public Path getFile() { return file; }
+
+	public Status check() {
+		return check(Instant.now());
+	}
+
+	public Status check(Instant now) {
+		JsonObject state = read();
+		if (state == null || !state.has("cookies") || !state.get("cookies").isJsonArray()) return Status.MISSING;
+		boolean any = false, sessionOnly = false;
+		long deadline = now.plus(MARGIN).getEpochSecond();
+		for (JsonElement e : state.getAsJsonArray("cookies")) {
+			if (!e.isJsonObject()) continue;
+			JsonObject c = e.getAsJsonObject();
+			String name = string(c, "name"), domain = string(c, "domain");
+			if (name == null || domain == null || !domain.toLowerCase(Locale.ROOT).endsWith("booking.com") || !AUTH_COOKIES.contains(name)) continue;
+			any = true;
+			double expires = c.has("expires") && c.get("expires").isJsonPrimitive() ? c.get("expires").getAsDouble() : -1;
+			if (expires < 0) sessionOnly = true;
+			else if (expires < deadline) return Status.EXPIRED;
+		}
+		if (!any) return Status.UNKNOWN;
+		return sessionOnly ? Status.UNKNOWN : Status.VALID;
+	}
+
+	/**
+	 * Cookie header for a request to {@code host}: every saved cookie whose domain covers the host
+	 * and that has not expired. Empty when there is none.
+	 */
+	public String cookieHeader(String host, Instant now) {
+		JsonObject state = read();
+		if (state == null || !state.has("cookies") || !state.get("cookies").isJsonArray()) return "";
+		String h = host.toLowerCase(Locale.ROOT);
+		StringBuilder sb = new StringBuilder();
+		for (JsonElement e : state.getAsJsonArray("cookies")) {
+			if (!e.isJsonObject()) continue;
+			JsonObject c = e.getAsJsonObject();
+			String name = string(c, "name"), value = string(c, "value"), domain = string(c, "domain");
+			if (name == null || value == null || domain == null) continue;
+			String d = domain.toLowerCase(Locale.ROOT);
+			boolean matches = d.startsWith(".") ? h.endsWith(d) || h.equals(d.substring(1)) : h.equals(d);
+			double expires = c.has("expires") && c.get("expires").isJsonPrimitive() ? c.get("expires").getAsDouble() : -1;
+			if (!matches || (expires >= 0 && expires < now.getEpochSecond())) continue;
+			if (sb.length() > 0) sb.append("; ");
+			sb.append(name).append('=').append(value);
+		}
+		return sb.toString();
+	}
+
+	/** Writes {@code context}'s storage state, replacing the file in one step so readers never see half of it. */
+	public void save(BrowserContext context) throws IOException {
+		Path dir = file.toAbsolutePath().getParent();
+		Files.createDirectories(dir);
+		Path tmp = Files.createTempFile(dir, file.getFileName().toString(), ".tmp");
+		try {
+			try {
+				Files.setPosixFilePermissions(tmp, PosixFilePermissions.fromString("rw-------"));
+			} catch (UnsupportedOperationException e) {
+				// not a POSIX file system; the directory's permissions apply
+			}
+			context.storageState(new BrowserContext.StorageStateOptions().setPath(tmp));
+			try {
+				Files.move(tmp, file, StandardCopyOption.REPLACE_EXISTING, StandardCopyOption.ATOMIC_MOVE);
+			} catch (AtomicMoveNotSupportedException e) {
+				Files.move(tmp, file, StandardCopyOption.REPLACE_EXISTING);
+			}
+		} finally {
+			Files.deleteIfExists(tmp);
+		}
+	}
+
+	public void delete() throws IOException {
+		Files.deleteIfExists(file);
+	}
+
+	private JsonObject read() {
+		try {
+			if (!Files.isRegularFile(file)) return null;
+			JsonElement root = JsonParser.parseString(Files.readString(file));
+			return root.isJsonObject() ? root.getAsJsonObject() : null;
+		} catch (IOException | JsonParseException e) {
+			return null;
+		}
+	}
+
+	private static String string(JsonObject o, String key) {
+		JsonElement v = o.get(key);
+		return v != null && v.isJsonPrimitive() ? v.getAsString() : null;
+	}
+
+	@Override
+	public String toString() {
+		return "session " + file;
+	}
+}
@@ -0,0 +1,43 @@
+package com.bookingparser.server;
+
+import com.bookingparser.filter.Where;
+import com.bookingparser.scrape.Account;
+import com.bookingparser.source.DateRange;
+import com.bookingparser.source.ExportIndex;
+
+/** One export request, from {@link ExportServer} or one account of a batch. */
+public class ExportJob {
+	private final long id;
+	private final DateRange range;
+	private final Where where; // nullable
+	private final Account account; // nullable: the account from BOOKING_EMAIL / BOOKING_PASSWORD
+	private final ExportIndex index; // nullable: export everything
+
+	public ExportJob(long id, DateRange range, Where where) {
+		this(id, range, where, null);
+	}
+
+	public ExportJob(long id, DateRange range, Where where, Account account) {
+		this(id, range, where, account, null);
+	}
+
+	/** @param index what the account has exported before; the source then emits only new and changed reservations */
+	public ExportJob(long id, DateRange range, Where where, Account account, ExportIndex index) {
+		this.id = id;
+		this.range = range;
+		this.where = where;
+		this.account = account;
+		this.index = index;
+	}
+
+	public long getId() { return id; }
+	public DateRange getRange() { return range; }
+	public Where getWhere() { return where; }
+	public Account getAccount() { return account; }
+	public ExportIndex getIndex() { return index; }
+
+	@Override
+	public String toString() {
+		return "job " + id + (account == null ? "" : " " + account.getName()) + " [" + range + (where == null ? "" : " where " + where) + "]";
+	}
+}
@@ -0,0 +1,201 @@
+package com.bookingparser.server;
+
+import com.bookingparser.export.CsvEngine;
+import com.bookingparser.export.CsvSink;
+import com.bookingparser.export.Exporter;
+import com.bookingparser.export.FlushPolicy;
+import com.bookingparser.filter.Where;
+import com.bookingparser.model.BookingView;
+import com.bookingparser.pipeline.Pipeline;
+import com.bookingparser.pipeline.PipelineOptions;
+import com.bookingparser.pipeline.PipelineResult;
+import com.bookingparser.scrape.BrowserPool;
+import com.bookingparser.scrape.RateLimiter;
+import com.bookingparser.scrape.RateLimiters;
+import com.bookingparser.source.DateRange;
+import com.sun.net.httpserver.HttpExchange;
+import com.sun.net.httpserver.HttpServer;
+
+import java.io.BufferedWriter;
+import java.io.IOException;
+import java.io.InterruptedIOException;
+import java.io.OutputStream;
+import java.io.OutputStreamWriter;
+import java.net.InetSocketAddress;
+import java.net.URLDecoder;
+import java.nio.charset.StandardCharsets;
+import java.time.LocalDate;
+import java.time.format.DateTimeParseException;
+import java.util.HashMap;
+import java.util.Map;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.TimeUnit;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.concurrent.atomic.AtomicLong;
+import java.util.function.Predicate;
+import java.util.function.Supplier;
+
+/**
+ * Local HTTP front end for a long-running process that keeps the JVM, the browsers and the
+ * normalize caches warm between exports.
+ * <pre>
+ *   GET|POST /export?from=YYYY-MM-DD&amp;to=YYYY-MM-DD&amp;where=EXPR   streams text/csv as rows are produced
+ *   GET      /health                                            ok, running jobs, free browsers, limiter waits
+ * </pre>
+ * Jobs run concurrently, each on its own leased browser, and every job's requests go through the
+ * shared {@link RateLimiters}, so jobs for the same account and host split one budget. The server
+ * binds to the address it is given; use loopback.
+ * <p>
+ * The 200 and the first rows go out before the export has finished, so a job that fails later
+ * cannot change its status. Its connection is dropped instead, without the chunk that ends the
+ * body, and the client gets a read error rather than what looks like a complete, shorter CSV.
+ */
+public class ExportServer implements AutoCloseable {
+	private final HttpServer server;
+	private final ExecutorService executor;
+	private final BrowserPool browsers; // nullable: sources that need no browser
+	private final RateLimiters limiters;
+	private final SourceFactory sources;
+	private final Supplier<PipelineOptions> options;
+	private final AtomicLong ids = new AtomicLong();
+	private final AtomicInteger running = new AtomicInteger();
+
+	public ExportServer(InetSocketAddress address, BrowserPool browsers, RateLimiters limiters, SourceFactory sources,
+			Supplier<PipelineOptions> options) throws IOException {
+		this.browsers = browsers;
+		this.limiters = limiters;
+		this.sources = sources;
+		this.options = options;
+		this.executor = Executors.newCachedThreadPool(r -> {
+			Thread t = new Thread(r, "export-server");
+			t.setDaemon(true);
+			return t;
+		});
+		this.server = HttpServer.create(address, 0);
+		server.setExecutor(executor);
+		server.createContext("/export", this::export);
+		server.createContext("/health", this::health);
+	}
+
+	public void start() {
+		server.start();
+	}
+
+	public InetSocketAddress getAddress() {
+		return server.getAddress();
+	}
+
+	private void health(HttpExchange ex) throws IOException {
+		StringBuilder body = new StringBuilder("ok jobs=").append(running.get());
+		if (browsers != null) body.append(" browsers=").append(browsers.available()).append('/').append(browsers.size());
+		body.append('\n');
+		for (RateLimiter l : limiters.all()) body.append(l).append('\n');
+		respond(ex, 200, body.toString());
+	}
+
+	private void export(HttpExchange ex) throws IOException {
+		String method = ex.getRequestMethod();
+		if (!method.equals("GET") && !method.equals("POST")) {
+			respond(ex, 405, "Use GET or POST\n");
+			return;
+		}
+		Map<String, String> q = query(ex.getRequestURI().getRawQuery());
+		ExportJob job;
+		try {
+			DateRange range = DateRange.of(date(q.get("from")), date(q.get("to")));
+			String where = q.get("where");
+			job = new ExportJob(ids.incrementAndGet(), range, where == null || where.isBlank() ? null : Where.compile(where));
+		} catch (IllegalArgumentException | DateTimeParseException e) {
+			respond(ex, 400, e.getMessage() + "\n");
+			return;
+		}
+		running.incrementAndGet();
+		try {
+			run(job, ex);
+		} finally {
+			running.decrementAndGet();
+		}
+		// not reached when run throws: closing would end the chunked body as if the export were complete
+		ex.close();
+	}
+
+	/** Streams {@code job} as CSV; throws once the response has started, leaving the server to drop the connection. */
+	private void run(ExportJob job, HttpExchange ex) throws IOException {
+		long t0 = System.nanoTime();
+		BrowserPool.Lease lease = null;
+		try {
+			if (browsers != null) lease = browsers.acquire();
+		} catch (InterruptedException e) {
+			Thread.currentThread().interrupt();
+			respond(ex, 503, "Server is shutting down\n");
+			return;
+		} catch (IllegalStateException e) {
+			respond(ex, 503, "Server is shutting down\n");
+			return;
+		}
+		try {
+			PipelineOptions opts = options.get();
+			Predicate<BookingView> filter = b -> job.getRange().contains(b.getStartDate());
+			if (job.getWhere() != null) {
+				opts.rawFilter(job.getWhere().rawFilter());
+				filter = filter.and(job.getWhere().residual());
+			}
+			ex.getResponseHeaders().set("Content-Type", "text/csv; charset=utf-8");
+			ex.sendResponseHeaders(200, 0); // chunked: rows go out as they are written
+			OutputStream body = ex.getResponseBody();
+			// closed only on success; see export
+			CsvSink sink = Exporter.open(new BufferedWriter(new OutputStreamWriter(body, StandardCharsets.UTF_8)),
+				FlushPolicy.everyRowsOrMillis(64, 500), CsvEngine.FAST);
+			PipelineResult r = new Pipeline(opts).run(sources.open(job, lease, limiters), job.getRange(), filter, sink);
+			sink.close();
+			System.err.printf("%s: wrote %d rows, %d rejects in %.1fs%s%n", job, r.getWritten(), r.getRejects().size(), (System.nanoTime() - t0) / 1e9,
+				lease == null ? "" : "; " + lease.blockStats());
+		} catch (InterruptedException e) {
+			Thread.currentThread().interrupt();
+			System.err.println(job + ": interrupted");
+			throw new InterruptedIOException(job + " interrupted");
+		} catch (IOException | RuntimeException e) {
+			// headers are gone; the server drops the connection and the client sees the response cut short
+			System.err.println(job + ": failed: " + e);
+			throw e;
+		} finally {
+			if (lease != null) lease.close();
+		}
+	}
+
+	private static LocalDate date(String v) {
+		return v == null || v.isBlank() ? null : LocalDate.parse(v);
+	}
+
+	private static Map<String, String> query(String raw) {
+		Map<String, String> out = new HashMap<>();
+		if (raw == null || raw.isEmpty()) return out;
+		for (String pair : raw.split("&")) {
+			int eq = pair.indexOf('=');
+			String key = URLDecoder.decode(eq < 0 ? pair : pair.substring(0, eq), StandardCharsets.UTF_8);
+			String value = eq < 0 ? "" : URLDecoder.decode(pair.substring(eq + 1), StandardCharsets.UTF_8);
+			out.put(key, value);
+		}
+		return out;
+	}
+
+	private static void respond(HttpExchange ex, int status, String body) throws IOException {
+		byte[] bytes = body.getBytes(StandardCharsets.UTF_8);
+		ex.getResponseHeaders().set("Content-Type", "text/plain; charset=utf-8");
+		ex.sendResponseHeaders(status, bytes.length);
+		try {
+			ex.getResponseBody().write(bytes);
+		} finally {
+			ex.close();
+		}
+	}
+
+	/** Stops accepting jobs and gives running ones a few seconds to finish. */
+	@Override
+	public void close() throws InterruptedException {
+		server.stop(0);
+		executor.shutdown();
+		if (!executor.awaitTermination(5, TimeUnit.SECONDS)) executor.shutdownNow();
+	}
+}
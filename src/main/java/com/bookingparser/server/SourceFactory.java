@@ -0,0 +1,17 @@
+package com.bookingparser.server;
+
+import com.bookingparser.scrape.BrowserPool;
+import com.bookingparser.scrape.RateLimiters;
+import com.bookingparser.source.ReservationSource;
+
+import java.io.IOException;
+
+/**
+ * Builds the reservation source for a job from the browser leased to it. The source must take a
+ * permit from {@code limiters}, keyed by the job's account and the target host, before every
+ * navigation or fetch.
+ */
+@FunctionalInterface
+public interface SourceFactory {
+	ReservationSource open(ExportJob job, BrowserPool.Lease browser, RateLimiters limiters) throws IOException;
+}
@@ -0,0 +1,47 @@
+package com.bookingparser.source;
+
+import java.time.LocalDate;
+
+/** Inclusive check-in date range for a run; either end may be open (null). */
+public final class DateRange {
+	public static final DateRange ALL = new DateRange(null, null);
+
+	private final LocalDate from;
+	private final LocalDate to;
+
+	private DateRange(LocalDate from, LocalDate to) {
+		this.from = from;
+		this.to = to;
+	}
+
+	public static DateRange of(LocalDate from, LocalDate to) {
+		if (from == null && to == null) return ALL;
+		if (from != null && to != null && from.isAfter(to)) throw new IllegalArgumentException("Range start " + from + " is after its end " + to);
+		return new DateRange(from, to);
+	}
+
+	public LocalDate getFrom() { return from; }
+	public LocalDate getTo() { return to; }
+
+	public boolean isAll() {
+		return from == null && to == null;
+	}
+
+	public boolean contains(LocalDate date) {
+		return !isBefore(date) && !isAfter(date);
+	}
+
+	/** True when {@code date} is older than the range; newest-first listings can stop here. */
+	public boolean isBefore(LocalDate date) {
+		return from != null && date.isBefore(from);
+	}
+
+	public boolean isAfter(LocalDate date) {
+		return to != null && date.isAfter(to);
+	}
+
+	@Override
+	public String toString() {
+		return (from == null ? "" : from.toString()) + ".." + (to == null ? "" : to.toString());
+	}
+}
@@ -0,0 +1,165 @@
+package com.bookingparser.source;
+
+import com.bookingparser.model.BookingRaw;
+
+import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.file.AtomicMoveNotSupportedException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardCopyOption;
+import java.util.Arrays;
+import java.util.HashMap;
+import java.util.Map;
+
+/**
+ * Reservations already exported for one account, for incremental runs. Each reservation is a pair
+ * of 64-bit hashes: its identity (hotel, check-in, check-out; the site's own ids are not exposed
+ * to every source) and its content (every raw field), so a changed price or address shows up as
+ * changed rather than as seen. On disk the pairs are sorted by identity in one flat binary file,
+ * read with a single read and searched by binary search; tens of thousands of entries load in a
+ * few milliseconds.
+ * <p>
+ * {@link #check} only classifies a record. Rows are added with {@link #record} once the output has
+ * them, so records dropped by normalization or a filter are not taken as exported, and nothing
+ * reaches the file until {@link #save}, which callers run once the export has been committed.
+ */
+public class ExportIndex {
+	private static final int MAGIC = 0x42504958; // "BPIX"
+	private static final int HEADER = Integer.BYTES * 2;
+	private static final int ENTRY = Long.BYTES * 2;
+	private static final long FNV_OFFSET = 0xcbf29ce484222325L;
+	private static final long FNV_PRIME = 0x100000001b3L;
+
+	public enum State {
+		NEW,
+		CHANGED,
+		/** Exported by an earlier run in this form. */
+		UNCHANGED,
+		/** Already checked in this run, e.g. by a source retrying after a fallback. */
+		REPEATED
+	}
+
+	private final long[] ids;    // sorted
+	private final long[] hashes; // parallel to ids
+	private final Map<Long, Long> checked = new HashMap<>(); // seen by check in this run
+	private final Map<Long, Long> pending = new HashMap<>();  // recorded, for save
+	private int added;
+	private int changed;
+
+	private ExportIndex(long[] ids, long[] hashes) {
+		this.ids = ids;
+		this.hashes = hashes;
+	}
+
+	public static ExportIndex empty() {
+		return new ExportIndex(new long[0], new long[0]);
+	}
+
+	/** Where the index of {@code account} lives in {@code dir}; every account has its own. */
+	public static Path file(Path dir, String account) {
+		return dir.resolve(account.replaceAll("[^A-Za-z0-9._-]", "_") + ".idx");
+	}
+
+	/** The index in {@code file}, or an empty one if there is no file yet. */
+	public static ExportIndex load(Path file) throws IOException {
+		if (!Files.exists(file)) return empty();
+		ByteBuffer buf = ByteBuffer.wrap(Files.readAllBytes(file));
+		if (buf.remaining() < HEADER || buf.getInt() != MAGIC) throw new IOException("Not an export index: " + file);
+		int n = buf.getInt();
+		if (n < 0 || buf.remaining() != (long) n * ENTRY) throw new IOException("Truncated export index: " + file);
+		long[] ids = new long[n], hashes = new long[n];
+		for (int i = 0; i < n; i++) {
+			ids[i] = buf.getLong();
+			hashes[i] = buf.getLong();
+		}
+		return new ExportIndex(ids, hashes);
+	}
+
+	/** Whether {@code raw} was exported before and in this form. Nothing is remembered for {@link #save}; see {@link #record}. */
+	public synchronized State check(BookingRaw raw) {
+		long id = id(raw), hash = contentHash(raw);
+		Long mine = checked.get(id);
+		if (mine != null && mine == hash) return State.REPEATED;
+		int i = Arrays.binarySearch(ids, id);
+		if (i >= 0 && hashes[i] == hash) return State.UNCHANGED;
+		// same stay, different content within one run: the latest wins
+		checked.put(id, hash);
+		return i >= 0 ? State.CHANGED : State.NEW;
+	}
+
+	/** Marks {@code raw} as exported, to be written by {@link #save}; call it only for rows that reached the output. */
+	public synchronized void record(BookingRaw raw) {
+		long id = id(raw), hash = contentHash(raw);
+		Long before = pending.put(id, hash);
+		if (before != null) return;
+		int i = Arrays.binarySearch(ids, id);
+		if (i < 0) added++;
+		else if (hashes[i] != hash) changed++;
+	}
+
+	/** Writes the loaded entries merged with everything passed to {@link #record}, replacing {@code file} atomically. */
+	public synchronized void save(Path file) throws IOException {
+		Map<Long, Long> merged = new HashMap<>(pending);
+		for (int i = 0; i < ids.length; i++) merged.putIfAbsent(ids[i], hashes[i]);
+		long[] keys = new long[merged.size()];
+		int k = 0;
+		for (long id : merged.keySet()) keys[k++] = id;
+		Arrays.sort(keys);
+		ByteBuffer buf = ByteBuffer.allocate(HEADER + keys.length * ENTRY);
+		buf.putInt(MAGIC).putInt(keys.length);
+		for (long id : keys) buf.putLong(id).putLong(merged.get(id));
+		Path dir = file.toAbsolutePath().getParent();
+		Files.createDirectories(dir);
+		Path tmp = Files.createTempFile(dir, file.getFileName().toString(), ".tmp");
+		try {
+			Files.write(tmp, buf.array());
+			try {
+				Files.move(tmp, file, StandardCopyOption.REPLACE_EXISTING, StandardCopyOption.ATOMIC_MOVE);
+			} catch (AtomicMoveNotSupportedException e) {
+				Files.move(tmp, file, StandardCopyOption.REPLACE_EXISTING);
+			}
+		} finally {
+			Files.deleteIfExists(tmp);
+		}
+	}
+
+	/** Entries loaded from disk. */
+	public int size() {
+		return ids.length;
+	}
+
+	public synchronized int getAdded() { return added; }
+	public synchronized int getChanged() { return changed; }
+
+	@Override
+	public synchronized String toString() {
+		return "index: " + ids.length + " previously exported, " + added + " new, " + changed + " changed";
+	}
+
+	static long id(BookingRaw raw) {
+		return fnv(FNV_OFFSET, raw.getHotelName(), raw.getStartDateText(), raw.getEndDateText());
+	}
+
+	static long contentHash(BookingRaw raw) {
+		return fnv(FNV_OFFSET, raw.getHotelName(), raw.getAddressText(), raw.getCityText(), raw.getCountryText(),
+			raw.getStartDateText(), raw.getEndDateText(), raw.getTotalPriceText());
+	}
+
+	/** 64-bit FNV-1a over the fields, with a separator so ("ab", "c") and ("a", "bc") differ; null hashes apart from "". */
+	private static long fnv(long h, String... fields) {
+		for (String f : fields) {
+			if (f == null) {
+				h = (h ^ 0xff) * FNV_PRIME;
+			} else {
+				for (int i = 0; i < f.length(); i++) {
+					char c = f.charAt(i);
+					h = (h ^ (c & 0xff)) * FNV_PRIME;
+					h = (h ^ (c >>> 8)) * FNV_PRIME;
+				}
+			}
+			h = (h ^ 0x1f) * FNV_PRIME;
+		}
+		return h;
+	}
+}
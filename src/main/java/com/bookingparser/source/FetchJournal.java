@@ -0,0 +1,210 @@
+package com.bookingparser.source;
+
+import com.bookingparser.model.BookingRaw;
+
+import java.io.ByteArrayInputStream;
+import java.io.ByteArrayOutputStream;
+import java.io.DataInputStream;
+import java.io.DataOutputStream;
+import java.io.IOException;
+import java.nio.ByteBuffer;
+import java.nio.channels.FileChannel;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardOpenOption;
+import java.nio.file.attribute.PosixFilePermissions;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.List;
+import java.util.concurrent.TimeUnit;
+import java.util.zip.CRC32;
+
+/**
+ * Checkpoints of a running fetch, so an export interrupted by a crash can pick up where it stopped
+ * ({@code --resume}) instead of starting over. The journal is append-only: a header naming the run,
+ * then one frame per emitted record and one per finished listing page (the cursor). Each frame
+ * carries a CRC; reading stops at the first torn or corrupt frame, and the journal is cut there.
+ * <p>
+ * Frames are buffered and written with one write per page, so a crashed JVM or browser loses at
+ * most the page in progress. The fsync is batched: the file is forced to disk at most every
+ * {@link #SYNC_INTERVAL_MS} ms and on close, not once per page, which would cost more than the
+ * pages themselves. Only a power loss can lose that last interval.
+ */
+public class FetchJournal implements AutoCloseable {
+	public static final long SYNC_INTERVAL_MS = 2_000;
+	private static final int MAGIC = 0x42504a4c; // "BPJL"
+	private static final byte HEADER = 'H';
+	private static final byte RECORD = 'R';
+	private static final byte PAGE = 'P';
+	/** Type, length and CRC around each payload. */
+	private static final int FRAME = 1 + Integer.BYTES * 2;
+	/** Buffered frames beyond this are written out without waiting for the end of the page. */
+	private static final int FLUSH_BYTES = 64 * 1024;
+
+	private final Path file;
+	private final FileChannel channel;
+	private final List<BookingRaw> records;
+	private final int cursor;
+	private final ByteArrayOutputStream buffer = new ByteArrayOutputStream();
+	private long lastSync = System.nanoTime();
+	private long appended;
+	private long syncs;
+
+	private FetchJournal(Path file, FileChannel channel, List<BookingRaw> records, int cursor) {
+		this.file = file;
+		this.channel = channel;
+		this.records = records;
+		this.cursor = cursor;
+	}
+
+	/**
+	 * Opens the journal for the run described by {@code run}. With {@code resume}, a journal left by
+	 * the same run is kept and its checkpoints are available; otherwise, or when the journal belongs
+	 * to another run, it is started over.
+	 */
+	public static FetchJournal open(Path file, String run, boolean resume) throws IOException {
+		Files.createDirectories(file.toAbsolutePath().getParent());
+		List<BookingRaw> records = new ArrayList<>();
+		int cursor = -1;
+		int good = -1; // end of the last intact frame; -1 starts over
+		if (resume && Files.exists(file)) {
+			ByteBuffer buf = ByteBuffer.wrap(Files.readAllBytes(file));
+			while (buf.remaining() >= FRAME) {
+				byte type = buf.get();
+				int length = buf.getInt();
+				if (length < 0 || buf.remaining() < length + Integer.BYTES) break; // torn last frame
+				byte[] payload = new byte[length];
+				buf.get(payload);
+				if (buf.getInt() != crc(type, payload)) break;
+				DataInputStream in = new DataInputStream(new ByteArrayInputStream(payload));
+				try {
+					if (good < 0) {
+						// the first frame must be this run's header
+						if (type != HEADER || in.readInt() != MAGIC || !run.equals(in.readUTF())) break;
+					} else if (type == RECORD) {
+						records.add(new BookingRaw(str(in), str(in), str(in), str(in), str(in), str(in), str(in)));
+					} else if (type == PAGE) {
+						cursor = in.readInt();
+					} else {
+						break;
+					}
+				} catch (IOException e) {
+					break;
+				}
+				good = buf.position();
+			}
+		}
+		FileChannel channel = FileChannel.open(file, StandardOpenOption.CREATE, StandardOpenOption.WRITE);
+		try {
+			Files.setPosixFilePermissions(file, PosixFilePermissions.fromString("rw-------"));
+		} catch (UnsupportedOperationException e) {
+			// not a POSIX file system; the directory's permissions apply
+		}
+		if (good < 0) {
+			channel.truncate(0);
+			FetchJournal journal = new FetchJournal(file, channel, List.of(), -1);
+			ByteArrayOutputStream header = new ByteArrayOutputStream();
+			DataOutputStream out = new DataOutputStream(header);
+			out.writeInt(MAGIC);
+			out.writeUTF(run);
+			journal.append(HEADER, header.toByteArray(), true);
+			return journal;
+		}
+		// cut off whatever followed the last intact frame, then append after it
+		channel.truncate(good);
+		channel.position(good);
+		return new FetchJournal(file, channel, Collections.unmodifiableList(records), cursor);
+	}
+
+	private static int crc(byte type, byte[] payload) {
+		CRC32 crc = new CRC32();
+		crc.update(type);
+		crc.update(payload);
+		return (int) crc.getValue();
+	}
+
+	/** Records checkpointed by the interrupted run, in the order they were emitted; empty when not resuming. */
+	public List<BookingRaw> getRecords() { return records; }
+
+	/** Last listing page the interrupted run finished, or -1. */
+	public int getCursor() { return cursor; }
+
+	public boolean isResumed() {
+		return cursor >= 0 || !records.isEmpty();
+	}
+
+	/** Checkpoints a record that has been emitted. */
+	public synchronized void record(BookingRaw raw) throws IOException {
+		ByteArrayOutputStream bytes = new ByteArrayOutputStream(128);
+		DataOutputStream out = new DataOutputStream(bytes);
+		str(out, raw.getHotelName());
+		str(out, raw.getAddressText());
+		str(out, raw.getCityText());
+		str(out, raw.getCountryText());
+		str(out, raw.getStartDateText());
+		str(out, raw.getEndDateText());
+		str(out, raw.getTotalPriceText());
+		append(RECORD, bytes.toByteArray(), false);
+	}
+
+	/** Checkpoints the cursor: listing page {@code page} and everything before it is done. */
+	public synchronized void pageDone(int page) throws IOException {
+		append(PAGE, ByteBuffer.allocate(Integer.BYTES).putInt(page).array(), true);
+	}
+
+	private void append(byte type, byte[] payload, boolean boundary) throws IOException {
+		DataOutputStream out = new DataOutputStream(buffer);
+		out.writeByte(type);
+		out.writeInt(payload.length);
+		out.write(payload);
+		out.writeInt(crc(type, payload));
+		appended++;
+		if (boundary || buffer.size() >= FLUSH_BYTES) write();
+		if (System.nanoTime() - lastSync >= TimeUnit.MILLISECONDS.toNanos(SYNC_INTERVAL_MS)) sync();
+	}
+
+	private void write() throws IOException {
+		ByteBuffer buf = ByteBuffer.wrap(buffer.toByteArray());
+		while (buf.hasRemaining()) channel.write(buf);
+		buffer.reset();
+	}
+
+	private void sync() throws IOException {
+		write();
+		channel.force(false);
+		lastSync = System.nanoTime();
+		syncs++;
+	}
+
+	/** Writes and forces whatever is buffered; the journal stays on disk for a later {@code --resume}. */
+	@Override
+	public synchronized void close() throws IOException {
+		if (!channel.isOpen()) return;
+		try {
+			sync();
+		} finally {
+			channel.close();
+		}
+	}
+
+	/** Closes and removes the journal, once the export it protects has been written. */
+	public synchronized void delete() throws IOException {
+		close();
+		Files.deleteIfExists(file);
+	}
+
+	private static void str(DataOutputStream out, String s) throws IOException {
+		out.writeBoolean(s != null);
+		if (s != null) out.writeUTF(s);
+	}
+
+	private static String str(DataInputStream in) throws IOException {
+		return in.readBoolean() ? in.readUTF() : null;
+	}
+
+	@Override
+	public synchronized String toString() {
+		String s = "journal: " + appended + " frames, " + syncs + " fsyncs";
+		return isResumed() ? s + ", resumed " + records.size() + " records after page " + cursor : s;
+	}
+}
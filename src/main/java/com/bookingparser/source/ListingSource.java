@@ -0,0 +1,169 @@
+package com.bookingparser.source;
+
+import com.bookingparser.model.BookingRaw;
+
+import java.io.IOException;
+import java.lang.management.ManagementFactory;
+import java.lang.management.ThreadMXBean;
+import java.time.LocalDate;
+import java.util.HashSet;
+import java.util.List;
+import java.util.Set;
+
+/**
+ * Base for sources that page through a reservation listing and fetch each entry's details with
+ * another request. Entries whose listed check-in date falls outside the range never get a detail
+ * fetch, and a newest-first listing stops paging at the first entry older than the range.
+ * <p>
+ * With an {@link ExportIndex} the source is incremental: records exported before and unchanged are
+ * not emitted, and paging stops at the first page that brings nothing new, since the listing
+ * puts recent stays first. The source only reads the index; rows are recorded in it by whoever
+ * writes them, see {@link ExportIndex#record}.
+ * <p>
+ * With a {@link FetchJournal} every emitted record and every finished page is checkpointed. A
+ * resumed fetch first emits the journaled records again, then continues after the last finished
+ * page if the source is {@link #seekable}, or from the first page otherwise, without emitting the
+ * same stays twice.
+ *
+ * @param <L> one entry of the listing as the subclass reads it
+ */
+public abstract class ListingSource<L> implements ReservationSource {
+	private static final ThreadMXBean THREADS = ManagementFactory.getThreadMXBean();
+
+	private ExportIndex index; // nullable: export everything
+	private FetchJournal journal; // nullable: no checkpoints
+	private long pages;
+	private long skipped;
+	private long unchanged;
+	private long records;
+	private long wallNanos;
+	private long cpuNanos;
+
+	/** Entries on listing page {@code page}, counting from 0; an empty list ends the listing. */
+	protected abstract List<L> page(int page) throws IOException, InterruptedException;
+
+	/** Check-in date shown on the listing entry, or null when the listing does not show one. */
+	protected abstract LocalDate startDate(L entry);
+
+	/** Loads the full record behind a listing entry. */
+	protected abstract BookingRaw details(L entry) throws IOException, InterruptedException;
+
+	/** Makes the next fetch incremental against {@code index}; null turns it off. */
+	public ListingSource<L> incremental(ExportIndex index) {
+		this.index = index;
+		return this;
+	}
+
+	/** Checkpoints the next fetch to {@code journal}, resuming from it if it holds an interrupted run; null turns it off. */
+	public ListingSource<L> checkpointTo(FetchJournal journal) {
+		this.journal = journal;
+		return this;
+	}
+
+	/** Whether {@link #page} can be asked for any page without reading the ones before it, so a resumed fetch can skip them. */
+	protected boolean seekable() {
+		return false;
+	}
+
+	/** Checkpoints a record the subclass emitted outside the listing, e.g. from a fallback source. */
+	protected void checkpoint(BookingRaw raw) throws IOException {
+		if (journal != null) journal.record(raw);
+	}
+
+	/** Whether the listing is sorted by check-in date, newest first. */
+	protected boolean newestFirst() {
+		return false;
+	}
+
+	@Override
+	public void fetch(DateRange range, Emitter out) throws IOException, InterruptedException {
+		long t0 = System.nanoTime(), cpu0 = cpuTime();
+		try {
+			list(range, out);
+		} finally {
+			wallNanos += System.nanoTime() - t0;
+			cpuNanos += cpuTime() - cpu0;
+		}
+	}
+
+	private void list(DateRange range, Emitter out) throws IOException, InterruptedException {
+		Set<Long> resumed = new HashSet<>();
+		int first = 0;
+		if (journal != null && journal.isResumed()) {
+			for (BookingRaw raw : journal.getRecords()) {
+				if (!resumed.add(ExportIndex.id(raw))) continue;
+				// seen in this run, so a fallback reading them again takes them as repeated
+				if (index != null) index.check(raw);
+				out.emit(raw);
+				records++;
+			}
+			if (seekable()) first = journal.getCursor() + 1;
+		}
+		for (int p = first; ; p++) {
+			List<L> entries = page(p);
+			pages++;
+			if (entries.isEmpty()) return;
+			int old = 0, fresh = 0;
+			for (L entry : entries) {
+				LocalDate start = startDate(entry);
+				if (start != null && !range.contains(start)) {
+					skipped++;
+					if (newestFirst() && range.isBefore(start)) return;
+					continue;
+				}
+				BookingRaw raw = details(entry);
+				if (resumed.contains(ExportIndex.id(raw))) continue;
+				if (index != null) {
+					ExportIndex.State state = index.check(raw);
+					if (state == ExportIndex.State.REPEATED) continue;
+					if (state == ExportIndex.State.UNCHANGED) {
+						old++;
+						unchanged++;
+						continue;
+					}
+				}
+				fresh++;
+				out.emit(raw);
+				records++;
+				checkpoint(raw);
+			}
+			if (journal != null) journal.pageDone(p);
+			if (old > 0 && fresh == 0) return;
+		}
+	}
+
+	private static long cpuTime() {
+		return THREADS.isCurrentThreadCpuTimeSupported() ? THREADS.getCurrentThreadCpuTime() : 0;
+	}
+
+	/** Listing pages requested so far. */
+	public long pagesFetched() {
+		return pages;
+	}
+
+	/** Entries passed over without a detail fetch because they were out of range. */
+	public long detailsSkipped() {
+		return skipped;
+	}
+
+	/** Records passed over because the index has them in the same form. */
+	public long recordsUnchanged() {
+		return unchanged;
+	}
+
+	/** Records emitted so far. */
+	public long recordsEmitted() {
+		return records;
+	}
+
+	/**
+	 * Pages per second and CPU per record of the thread running {@link #fetch}, for comparing
+	 * sources. Work done in other processes, such as a browser, is not included.
+	 */
+	@Override
+	public String toString() {
+		double secs = wallNanos / 1e9;
+		return String.format("%s: %d pages, %d records, %d skipped, %d unchanged, %.2f pages/s, %.0f us CPU per record", getClass().getSimpleName(),
+			pages, records, skipped, unchanged, secs > 0 ? pages / secs : 0.0, records > 0 ? cpuNanos / 1e3 / records : 0.0);
+	}
+}
@@ -0,0 +1,193 @@
+package com.bookingparser.source;
+
+import com.bookingparser.model.BookingRaw;
+import com.google.gson.stream.JsonReader;
+import com.google.gson.stream.JsonToken;
+import org.apache.commons.csv.CSVFormat;
+import org.apache.commons.csv.CSVParser;
+import org.apache.commons.csv.CSVRecord;
+
+import java.io.BufferedReader;
+import java.io.IOException;
+import java.io.InputStream;
+import java.io.InputStreamReader;
+import java.io.StringReader;
+import java.io.UncheckedIOException;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.Arrays;
+import java.util.HashMap;
+import java.util.List;
+import java.util.Locale;
+import java.util.Map;
+import java.util.zip.GZIPInputStream;
+
+/**
+ * Raw reservations from a dump written by other tools: JSON Lines (one object per line) or CSV
+ * with a header row, optionally gzip-compressed ({@code .gz}). The file is streamed record by
+ * record, so memory does not grow with its size. Field names are matched loosely:
+ * {@code hotelName}, {@code hotel_name} and {@code Hotel name} are the same, and the column names
+ * of this tool's own CSV are understood too. Unknown fields are ignored.
+ * <p>
+ * A JSON line that is not an object is counted as malformed and skipped. Missing fields are left
+ * to normalization, which rejects the record.
+ */
+public class RawFileSource implements ReservationSource {
+	public enum Format { JSONL, CSV }
+
+	private static final int HOTEL = 0, ADDRESS = 1, CITY = 2, COUNTRY = 3, START = 4, END = 5, PRICE = 6;
+	/** Field names with case and punctuation removed, to the BookingRaw field they fill. */
+	private static final Map<String, Integer> FIELDS = new HashMap<>();
+
+	static {
+		alias(HOTEL, "hotelname", "hotel", "name", "propertyname");
+		alias(ADDRESS, "addresstext", "address");
+		alias(CITY, "citytext", "city");
+		alias(COUNTRY, "countrytext", "country");
+		alias(START, "startdatetext", "startdate", "start", "checkin", "checkindate");
+		alias(END, "enddatetext", "enddate", "end", "checkout", "checkoutdate");
+		alias(PRICE, "totalpricetext", "totalprice", "totalpriceofbooking", "price");
+	}
+
+	private static void alias(int field, String... names) {
+		for (String n : names) FIELDS.put(n, field);
+	}
+
+	private final Path file;
+	private final Format format;
+	private long records;
+	private long malformed;
+	private String firstError;
+	private long wallNanos;
+
+	/** Reads {@code file} in the format its name says ({@code .jsonl}, {@code .ndjson}, {@code .json} or {@code .csv}, each optionally {@code .gz}). */
+	public RawFileSource(Path file) {
+		this(file, detect(file));
+	}
+
+	public RawFileSource(Path file, Format format) {
+		this.file = file;
+		this.format = format;
+	}
+
+	static Format detect(Path file) {
+		String name = file.getFileName().toString().toLowerCase(Locale.ROOT);
+		if (name.endsWith(".gz")) name = name.substring(0, name.length() - 3);
+		if (name.endsWith(".csv")) return Format.CSV;
+		if (name.endsWith(".jsonl") || name.endsWith(".ndjson") || name.endsWith(".json")) return Format.JSONL;
+		throw new IllegalArgumentException("Cannot tell the format of " + file + " from its name; expected .jsonl, .ndjson or .csv");
+	}
+
+	/** The range is left to the filter stage: dumps are not sorted, and dating a record means normalizing it. */
+	@Override
+	public void fetch(DateRange range, Emitter out) throws IOException, InterruptedException {
+		long t0 = System.nanoTime();
+		try (BufferedReader in = open()) {
+			if (format == Format.CSV) readCsv(in, out);
+			else readJsonLines(in, out);
+		} finally {
+			wallNanos += System.nanoTime() - t0;
+		}
+	}
+
+	private BufferedReader open() throws IOException {
+		InputStream in = Files.newInputStream(file);
+		try {
+			if (file.getFileName().toString().toLowerCase(Locale.ROOT).endsWith(".gz")) in = new GZIPInputStream(in, 1 << 16);
+		} catch (IOException e) {
+			in.close();
+			throw e;
+		}
+		return new BufferedReader(new InputStreamReader(in, StandardCharsets.UTF_8), 1 << 16);
+	}
+
+	private void readJsonLines(BufferedReader in, Emitter out) throws IOException, InterruptedException {
+		long lineNo = 0;
+		for (String line; (line = in.readLine()) != null; ) {
+			lineNo++;
+			if (line.isBlank()) continue;
+			String[] f = new String[7];
+			try (JsonReader json = new JsonReader(new StringReader(line))) {
+				json.beginObject();
+				while (json.hasNext()) {
+					Integer field = FIELDS.get(key(json.nextName()));
+					JsonToken t = json.peek();
+					if (field != null && (t == JsonToken.STRING || t == JsonToken.NUMBER)) {
+						f[field] = json.nextString();
+					} else {
+						json.skipValue(); // nulls, nested values and unknown fields
+					}
+				}
+				json.endObject();
+				if (json.peek() != JsonToken.END_DOCUMENT) throw new IOException("trailing data after the object");
+			} catch (IOException | IllegalStateException e) {
+				// Gson reports syntax errors as MalformedJsonException and a wrong token as IllegalStateException
+				malformed(file + ":" + lineNo + ": " + e.getMessage());
+				continue;
+			}
+			emit(f, out);
+		}
+	}
+
+	private void readCsv(BufferedReader in, Emitter out) throws IOException, InterruptedException {
+		CSVFormat csv = CSVFormat.DEFAULT.builder().setHeader().setSkipHeaderRecord(true).setIgnoreEmptyLines(true).build();
+		try (CSVParser parser = csv.parse(in)) {
+			List<String> header = parser.getHeaderNames();
+			int[] column = new int[7];
+			Arrays.fill(column, -1);
+			for (int i = 0; i < header.size(); i++) {
+				Integer field = FIELDS.get(key(header.get(i)));
+				if (field != null && column[field] < 0) column[field] = i;
+			}
+			if (column[HOTEL] < 0 || column[START] < 0) throw new IOException(file + ": no hotel name or start date column in " + header);
+			for (CSVRecord r : parser) {
+				String[] f = new String[7];
+				for (int k = 0; k < 7; k++) {
+					if (column[k] >= 0 && column[k] < r.size()) f[k] = r.get(column[k]);
+				}
+				emit(f, out);
+			}
+		} catch (UncheckedIOException e) {
+			// commons-csv reports a broken record (e.g. an unterminated quote) from inside the iterator
+			throw new IOException(file + ": " + e.getCause().getMessage(), e.getCause());
+		}
+	}
+
+	private void emit(String[] f, Emitter out) throws InterruptedException {
+		for (int k = 0; k < f.length; k++) {
+			if (f[k] != null && f[k].isBlank()) f[k] = null;
+		}
+		out.emit(new BookingRaw(f[HOTEL], f[ADDRESS], f[CITY], f[COUNTRY], f[START], f[END], f[PRICE]));
+		records++;
+	}
+
+	private void malformed(String error) {
+		if (malformed++ == 0) firstError = error;
+	}
+
+	private static String key(String name) {
+		StringBuilder sb = new StringBuilder(name.length());
+		for (int i = 0; i < name.length(); i++) {
+			char c = name.charAt(i);
+			if (Character.isLetterOrDigit(c)) sb.append(Character.toLowerCase(c));
+		}
+		return sb.toString();
+	}
+
+	public long recordsRead() {
+		return records;
+	}
+
+	/** Lines skipped because they were not JSON objects. */
+	public long malformedLines() {
+		return malformed;
+	}
+
+	@Override
+	public String toString() {
+		double secs = wallNanos / 1e9;
+		String s = String.format("%s: %,d records from %s, %,.0f records/s", getClass().getSimpleName(), records, file, secs > 0 ? records / secs : 0.0);
+		return malformed == 0 ? s : s + String.format(", %,d malformed lines skipped (first: %s)", malformed, firstError);
+	}
+}
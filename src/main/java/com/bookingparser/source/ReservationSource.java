@@ -0,0 +1,36 @@
+package com.bookingparser.source;
+
+import com.bookingparser.model.BookingRaw;
+
+import java.io.IOException;
+
+/**
+ * Producer of raw reservations (scraper, email fallback, ...). Records are pushed to the emitter as
+ * soon as they are read, so downstream stages can work while the next page is still being fetched.
+ */
+public interface ReservationSource {
+	/** Receives records from a source; may block when the consumer is behind. */
+	@FunctionalInterface
+	interface Emitter {
+		void emit(BookingRaw raw) throws InterruptedException;
+	}
+
+	/**
+	 * Pushes reservations to {@code out} and returns when the source is exhausted. Sources should use
+	 * {@code range} to avoid requests for records outside it; records they cannot date cheaply may
+	 * still be emitted and are filtered after normalization.
+	 */
+	void fetch(DateRange range, Emitter out) throws IOException, InterruptedException;
+
+	/** Source that yields nothing. */
+	static ReservationSource empty() {
+		return (range, out) -> {};
+	}
+
+	/** Source over records already in memory, in iteration order; the range is left to the filter stage. */
+	static ReservationSource of(Iterable<BookingRaw> raws) {
+		return (range, out) -> {
+			for (BookingRaw raw : raws) out.emit(raw);
+		};
+	}
+}
@@ -0,0 +1,62 @@
+package com.bookingparser;
+
+import com.bookingparser.batch.AccountManifest;
+import com.bookingparser.batch.AccountResult;
+import com.bookingparser.batch.BatchExporter;
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.pipeline.PipelineOptions;
+import com.bookingparser.scrape.Account;
+import com.bookingparser.scrape.RateLimiters;
+import com.bookingparser.source.DateRange;
+import com.bookingparser.source.ReservationSource;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+import java.io.IOException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.util.List;
+import java.util.Map;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class BatchExportTest {
+	@Test
+	void testManifestCredentialsFromSecretsThenEnv(@TempDir Path dir) throws Exception {
+		Path manifest = Files.writeString(dir.resolve("accounts.txt"), "# team\nalice\n\nbob.smith  " + dir.resolve("b/out.csv") + "\n");
+		Path secrets = Files.writeString(dir.resolve("secrets.properties"), "alice.email=a@example.com\nalice.password=pw-a\n");
+		List<Account> accounts = AccountManifest.read(manifest, secrets, dir.resolve("out"),
+			Map.of("BOOKING_EMAIL_BOB_SMITH", "b@example.com", "BOOKING_PASSWORD_BOB_SMITH", "pw-b", "BOOKING_EMAIL_ALICE", "ignored@example.com"));
+		assertEquals(2, accounts.size());
+		assertEquals("a@example.com", accounts.get(0).getEmail());
+		assertEquals(dir.resolve("out/alice.csv"), accounts.get(0).getOutput());
+		assertEquals("pw-b", accounts.get(1).getPassword());
+		assertEquals(dir.resolve("b/out.csv"), accounts.get(1).getOutput());
+		assertFalse(accounts.get(0).toString().contains("pw-a"));
+
+		Path missing = Files.writeString(dir.resolve("missing.txt"), "carol\n");
+		IllegalArgumentException e = assertThrows(IllegalArgumentException.class, () -> AccountManifest.read(missing, null, dir, Map.of()));
+		assertTrue(e.getMessage().contains("BOOKING_EMAIL_CAROL"), e.getMessage());
+	}
+
+	@Test
+	void testAccountsRunIsolatedAndFailuresStayLocal(@TempDir Path dir) throws Exception {
+		List<BookingRaw> raws = BatchNormalizeTest.corpus(50);
+		List<Account> accounts = List.of(
+			new Account("a", "a@example.com", "x", dir.resolve("a.csv")),
+			new Account("b", "b@example.com", "x", dir.resolve("b.csv")),
+			new Account("c", "c@example.com", "x", dir.resolve("c.csv")));
+		BatchExporter exporter = new BatchExporter(null, (job, browser, limiters) -> {
+			if (job.getAccount().getName().equals("b")) return (range, out) -> { throw new IOException("login failed"); };
+			return ReservationSource.of(raws);
+		}, new RateLimiters(1, 1, null), () -> new PipelineOptions().normalizeThreads(1), 2);
+		List<AccountResult> results = exporter.run(accounts, DateRange.ALL, null);
+
+		assertEquals(List.of("a", "b", "c"), results.stream().map(r -> r.getAccount().getName()).toList());
+		assertTrue(results.get(0).isOk());
+		assertFalse(results.get(1).isOk());
+		assertTrue(results.get(1).getError().contains("login failed"));
+		assertEquals(results.get(0).getWritten(), results.get(2).getWritten());
+		assertEquals(Files.readString(dir.resolve("a.csv")), Files.readString(dir.resolve("c.csv")));
+	}
+}
@@ -0,0 +1,61 @@
+package com.bookingparser;
+
+import com.bookingparser.model.BookingNormalized;
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.normalize.BatchOptions;
+import com.bookingparser.normalize.BatchResult;
+import com.bookingparser.normalize.NormalizeException;
+import com.bookingparser.normalize.NormalizerUtil;
+import org.junit.jupiter.api.Test;
+
+import java.util.ArrayList;
+import java.util.List;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class BatchNormalizeTest {
+	static List<BookingRaw> corpus(int n) {
+		List<BookingRaw> raws = new ArrayList<>();
+		for (int i = 0; i < n; i++) {
+			String price = i % 97 == 0 ? "on request" : (100 + i % 500) + ".50 EUR";
+			String start = i % 89 == 0 ? "someday" : "2024-0" + (1 + i % 9) + "-1" + (i % 10);
+			raws.add(new BookingRaw("Hotel " + i, i + " Main St, City" + (i % 50) + ", Country" + (i % 7),
+				null, null, start, "2024-12-31", price));
+		}
+		return raws;
+	}
+
+	@Test
+	void testBatchMatchesSerial() {
+		List<BookingRaw> raws = corpus(5000);
+		List<BookingNormalized> serial = new ArrayList<>();
+		for (BookingRaw r : raws) {
+			try { serial.add(NormalizerUtil.normalize(r)); } catch (NormalizeException ignored) {}
+		}
+		BatchResult batch = NormalizerUtil.normalizeAll(raws, new BatchOptions().parallelism(4).chunkSize(256));
+		assertEquals(serial.size(), batch.getAccepted().size());
+		for (int i = 0; i < serial.size(); i++) {
+			assertArrayEquals(serial.get(i).toCsvRow(), batch.getAccepted().get(i).toCsvRow());
+		}
+		assertEquals(raws.size(), serial.size() + batch.getRejects().size());
+	}
+
+	@Test
+	void testRejectsCarryFieldAndReason() {
+		BatchResult batch = NormalizerUtil.normalizeAll(corpus(200), new BatchOptions().parallelism(1));
+		var first = batch.getRejects().get(0);
+		assertEquals(0, first.getIndex());
+		assertEquals("startDate", first.getField());
+		assertTrue(first.getReason().contains("someday"));
+		assertTrue(batch.getRejects().stream().anyMatch(r -> r.getField().equals("totalPrice")));
+	}
+
+	@Test
+	void testUnorderedKeepsEveryRecord() {
+		List<BookingRaw> raws = corpus(3000);
+		BatchResult ordered = NormalizerUtil.normalizeAll(raws, new BatchOptions().parallelism(3).chunkSize(100));
+		BatchResult unordered = NormalizerUtil.normalizeAll(raws, new BatchOptions().parallelism(3).chunkSize(100).preserveOrder(false));
+		assertEquals(ordered.getAccepted().size(), unordered.getAccepted().size());
+		assertEquals(ordered.getRejects().size(), unordered.getRejects().size());
+	}
+}
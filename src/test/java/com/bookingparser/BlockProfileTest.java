@@ -0,0 +1,32 @@
+package com.bookingparser;
+
+import com.bookingparser.scrape.BlockProfile;
+import org.junit.jupiter.api.Test;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class BlockProfileTest {
+	@Test
+	void testDefaults() {
+		BlockProfile p = BlockProfile.defaults();
+		assertTrue(p.blocks("image", "https://cf.bstatic.com/xdata/images/hotel/max500/1.jpg"));
+		assertTrue(p.blocks("font", "https://cf.bstatic.com/static/fonts/a.woff2"));
+		assertTrue(p.blocks("script", "https://www.googletagmanager.com/gtm.js?id=X"));
+		assertTrue(p.blocks("image", "https://maps.googleapis.com/maps/api/staticmap"));
+		assertFalse(p.blocks("xhr", "https://secure.booking.com/dml/graphql"));
+		assertFalse(p.blocks("document", "https://secure.booking.com/mytrips.html"));
+		assertFalse(p.blocks("stylesheet", "https://cf.bstatic.com/static/css/main.css"));
+	}
+
+	@Test
+	void testConfigure() {
+		BlockProfile p = BlockProfile.defaults().types("none").url("/tracking/");
+		assertFalse(p.blocks("image", "https://cf.bstatic.com/a.jpg"));
+		assertTrue(p.blocks("xhr", "https://secure.booking.com/tracking/event"));
+		assertTrue(p.blocks("script", "https://connect.facebook.net/en_US/fbevents.js"));
+		assertTrue(BlockProfile.defaults().types("image, stylesheet").blocks("stylesheet", "https://x/a.css"));
+		assertThrows(IllegalArgumentException.class, () -> BlockProfile.defaults().types("image,xhr"));
+		assertTrue(BlockProfile.NONE.isNone());
+		assertFalse(BlockProfile.NONE.blocks("image", "https://www.google-analytics.com/collect"));
+	}
+}
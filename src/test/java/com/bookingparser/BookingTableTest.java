@@ -0,0 +1,55 @@
+package com.bookingparser;
+
+import com.bookingparser.model.BookingNormalized;
+import com.bookingparser.model.BookingTable;
+import com.bookingparser.model.BookingView;
+import com.bookingparser.model.Price;
+import org.junit.jupiter.api.Test;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.List;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class BookingTableTest {
+	private static BookingNormalized booking(String city, String start, String price, String currency) {
+		return new BookingNormalized(city, "Country", "Hotel " + city, LocalDate.parse(start), LocalDate.parse(start).plusDays(2),
+			new Price(new BigDecimal(price), currency));
+	}
+
+	@Test
+	void testRowsRoundTrip() {
+		List<BookingNormalized> list = List.of(
+			booking("Paris", "2024-05-10", "250.00", "EUR"),
+			booking("Tokyo", "2023-01-02", "52800", "JPY"),
+			booking("Kuwait", "2022-03-04", "120.125", "KWD"),
+			booking("Rome", "2021-07-08", "1.234", "EUR"),
+			booking("Paris", "2020-09-10", "99.5", null),
+			booking("Oslo", "2019-11-12", "123456789012345678.90", "NOK")
+		);
+		BookingTable table = BookingTable.from(list);
+		assertEquals(list.size(), table.size());
+		int i = 0;
+		for (BookingView row : table) {
+			assertArrayEquals(list.get(i).toCsvRow(), row.toCsvRow());
+			assertEquals(list.get(i).getTotalPrice(), row.getTotalPrice());
+			i++;
+		}
+		assertNull(table.currency(4));
+	}
+
+	@Test
+	void testFilterUsesEpochDays() {
+		BookingTable table = BookingTable.from(List.of(
+			booking("A", "2024-01-01", "1", "EUR"),
+			booking("B", "2024-02-01", "2", "EUR"),
+			booking("C", "2024-03-01", "3", "EUR")
+		));
+		int lo = (int) LocalDate.parse("2024-01-15").toEpochDay();
+		BookingTable later = table.filter(r -> table.startEpochDay(r) >= lo);
+		assertEquals(2, later.size());
+		assertEquals("B", later.city(0));
+		assertEquals("3 EUR", later.price(1).toString());
+	}
+}
@@ -0,0 +1,68 @@
+package com.bookingparser;
+
+import com.bookingparser.normalize.ClockCache;
+import com.bookingparser.normalize.NormalizeCache;
+import org.junit.jupiter.api.Test;
+
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class ClockCacheTest {
+	@Test
+	void testCountersAndEviction() {
+		ClockCache<String, Integer> c = new ClockCache<>(2);
+		c.put("a", 1);
+		c.put("b", 2);
+		assertEquals(1, c.get("a"));
+		c.put("c", 3); // "b" was not referenced since insert, so it goes first
+		assertNull(c.get("b"));
+		assertEquals(1, c.get("a"));
+		assertEquals(3, c.get("c"));
+		assertEquals(2, c.size());
+		assertEquals(3, c.hits());
+		assertEquals(1, c.misses());
+		assertEquals(1, c.evictions());
+	}
+
+	@Test
+	void testNormalizeCacheMemoizesFields() {
+		NormalizeCache cache = new NormalizeCache(16);
+		assertEquals(LocalDate.of(2024,1,12), cache.parseDate("12 Jan 2024"));
+		assertEquals(LocalDate.of(2024,1,12), cache.parseDate("12 Jan 2024"));
+		assertEquals(1, cache.dates().hits());
+
+		String[] cc = cache.extractCityCountry("1 Rue, Paris, France", null, null);
+		cc[0] = "changed";
+		assertEquals("Paris", cache.extractCityCountry("1 Rue, Paris, France", "", "")[0]);
+		assertThrows(IllegalArgumentException.class, () -> cache.parsePrice("n/a"));
+		assertEquals(0, cache.prices().size());
+	}
+
+	@Test
+	void testConcurrentAccessStaysBounded() throws Exception {
+		ClockCache<Integer, Integer> c = new ClockCache<>(64);
+		ExecutorService pool = Executors.newFixedThreadPool(4);
+		try {
+			List<Future<?>> futures = new ArrayList<>();
+			for (int t = 0; t < 4; t++) {
+				futures.add(pool.submit(() -> {
+					for (int i = 0; i < 10_000; i++) {
+						int k = i % 200;
+						assertEquals(k * 2, c.get(k, x -> x * 2));
+					}
+				}));
+			}
+			for (Future<?> f : futures) f.get();
+		} finally {
+			pool.shutdown();
+		}
+		assertTrue(c.size() <= 64);
+		assertEquals(40_000, c.hits() + c.misses());
+	}
+}
@@ -0,0 +1,92 @@
+package com.bookingparser;
+
+import com.bookingparser.export.Exporter;
+import com.bookingparser.model.BookingNormalized;
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.normalize.NormalizeException;
+import com.bookingparser.normalize.NormalizerUtil;
+import com.bookingparser.pipeline.PipelineOptions;
+import com.bookingparser.scrape.RateLimiters;
+import com.bookingparser.server.ExportServer;
+import com.bookingparser.source.ReservationSource;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+import java.io.IOException;
+import java.net.InetAddress;
+import java.net.InetSocketAddress;
+import java.net.URI;
+import java.net.URLEncoder;
+import java.net.http.HttpClient;
+import java.net.http.HttpRequest;
+import java.net.http.HttpResponse;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.CompletableFuture;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class ExportServerTest {
+	@Test
+	void testConcurrentJobsStreamCsv(@TempDir Path dir) throws Exception {
+		List<BookingRaw> raws = BatchNormalizeTest.corpus(500);
+		List<BookingNormalized> expected = new ArrayList<>();
+		for (BookingRaw r : raws) {
+			try {
+				BookingNormalized b = NormalizerUtil.normalize(r);
+				if (!b.getStartDate().isBefore(LocalDate.of(2024, 6, 1)) && b.getCountry().equals("Country3")) expected.add(b);
+			} catch (NormalizeException ignored) {}
+		}
+		String csv = Files.readString(Exporter.writeCsv(expected, dir.resolve("expected.csv")));
+
+		try (ExportServer server = new ExportServer(new InetSocketAddress(InetAddress.getLoopbackAddress(), 0), null,
+				new RateLimiters(1000, 10, null), (job, browser, limiters) -> ReservationSource.of(raws), () -> new PipelineOptions().normalizeThreads(2))) {
+			server.start();
+			String base = "http://127.0.0.1:" + server.getAddress().getPort();
+			HttpClient client = HttpClient.newHttpClient();
+			HttpRequest export = HttpRequest.newBuilder(URI.create(base + "/export?from=2024-06-01&where="
+				+ URLEncoder.encode("country = Country3", StandardCharsets.UTF_8))).build();
+			List<CompletableFuture<HttpResponse<String>>> jobs = new ArrayList<>();
+			for (int i = 0; i < 3; i++) jobs.add(client.sendAsync(export, HttpResponse.BodyHandlers.ofString()));
+			for (CompletableFuture<HttpResponse<String>> job : jobs) {
+				HttpResponse<String> r = job.get();
+				assertEquals(200, r.statusCode());
+				assertEquals(csv, r.body());
+			}
+
+			HttpResponse<String> bad = client.send(HttpRequest.newBuilder(URI.create(base + "/export?where=" +
+				URLEncoder.encode("nights >", StandardCharsets.UTF_8))).build(), HttpResponse.BodyHandlers.ofString());
+			assertEquals(400, bad.statusCode());
+			assertTrue(bad.body().contains("expected a value"), bad.body());
+
+			HttpResponse<String> health = client.send(HttpRequest.newBuilder(URI.create(base + "/health")).build(), HttpResponse.BodyHandlers.ofString());
+			assertEquals(200, health.statusCode());
+			assertTrue(health.body().startsWith("ok jobs="), health.body());
+		}
+	}
+
+	@Test
+	void testFailedJobIsNotAShortCsv() throws Exception {
+		List<BookingRaw> raws = BatchNormalizeTest.corpus(500);
+		ReservationSource failing = (range, out) -> {
+			for (BookingRaw r : raws) out.emit(r);
+			throw new IOException("page 6 failed");
+		};
+		try (ExportServer server = new ExportServer(new InetSocketAddress(InetAddress.getLoopbackAddress(), 0), null,
+				new RateLimiters(1000, 10, null), (job, browser, limiters) -> failing, () -> new PipelineOptions().normalizeThreads(2))) {
+			server.start();
+			String base = "http://127.0.0.1:" + server.getAddress().getPort();
+			HttpClient client = HttpClient.newHttpClient();
+			HttpRequest export = HttpRequest.newBuilder(URI.create(base + "/export")).build();
+			// the 200 may already be out, but the body must not read as complete
+			assertThrows(IOException.class, () -> client.send(export, HttpResponse.BodyHandlers.ofString()));
+
+			HttpResponse<String> health = client.send(HttpRequest.newBuilder(URI.create(base + "/health")).build(), HttpResponse.BodyHandlers.ofString());
+			assertTrue(health.body().startsWith("ok jobs=0"), health.body());
+		}
+	}
+}
@@ -0,0 +1,101 @@
+package com.bookingparser;
+
+import com.bookingparser.export.CsvEngine;
+import com.bookingparser.export.CsvSink;
+import com.bookingparser.export.Exporter;
+import com.bookingparser.export.FlushPolicy;
+import com.bookingparser.model.BookingNormalized;
+import com.bookingparser.model.BookingTable;
+import com.bookingparser.model.Price;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+import java.math.BigDecimal;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.time.LocalDate;
+import java.util.List;
+import java.util.stream.IntStream;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class ExporterTest {
+	private static BookingNormalized booking(int i) {
+		return new BookingNormalized("City " + i, "Country", "Hotel, \"" + i + "\"", LocalDate.of(2024,1,1).plusDays(i),
+			LocalDate.of(2024,1,3).plusDays(i), new Price(new BigDecimal(i + ".50"), "EUR"));
+	}
+
+	@Test
+	void testStreamingMatchesListWriter(@TempDir Path dir) throws Exception {
+		List<BookingNormalized> list = IntStream.range(0, 250).mapToObj(ExporterTest::booking).toList();
+		Path viaList = Exporter.writeCsv(list, dir.resolve("list.csv"));
+		Path viaTable = Exporter.writeCsv(BookingTable.from(list), dir.resolve("table.csv"));
+		Path viaStream = dir.resolve("stream.csv");
+		try (CsvSink sink = Exporter.open(viaStream, FlushPolicy.everyRows(100))) {
+			sink.writeAll(list.stream());
+			assertEquals(250, sink.rowsWritten());
+			sink.commit();
+		}
+		String expected = Files.readString(viaList);
+		assertTrue(expected.startsWith("City,Country,Hotel name,Start date,End date,Total price of booking\r\n"));
+		assertEquals(expected, Files.readString(viaTable));
+		assertEquals(expected, Files.readString(viaStream));
+	}
+
+	@Test
+	void testFastEngineMatchesCommons(@TempDir Path dir) throws Exception {
+		LocalDate d = LocalDate.of(2024, 2, 29);
+		List<BookingNormalized> list = List.of(
+			new BookingNormalized("", "", "", d, d, new Price(new BigDecimal("0"), null)),
+			new BookingNormalized(null, "Türkiye", "Çırağan", d, d.plusDays(2), new Price(new BigDecimal("1500"), "JPY")),
+			new BookingNormalized("#1 City", " Lead", "Trail ", d, d, new Price(new BigDecimal("12.345"), "KWD")),
+			new BookingNormalized("Kraków", "Polska", "Say \"hi\", then\nleave\r", d, d, new Price(new BigDecimal("-0.05"), "PLN")),
+			new BookingNormalized("Évian", "France", "\"", d, d, new Price(new BigDecimal("99999999999999999999.99"), "EUR")),
+			new BookingNormalized("Zürich", "Schweiz", "Hotel\tSpa\t", d, d, new Price(new BigDecimal("1.5"), "CHF")));
+		Path commons = dir.resolve("commons.csv");
+		Path fast = dir.resolve("fast.csv");
+		try (CsvSink sink = Exporter.open(commons, FlushPolicy.onClose(), CsvEngine.COMMONS)) {
+			sink.writeAll(list.iterator());
+			sink.writeAll(BookingTable.from(list));
+		}
+		try (CsvSink sink = Exporter.open(fast, FlushPolicy.onClose(), CsvEngine.FAST)) {
+			sink.writeAll(list.iterator());
+			sink.writeAll(BookingTable.from(list));
+			sink.commit();
+		}
+		assertEquals(Files.readString(commons), Files.readString(fast));
+	}
+
+	@Test
+	void testRowsReachDiskOnFlushPolicy(@TempDir Path dir) throws Exception {
+		Path out = dir.resolve("rows.csv");
+		try (CsvSink sink = Exporter.open(out, FlushPolicy.everyRows(2))) {
+			sink.write(booking(1));
+			sink.write(booking(2));
+			assertEquals(3, Files.readAllLines(Exporter.partial(out)).size());
+			assertFalse(Files.exists(out));
+			sink.commit();
+		}
+		assertEquals(3, Files.readAllLines(out).size());
+		assertFalse(Files.exists(Exporter.partial(out)));
+		assertFalse(Files.exists(Exporter.progress(out)));
+	}
+
+	@Test
+	void testFailedExportLeavesPartialAndProgress(@TempDir Path dir) throws Exception {
+		Path out = dir.resolve("rows.csv");
+		Files.writeString(out, "previous export\n");
+		try (CsvSink sink = Exporter.open(out, FlushPolicy.everyRows(2))) {
+			for (int i = 0; i < 5; i++) sink.write(booking(i));
+			// the run fails here: no commit
+		}
+		assertEquals("previous export\n", Files.readString(out));
+		List<String> lines = Files.readAllLines(Exporter.partial(out));
+		assertEquals(6, lines.size());
+		assertEquals(String.join(",", Exporter.HEADER), lines.get(0));
+		String progress = Files.readString(Exporter.progress(out));
+		assertTrue(progress.contains("\"state\":\"incomplete\""), progress);
+		assertTrue(progress.contains("\"rows\":5,"), progress);
+		assertTrue(progress.contains("\"bytes\":" + Files.size(Exporter.partial(out)) + ","), progress);
+	}
+}
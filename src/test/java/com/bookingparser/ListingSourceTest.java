@@ -0,0 +1,228 @@
+package com.bookingparser;
+
+import com.bookingparser.export.CsvSink;
+import com.bookingparser.export.Exporter;
+import com.bookingparser.export.FlushPolicy;
+import com.bookingparser.filter.Where;
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.model.BookingView;
+import com.bookingparser.pipeline.Pipeline;
+import com.bookingparser.pipeline.PipelineOptions;
+import com.bookingparser.source.DateRange;
+import com.bookingparser.source.ExportIndex;
+import com.bookingparser.source.FetchJournal;
+import com.bookingparser.source.ListingSource;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+import java.io.IOException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardOpenOption;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.function.Predicate;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class ListingSourceTest {
+	/** 10 pages of 10 stays, one every 30 days going back from 2024-12-01. */
+	private static class FakeListing extends ListingSource<LocalDate> {
+		private final boolean newestFirst;
+		final List<LocalDate> detailed = new ArrayList<>();
+		final List<Integer> requested = new ArrayList<>();
+		int crashAt = -1;
+		boolean seekable;
+
+		FakeListing(boolean newestFirst) {
+			this.newestFirst = newestFirst;
+		}
+
+		@Override
+		protected List<LocalDate> page(int page) throws IOException {
+			requested.add(page);
+			if (page == crashAt) throw new IOException("browser crashed");
+			List<LocalDate> entries = new ArrayList<>();
+			for (int i = 0; page < 10 && i < 10; i++) {
+				int n = page * 10 + i;
+				entries.add(LocalDate.of(2024, 12, 1).minusDays(30L * (newestFirst ? n : 99 - n)));
+			}
+			return entries;
+		}
+
+		@Override
+		protected LocalDate startDate(LocalDate entry) {
+			return entry;
+		}
+
+		@Override
+		protected BookingRaw details(LocalDate entry) {
+			detailed.add(entry);
+			return new BookingRaw("Hotel", null, "City", "Country", entry.toString(), entry.plusDays(2).toString(), "100 EUR");
+		}
+
+		@Override
+		protected boolean newestFirst() {
+			return newestFirst;
+		}
+
+		@Override
+		protected boolean seekable() {
+			return seekable;
+		}
+	}
+
+	@Test
+	void testNewestFirstStopsPastFrom() throws Exception {
+		FakeListing source = new FakeListing(true);
+		List<BookingRaw> out = new ArrayList<>();
+		source.fetch(DateRange.of(LocalDate.of(2024, 6, 1), null), out::add);
+		assertEquals(7, out.size());
+		assertEquals(1, source.pagesFetched());
+		assertEquals(1, source.detailsSkipped());
+	}
+
+	@Test
+	void testUnsortedSkipsDetailsOutsideRange() throws Exception {
+		FakeListing source = new FakeListing(false);
+		List<BookingRaw> out = new ArrayList<>();
+		DateRange range = DateRange.of(LocalDate.of(2024, 6, 1), LocalDate.of(2024, 9, 30));
+		source.fetch(range, out::add);
+		assertEquals(11, source.pagesFetched());
+		assertEquals(out.size(), source.detailed.size());
+		assertTrue(source.detailed.stream().allMatch(range::contains));
+		assertEquals(100, out.size() + source.detailsSkipped());
+	}
+
+	@Test
+	void testIncrementalStopsAtExportedPage(@TempDir Path dir) throws Exception {
+		Path file = dir.resolve("default.idx");
+		ExportIndex first = ExportIndex.load(file);
+		List<BookingRaw> out = new ArrayList<>();
+		new FakeListing(true).incremental(first).fetch(DateRange.ALL, out::add);
+		assertEquals(100, out.size());
+		out.forEach(first::record);
+		first.save(file);
+
+		ExportIndex second = ExportIndex.load(file);
+		assertEquals(100, second.size());
+		out.clear();
+		FakeListing again = new FakeListing(true);
+		again.incremental(second).fetch(DateRange.ALL, out::add);
+		assertTrue(out.isEmpty());
+		assertEquals(1, again.pagesFetched());
+		assertEquals(10, again.recordsUnchanged());
+
+		BookingRaw stay = new BookingRaw("Hotel", null, "City", "Country", "2024-12-01", "2024-12-03", "100 EUR");
+		BookingRaw repriced = new BookingRaw("Hotel", null, "City", "Country", "2024-12-01", "2024-12-03", "90 EUR");
+		BookingRaw later = new BookingRaw("Hotel", null, "City", "Country", "2025-01-10", "2025-01-12", "100 EUR");
+		assertEquals(ExportIndex.State.UNCHANGED, second.check(stay));
+		assertEquals(ExportIndex.State.CHANGED, second.check(repriced));
+		assertEquals(ExportIndex.State.NEW, second.check(later));
+		assertEquals(ExportIndex.State.REPEATED, second.check(later));
+	}
+
+	@Test
+	void testIncrementalRecordsOnlyWrittenRows(@TempDir Path dir) throws Exception {
+		Path file = dir.resolve("default.idx");
+		BookingRaw kept = new BookingRaw("Lutetia", null, "Paris", "France", "2024-05-01", "2024-05-03", "100 EUR");
+		BookingRaw rejected = new BookingRaw("Ritz", null, "Paris", "France", "soon", "2024-05-03", "100 EUR");
+		BookingRaw filtered = new BookingRaw("Hassler", null, "Rome", "Italy", "2024-05-01", "2024-05-03", "100 EUR");
+		Where france = Where.compile("country = France");
+
+		ExportIndex first = ExportIndex.load(file);
+		assertEquals(3, export(dir.resolve("first.csv"), first, france, kept, rejected, filtered).recordsEmitted());
+		first.save(file);
+		assertEquals(1, first.getAdded());
+
+		// the rejected and the filtered out stay were never written, so they are still new
+		ExportIndex second = ExportIndex.load(file);
+		assertEquals(1, second.size());
+		ListingSource<BookingRaw> again = export(dir.resolve("second.csv"), second, null, kept, rejected, filtered);
+		assertEquals(2, again.recordsEmitted());
+		assertEquals(1, again.recordsUnchanged());
+		assertEquals(2, Files.readAllLines(dir.resolve("second.csv")).size());
+		second.save(file);
+		assertEquals(2, ExportIndex.load(file).size());
+	}
+
+	/** Runs a one-page listing of {@code stays} through the pipeline against {@code index}, recording written rows in it. */
+	private static ListingSource<BookingRaw> export(Path csv, ExportIndex index, Where where, BookingRaw... stays) throws Exception {
+		ListingSource<BookingRaw> source = new ListingSource<BookingRaw>() {
+			@Override
+			protected List<BookingRaw> page(int page) {
+				return page == 0 ? List.of(stays) : List.of();
+			}
+
+			@Override
+			protected LocalDate startDate(BookingRaw entry) {
+				return null;
+			}
+
+			@Override
+			protected BookingRaw details(BookingRaw entry) {
+				return entry;
+			}
+		}.incremental(index);
+		PipelineOptions options = new PipelineOptions().normalizeThreads(2).onWritten(index::record);
+		Predicate<BookingView> filter = b -> true;
+		if (where != null) {
+			options.rawFilter(where.rawFilter());
+			filter = where.residual();
+		}
+		try (CsvSink sink = Exporter.open(csv, FlushPolicy.onClose())) {
+			new Pipeline(options).run(source, filter, sink);
+			sink.commit();
+		}
+		return source;
+	}
+
+	@Test
+	void testResumeFromJournal(@TempDir Path dir) throws Exception {
+		Path file = dir.resolve("default.journal");
+		List<BookingRaw> out = new ArrayList<>();
+		FakeListing crashed = new FakeListing(true);
+		crashed.crashAt = 4;
+		try (FetchJournal journal = FetchJournal.open(file, "http ..", false)) {
+			assertThrows(IOException.class, () -> crashed.checkpointTo(journal).fetch(DateRange.ALL, out::add));
+		}
+		assertEquals(40, out.size());
+		// a torn frame at the end is cut off
+		Files.write(file, new byte[] {'R', 0, 0, 1}, StandardOpenOption.APPEND);
+
+		out.clear();
+		FakeListing resumed = new FakeListing(true);
+		resumed.seekable = true;
+		try (FetchJournal journal = FetchJournal.open(file, "http ..", true)) {
+			assertTrue(journal.isResumed());
+			assertEquals(3, journal.getCursor());
+			assertEquals(40, journal.getRecords().size());
+			resumed.checkpointTo(journal).fetch(DateRange.ALL, out::add);
+		}
+		assertEquals(100, out.size());
+		assertEquals(100, out.stream().map(BookingRaw::getStartDateText).distinct().count());
+		assertEquals(List.of(4, 5, 6, 7, 8, 9, 10), resumed.requested);
+
+		// without seeking, finished pages are read again but their stays are not emitted twice
+		out.clear();
+		FakeListing crashedAgain = new FakeListing(true);
+		crashedAgain.crashAt = 2;
+		try (FetchJournal journal = FetchJournal.open(file, "browser ..", false)) {
+			assertThrows(IOException.class, () -> crashedAgain.checkpointTo(journal).fetch(DateRange.ALL, out::add));
+		}
+		out.clear();
+		FakeListing rescan = new FakeListing(true);
+		try (FetchJournal journal = FetchJournal.open(file, "browser ..", true)) {
+			rescan.checkpointTo(journal).fetch(DateRange.ALL, out::add);
+		}
+		assertEquals(100, out.size());
+		assertEquals(100, out.stream().map(BookingRaw::getStartDateText).distinct().count());
+		assertEquals(0, rescan.requested.get(0));
+
+		// checkpoints of a run with other options are not resumed
+		try (FetchJournal journal = FetchJournal.open(file, "browser 2024-01-01..", true)) {
+			assertFalse(journal.isResumed());
+		}
+	}
+}
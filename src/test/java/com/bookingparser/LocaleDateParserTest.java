@@ -0,0 +1,71 @@
+package com.bookingparser;
+
+import com.bookingparser.normalize.LocaleDateParser;
+import org.junit.jupiter.api.Test;
+
+import java.time.LocalDate;
+import java.time.Month;
+import java.time.format.DateTimeFormatter;
+import java.util.ArrayList;
+import java.util.Collections;
+import java.util.LinkedHashMap;
+import java.util.List;
+import java.util.Locale;
+import java.util.Map;
+import java.util.Random;
+import java.util.concurrent.ExecutorService;
+import java.util.concurrent.Executors;
+import java.util.concurrent.Future;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class LocaleDateParserTest {
+	@Test
+	void testParsesSupportedLocales() {
+		LocalDate expected = LocalDate.of(2024,1,12);
+		assertEquals(expected, LocaleDateParser.parse("12 janv. 2024"));
+		assertEquals(expected, LocaleDateParser.parse("12. Januar 2024"));
+		assertEquals(expected, LocaleDateParser.parse("12 de enero de 2024"));
+		assertEquals(expected, LocaleDateParser.parse("12 sty 2024"));
+		assertEquals(expected, LocaleDateParser.parse("12 stycznia 2024"));
+		assertEquals(expected, LocaleDateParser.parse("12 Ocak 2024"));
+		assertEquals(expected, LocaleDateParser.parse("12 января 2024 г."));
+		assertEquals(expected, LocaleDateParser.parse("Jan. 12, 2024"));
+		assertEquals(LocalDate.of(2023,11,3), LocaleDateParser.parse("3 KASIM 2023"));
+		assertEquals(LocalDate.of(2023,8,15), LocaleDateParser.parse("15 août 2023"));
+	}
+
+	@Test
+	void testResultDoesNotDependOnEarlierParses() throws Exception {
+		Map<String, LocalDate> dates = new LinkedHashMap<>();
+		for (Locale locale : LocaleDateParser.supportedLocales()) {
+			DateTimeFormatter f = DateTimeFormatter.ofPattern("d MMMM yyyy", locale);
+			for (Month m : Month.values()) {
+				LocalDate d = LocalDate.of(2024, m, 12);
+				dates.put(f.format(d), d);
+			}
+		}
+		// every thread mixes the locales in its own order, as accounts in different languages would
+		ExecutorService pool = Executors.newFixedThreadPool(4);
+		try {
+			List<Future<?>> futures = new ArrayList<>();
+			for (int t = 0; t < 4; t++) {
+				List<String> texts = new ArrayList<>(dates.keySet());
+				Collections.shuffle(texts, new Random(t));
+				futures.add(pool.submit(() -> {
+					for (int round = 0; round < 20; round++) {
+						for (String text : texts) assertEquals(dates.get(text), LocaleDateParser.parse(text), text);
+					}
+				}));
+			}
+			for (Future<?> f : futures) f.get();
+		} finally {
+			pool.shutdown();
+		}
+	}
+
+	@Test
+	void testRejectsUnknownMonthWord() {
+		assertThrows(IllegalArgumentException.class, () -> LocaleDateParser.parse("12 Foo 2024"));
+	}
+}
@@ -0,0 +1,58 @@
+package com.bookingparser;
+
+import com.bookingparser.model.CurrencyTable;
+import com.bookingparser.model.MinorPrice;
+import com.bookingparser.model.Price;
+import org.junit.jupiter.api.Test;
+
+import java.math.BigDecimal;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class MinorPriceTest {
+	@Test
+	void testToStringMatchesPrice() {
+		String[][] cases = {
+			{"250.00", "EUR"}, {"999", "CHF"}, {"0.05", "USD"}, {"-0.05", "USD"}, {"52800", "JPY"},
+			{"120.125", "KWD"}, {"12.5", "BHD"}, {"99.5", null}, {"1.234", "EUR"}, {"12345678901234567890.12", "GBP"}
+		};
+		for (String[] c : cases) {
+			Price p = new Price(new BigDecimal(c[0]), c[1]);
+			MinorPrice mp = MinorPrice.of(p);
+			assertEquals(p.toString(), mp.toString());
+			assertEquals(p, mp.toPrice());
+		}
+	}
+
+	@Test
+	void testExponents() {
+		assertEquals(0, CurrencyTable.exponent("JPY"));
+		assertEquals(2, CurrencyTable.exponent("EUR"));
+		assertEquals(3, CurrencyTable.exponent("KWD"));
+		assertEquals(3, CurrencyTable.exponent("BHD"));
+		// looking up a code does not register it
+		int next = CurrencyTable.ordinal("ZZA") + 1;
+		assertEquals(2, CurrencyTable.exponent("not a currency"));
+		assertEquals(next, CurrencyTable.ordinal("ZZB"));
+		assertEquals(12050, MinorPrice.of(new BigDecimal("120.5"), "EUR").getMinor());
+		assertEquals(120500, MinorPrice.of(new BigDecimal("120.5"), "KWD").getMinor());
+		assertFalse(MinorPrice.of(new BigDecimal("1.5"), "JPY").fitsMinor());
+	}
+
+	@Test
+	void testExactArithmetic() {
+		MinorPrice a = MinorPrice.of(new BigDecimal("0.10"), "EUR");
+		MinorPrice b = MinorPrice.of(new BigDecimal("0.2"), "EUR");
+		MinorPrice sum = a.add(b);
+		assertEquals("0.30 EUR", sum.toString());
+		assertEquals(0, sum.compareTo(MinorPrice.of(new BigDecimal("0.3"), "EUR")));
+		assertTrue(a.compareTo(b) < 0);
+
+		MinorPrice big = MinorPrice.ofMinor(Long.MAX_VALUE, "EUR", 2);
+		MinorPrice overflowed = big.add(MinorPrice.ofMinor(1, "EUR", 2));
+		assertFalse(overflowed.fitsMinor());
+		assertEquals(new BigDecimal("92233720368547758.08"), overflowed.toBigDecimal());
+
+		assertThrows(IllegalArgumentException.class, () -> a.add(MinorPrice.of(BigDecimal.ONE, "USD")));
+	}
+}
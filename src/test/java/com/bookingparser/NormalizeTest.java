@@ -16,6 +16,16 @@ public class NormalizeTest {
 		assertEquals(LocalDate.of(2024,1,12), NormalizerUtil.parseDate("Jan 12, 2024"));
 	}
 
+	@Test
+	void testParseDateShapes() {
+		assertEquals(LocalDate.of(2022,3,7), NormalizerUtil.parseDate("Mar 7 2022"));
+		assertEquals(LocalDate.of(2023,9,3), NormalizerUtil.parseDate(" 3 September 2023 "));
+		assertEquals(LocalDate.of(2023,2,28), NormalizerUtil.parseDate("31 Feb 2023"));
+		assertEquals(LocalDate.of(2024,5,10), NormalizerUtil.parseDate("Check-in: 2024-05-10"));
+		assertThrows(IllegalArgumentException.class, () -> NormalizerUtil.parseDate("2024-13-01"));
+		assertThrows(IllegalArgumentException.class, () -> NormalizerUtil.parseDate("soon"));
+	}
+
 	@Test
 	void testParsePriceUsAndEu() {
 		var p1 = NormalizerUtil.parsePrice("$1,234.56");
@@ -31,6 +41,36 @@ public class NormalizeTest {
 		assertEquals("CHF", p3.currency);
 	}
 
+	@Test
+	void testParsePriceSeparators() {
+		var p1 = NormalizerUtil.parsePrice("1,234,567.89 USD");
+		assertEquals("1234567.89", p1.value.toPlainString());
+		assertEquals("USD", p1.currency);
+
+		var p2 = NormalizerUtil.parsePrice("12,50 €");
+		assertEquals("12.50", p2.value.toPlainString());
+		assertEquals("EUR", p2.currency);
+
+		assertEquals("52800", NormalizerUtil.parsePrice("¥ 52,800").value.toPlainString());
+		assertEquals("1.234", NormalizerUtil.parsePrice("1.234").value.toPlainString());
+		assertNull(NormalizerUtil.parsePrice("Total 80").currency);
+		assertNull(NormalizerUtil.parsePrice("ABCD 80").currency);
+		assertThrows(IllegalArgumentException.class, () -> NormalizerUtil.parsePrice("free"));
+	}
+
+	@Test
+	void testParsePriceLongestCurrencyMatch() {
+		assertEquals("CAD", NormalizerUtil.parsePrice("C$ 120").currency);
+		assertEquals("BRL", NormalizerUtil.parsePrice("R$ 120").currency);
+		assertEquals("AUD", NormalizerUtil.parsePrice("AU$120").currency);
+		assertEquals("USD", NormalizerUtil.parsePrice("US$ 1,080.00").currency);
+		assertEquals("PLN", NormalizerUtil.parsePrice("120 zł").currency);
+		assertEquals("CZK", NormalizerUtil.parsePrice("1 200 Kč").currency);
+		assertEquals("HUF", NormalizerUtil.parsePrice("HUF 12 000").currency);
+		assertEquals("CAD", NormalizerUtil.parsePrice("$ 120 CAD").currency);
+		assertNull(NormalizerUtil.parsePrice("TAX 20").currency);
+	}
+
 	@Test
 	void testNormalizeBookingBasic() {
 		BookingRaw raw = new BookingRaw(
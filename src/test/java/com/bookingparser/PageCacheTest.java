@@ -0,0 +1,125 @@
+package com.bookingparser;
+
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.scrape.CachedReservationSource;
+import com.bookingparser.scrape.PageCache;
+import com.bookingparser.source.DateRange;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+import java.io.ByteArrayOutputStream;
+import java.nio.ByteBuffer;
+import java.nio.channels.FileChannel;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.nio.file.StandardOpenOption;
+import java.time.Duration;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.Random;
+import java.util.zip.GZIPOutputStream;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class PageCacheTest {
+	private static final Duration TTL = Duration.ofDays(1);
+	private static final String TRIPS = "{\"trips\":[{\"hotelName\":\"Alpha\",\"startDate\":\"2024-05-01\",\"endDate\":\"2024-05-03\"}," +
+		"{\"hotelName\":\"Beta\",\"startDate\":\"2024-06-01\",\"endDate\":\"2024-06-02\"}]}";
+
+	@Test
+	void testStoresAndReopens(@TempDir Path dir) throws Exception {
+		try (PageCache cache = PageCache.open(dir, TTL, 1 << 20)) {
+			cache.put("default", "https://x/graphql", "{\"q\":1}", TRIPS);
+			cache.put("default", "https://x/graphql", "{\"q\":2}", "{}");
+			// same body under another key is stored once
+			cache.put("default", "https://x/mytrips.html", null, TRIPS);
+			assertEquals(3, cache.size());
+			assertEquals("{}", cache.get("default", "https://x/graphql", "{\"q\":2}"));
+			assertNull(cache.get("other", "https://x/mytrips.html", null));
+			assertTrue(cache.toString().contains("2 bodies"), cache.toString());
+		}
+		try (PageCache cache = PageCache.open(dir, TTL, 1 << 20)) {
+			assertEquals(TRIPS, cache.get("default", "https://x/graphql", "{\"q\":1}"));
+			assertEquals(List.of(TRIPS, "{}", TRIPS), cache.bodies("default"));
+		}
+	}
+
+	@Test
+	void testKeepsStoresOfARunThatNeverClosed(@TempDir Path dir) throws Exception {
+		Path crashed = dir.resolve("crashed");
+		try (PageCache cache = PageCache.open(dir.resolve("live"), TTL, 1 << 20)) {
+			cache.put("default", "https://x/graphql", "{\"q\":1}", TRIPS);
+			cache.put("default", "https://x/mytrips.html", null, "{}");
+			// what a killed process leaves behind: the data file and the log, but no index
+			Files.createDirectories(crashed);
+			for (String name : List.of("data-0.bin", "index.log")) Files.copy(dir.resolve("live").resolve(name), crashed.resolve(name));
+		}
+		// a torn record at the end of the log is dropped
+		Files.write(crashed.resolve("index.log"), new byte[] {'E', 0, 9, 'd'}, StandardOpenOption.APPEND);
+		try (PageCache cache = PageCache.open(crashed, TTL, 1 << 20)) {
+			assertEquals(2, cache.size());
+			assertEquals(TRIPS, cache.get("default", "https://x/graphql", "{\"q\":1}"));
+			cache.put("default", "https://x/mytrips.html?page=2", null, "{\"page\":2}");
+		}
+		try (PageCache cache = PageCache.open(crashed, TTL, 1 << 20)) {
+			assertEquals(List.of(TRIPS, "{}", "{\"page\":2}"), cache.bodies("default"));
+		}
+	}
+
+	@Test
+	void testBodyThatNoLongerMatchesItsHashIsAMiss(@TempDir Path dir) throws Exception {
+		try (PageCache cache = PageCache.open(dir, TTL, 1 << 20)) {
+			cache.put("default", "https://x/mytrips.html", null, TRIPS);
+		}
+		// valid gzip of another body where the stored one was
+		ByteArrayOutputStream other = new ByteArrayOutputStream();
+		try (GZIPOutputStream gz = new GZIPOutputStream(other)) {
+			gz.write("{\"trips\":[]}".getBytes(StandardCharsets.UTF_8));
+		}
+		try (FileChannel data = FileChannel.open(dir.resolve("data-0.bin"), StandardOpenOption.WRITE)) {
+			data.write(ByteBuffer.wrap(other.toByteArray()), 0);
+		}
+		try (PageCache cache = PageCache.open(dir, TTL, 1 << 20)) {
+			assertNull(cache.get("default", "https://x/mytrips.html", null));
+			assertEquals(0, cache.size());
+			assertTrue(cache.toString().contains("1 misses"), cache.toString());
+		}
+	}
+
+	@Test
+	void testEvictsOldestPastSizeLimit(@TempDir Path dir) throws Exception {
+		// 300 random hex digits gzip to about 170 bytes, so only one body fits in 250
+		try (PageCache cache = PageCache.open(dir, TTL, 250)) {
+			for (int i = 0; i < 3; i++) cache.put("default", "https://x/" + i, null, noise(i));
+		}
+		try (PageCache cache = PageCache.open(dir, TTL, 250)) {
+			assertEquals(1, cache.size());
+			assertNotNull(cache.get("default", "https://x/2", null));
+			assertNull(cache.get("default", "https://x/0", null));
+		}
+	}
+
+	private static String noise(long seed) {
+		Random random = new Random(seed);
+		StringBuilder sb = new StringBuilder();
+		for (int i = 0; i < 300; i++) sb.append(Character.forDigit(random.nextInt(16), 16));
+		return sb.toString();
+	}
+
+	@Test
+	void testOfflineSourceReplaysCachedResponses(@TempDir Path dir) throws Exception {
+		try (PageCache cache = PageCache.open(dir, TTL, 1 << 20)) {
+			cache.put("default", "https://x/graphql", "{\"q\":\"trips\"}", TRIPS);
+			cache.put("default", "https://x/graphql", "{\"q\":\"user\"}", "{\"user\":{\"name\":\"Ann\"}}");
+			cache.put("default", "https://x/mytrips.html?page=2", null, "<html><script type=\"application/json\">" +
+				"{\"trips\":[{\"hotelName\":\"Beta\",\"startDate\":\"2024-06-01\",\"endDate\":\"2024-06-02\"}," +
+				"{\"hotelName\":\"Gamma\",\"startDate\":\"2023-01-01\",\"endDate\":\"2023-01-05\"}]}</script></html>");
+		}
+		List<BookingRaw> out = new ArrayList<>();
+		try (PageCache cache = PageCache.open(dir, TTL, 1 << 20)) {
+			new CachedReservationSource(cache, "default").fetch(DateRange.ALL, out::add);
+		}
+		assertEquals(List.of("Alpha", "Beta", "Gamma"), out.stream().map(BookingRaw::getHotelName).toList());
+	}
+}
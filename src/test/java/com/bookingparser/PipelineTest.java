@@ -0,0 +1,129 @@
+package com.bookingparser;
+
+import com.bookingparser.export.CsvSink;
+import com.bookingparser.export.Exporter;
+import com.bookingparser.export.FlushPolicy;
+import com.bookingparser.model.BookingNormalized;
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.normalize.NormalizeException;
+import com.bookingparser.normalize.NormalizerUtil;
+import com.bookingparser.pipeline.Pipeline;
+import com.bookingparser.pipeline.PipelineOptions;
+import com.bookingparser.pipeline.PipelineResult;
+import com.bookingparser.pipeline.StageStats;
+import com.bookingparser.source.ReservationSource;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+import java.io.IOException;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.time.Month;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.concurrent.atomic.AtomicInteger;
+import java.util.function.Predicate;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class PipelineTest {
+	private static final Predicate<BookingNormalized> NOT_MAY = b -> b.getStartDate().getMonth() != Month.MAY;
+
+	@Test
+	void testMatchesSequentialRun(@TempDir Path dir) throws Exception {
+		List<BookingRaw> raws = BatchNormalizeTest.corpus(4000);
+		List<BookingNormalized> expected = new ArrayList<>();
+		for (BookingRaw r : raws) {
+			try {
+				BookingNormalized b = NormalizerUtil.normalize(r);
+				if (NOT_MAY.test(b)) expected.add(b);
+			} catch (NormalizeException ignored) {}
+		}
+		Path serial = Exporter.writeCsv(expected, dir.resolve("serial.csv"));
+
+		Path piped = dir.resolve("piped.csv");
+		PipelineResult result;
+		try (CsvSink sink = Exporter.open(piped, FlushPolicy.onClose())) {
+			result = new Pipeline(new PipelineOptions().normalizeThreads(4).filterThreads(2).queueCapacity(16))
+				.run(ReservationSource.of(raws), NOT_MAY, sink);
+			sink.commit();
+		}
+		assertEquals(Files.readString(serial), Files.readString(piped));
+		assertEquals(expected.size(), result.getWritten());
+		assertTrue(result.getRejects().stream().anyMatch(r -> r.getIndex() == 0 && r.getField().equals("startDate")));
+		List<StageStats> stages = result.getStages();
+		assertEquals(List.of("fetch", "normalize", "filter", "write"), stages.stream().map(StageStats::getName).toList());
+		assertEquals(raws.size(), stages.get(0).getOut());
+		assertEquals(raws.size() - result.getRejects().size(), stages.get(1).getOut());
+		assertEquals(expected.size(), stages.get(3).getOut());
+		assertTrue(stages.get(1).getMaxQueueDepth() <= 16);
+	}
+
+	@Test
+	void testSlowWriterHoldsBackSource(@TempDir Path dir) throws Exception {
+		int capacity = 4;
+		AtomicInteger emitted = new AtomicInteger();
+		AtomicInteger filtered = new AtomicInteger();
+		AtomicInteger maxAhead = new AtomicInteger();
+		List<BookingRaw> raws = BatchNormalizeTest.corpus(300);
+		try (CsvSink sink = Exporter.open(dir.resolve("slow.csv"), FlushPolicy.onClose())) {
+			ReservationSource source = (range, out) -> {
+				for (BookingRaw r : raws) {
+					out.emit(r);
+					maxAhead.accumulateAndGet(emitted.incrementAndGet() - filtered.get(), Math::max);
+				}
+			};
+			new Pipeline(new PipelineOptions().normalizeThreads(2).queueCapacity(capacity)).run(source, b -> {
+				try { Thread.sleep(1); } catch (InterruptedException e) { Thread.currentThread().interrupt(); }
+				filtered.incrementAndGet();
+				return true;
+			}, sink);
+		}
+		// two queues plus one record in hand per worker, plus rejects that never reach the filter
+		assertTrue(maxAhead.get() < 2 * capacity + 4 + 10, "source ran ahead by " + maxAhead.get());
+	}
+
+	@Test
+	void testSlowRecordBoundsHeldBackRows(@TempDir Path dir) throws Exception {
+		int capacity = 8;
+		AtomicInteger emitted = new AtomicInteger();
+		AtomicInteger aheadWhileStuck = new AtomicInteger();
+		List<BookingRaw> raws = BatchNormalizeTest.corpus(1000);
+		ReservationSource source = (range, out) -> {
+			for (BookingRaw r : raws) {
+				out.emit(r);
+				emitted.incrementAndGet();
+			}
+		};
+		// the record behind the first row stalls while later ones overtake it and wait for it in the writer
+		Predicate<BookingRaw> stallFirst = r -> {
+			if (r == raws.get(1)) {
+				try { Thread.sleep(300); } catch (InterruptedException e) { Thread.currentThread().interrupt(); }
+				aheadWhileStuck.set(emitted.get());
+			}
+			return true;
+		};
+		Path csv = dir.resolve("stalled.csv");
+		PipelineResult result;
+		try (CsvSink sink = Exporter.open(csv, FlushPolicy.onClose())) {
+			result = new Pipeline(new PipelineOptions().normalizeThreads(4).queueCapacity(capacity).rawFilter(stallFirst))
+				.run(source, b -> true, sink);
+			sink.commit();
+		}
+		assertTrue(aheadWhileStuck.get() <= capacity, "source ran ahead by " + aheadWhileStuck.get());
+		assertEquals(raws.size() - result.getRejects().size(), result.getWritten());
+		assertTrue(Files.readAllLines(csv).get(1).contains("Hotel 1,"));
+	}
+
+	@Test
+	void testSourceFailureIsRethrown(@TempDir Path dir) throws Exception {
+		try (CsvSink sink = Exporter.open(dir.resolve("fail.csv"), FlushPolicy.onClose())) {
+			ReservationSource source = (range, out) -> {
+				for (BookingRaw r : BatchNormalizeTest.corpus(10)) out.emit(r);
+				throw new IOException("page 2 failed");
+			};
+			IOException e = assertThrows(IOException.class, () -> new Pipeline(new PipelineOptions()).run(source, b -> true, sink));
+			assertEquals("page 2 failed", e.getMessage());
+		}
+	}
+}
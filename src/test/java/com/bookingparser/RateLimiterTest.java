@@ -0,0 +1,62 @@
+package com.bookingparser;
+
+import com.bookingparser.scrape.RateLimiter;
+import com.bookingparser.scrape.RateLimiters;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+import java.nio.file.Path;
+import java.util.concurrent.CompletableFuture;
+import java.util.concurrent.TimeUnit;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class RateLimiterTest {
+	@Test
+	void testBurstThenRate() throws Exception {
+		try (RateLimiter limiter = new RateLimiter("test", 10, 2)) {
+			limiter.acquire();
+			limiter.acquire();
+			assertEquals(0, limiter.getDelayed());
+			long t0 = System.nanoTime();
+			limiter.acquire();
+			assertTrue(System.nanoTime() - t0 >= TimeUnit.MILLISECONDS.toNanos(50));
+			assertEquals(3, limiter.getAcquisitions());
+			assertEquals(1, limiter.getDelayed());
+			assertTrue(limiter.getMaxWaitNanos() > 0);
+		}
+	}
+
+	@Test
+	void testAsyncCompletesAfterWait() throws Exception {
+		try (RateLimiter limiter = new RateLimiter("test", 20, 1)) {
+			assertTrue(limiter.acquireAsync().isDone());
+			CompletableFuture<Void> next = limiter.acquireAsync();
+			assertFalse(next.isDone());
+			next.get(1, TimeUnit.SECONDS);
+		}
+	}
+
+	@Test
+	void testStateFileSharesBudget(@TempDir Path dir) throws Exception {
+		Path file = dir.resolve("a.bucket");
+		try (RateLimiter first = new RateLimiter("a", 10, 1, file); RateLimiter second = new RateLimiter("a", 10, 1, file)) {
+			first.acquire();
+			second.acquire();
+			assertEquals(0, first.getDelayed());
+			assertEquals(1, second.getDelayed());
+		}
+	}
+
+	@Test
+	void testKeyedByAccountAndHost() throws Exception {
+		try (RateLimiters limiters = new RateLimiters(10, 1, null)) {
+			limiters.acquire("alice", "https://secure.booking.com/myreservations.html");
+			limiters.acquire("bob", "https://secure.booking.com/myreservations.html");
+			limiters.acquire("alice", "https://www.booking.com/");
+			assertEquals(3, limiters.all().size());
+			for (RateLimiter l : limiters.all()) assertEquals(0, l.getDelayed(), l.toString());
+			assertSame(limiters.get("alice", "SECURE.booking.com"), limiters.get("alice", "secure.booking.com"));
+		}
+	}
+}
@@ -0,0 +1,68 @@
+package com.bookingparser;
+
+import com.bookingparser.export.Exporter;
+import com.bookingparser.model.BookingNormalized;
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.model.Price;
+import com.bookingparser.source.DateRange;
+import com.bookingparser.source.RawFileSource;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+import java.io.OutputStream;
+import java.math.BigDecimal;
+import java.nio.charset.StandardCharsets;
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.time.LocalDate;
+import java.util.ArrayList;
+import java.util.List;
+import java.util.zip.GZIPOutputStream;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class RawFileSourceTest {
+	@Test
+	void testJsonLines(@TempDir Path dir) throws Exception {
+		Path file = dir.resolve("dump.jsonl.gz");
+		String lines = "{\"hotelName\":\"Alpha\",\"city\":\"Lisbon\",\"country\":\"Portugal\",\"checkin\":\"2023-05-01\",\"checkout\":\"2023-05-04\",\"total_price\":\"412.50 EUR\",\"extra\":{\"a\":[1]}}\n" +
+			"\n" +
+			"not json\n" +
+			"{\"hotel_name\":\"Beta\",\"address\":null,\"start_date\":\"12 Jan 2024\",\"end_date\":\"14 Jan 2024\",\"price\":99}\n" +
+			"[1, 2]\n";
+		try (OutputStream out = new GZIPOutputStream(Files.newOutputStream(file))) {
+			out.write(lines.getBytes(StandardCharsets.UTF_8));
+		}
+		RawFileSource source = new RawFileSource(file);
+		List<BookingRaw> raws = new ArrayList<>();
+		source.fetch(DateRange.ALL, raws::add);
+
+		assertEquals(2, raws.size());
+		assertEquals(2, source.malformedLines());
+		assertEquals("Lisbon", raws.get(0).getCityText());
+		assertEquals("412.50 EUR", raws.get(0).getTotalPriceText());
+		assertNull(raws.get(1).getAddressText());
+		assertEquals("99", raws.get(1).getTotalPriceText());
+		assertEquals("12 Jan 2024", raws.get(1).getStartDateText());
+		assertTrue(source.toString().contains("dump.jsonl.gz:3:"), source.toString());
+	}
+
+	@Test
+	void testReadsExportedCsv(@TempDir Path dir) throws Exception {
+		List<BookingNormalized> bookings = List.of(
+			new BookingNormalized("Lisbon", "Portugal", "Hotel \"Alpha\", Centro", LocalDate.of(2023, 5, 1), LocalDate.of(2023, 5, 4),
+				new Price(new BigDecimal("412.50"), "EUR")),
+			new BookingNormalized("", "Japan", "Gamma", LocalDate.of(2024, 3, 2), LocalDate.of(2024, 3, 5), new Price(new BigDecimal("15000"), "JPY")));
+		Path csv = Exporter.writeCsv(bookings, dir.resolve("bookings.csv"));
+
+		List<BookingRaw> raws = new ArrayList<>();
+		new RawFileSource(csv).fetch(DateRange.ALL, raws::add);
+		assertEquals(2, raws.size());
+		assertEquals("Hotel \"Alpha\", Centro", raws.get(0).getHotelName());
+		assertEquals("2023-05-04", raws.get(0).getEndDateText());
+		assertNull(raws.get(1).getCityText());
+		assertEquals(bookings.get(1).getTotalPrice().toString(), raws.get(1).getTotalPriceText());
+
+		assertThrows(IllegalArgumentException.class, () -> new RawFileSource(dir.resolve("dump.txt")));
+	}
+}
@@ -0,0 +1,81 @@
+package com.bookingparser;
+
+import com.bookingparser.model.BookingNormalized;
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.model.Price;
+import com.bookingparser.normalize.NormalizerUtil;
+import com.bookingparser.scrape.ReservationJson;
+import org.junit.jupiter.api.Test;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.util.List;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class ReservationJsonTest {
+	@Test
+	void testFindsReservationsAtAnyDepth() {
+		String json = "{\"data\":{\"trips\":{\"count\":2,\"items\":[" +
+			"{\"id\":\"1\",\"checkin\":\"2023-05-01T15:00:00+02:00\",\"checkout\":\"2023-05-04\"," +
+			"\"hotel\":{\"name\":\"Hotel Alpha\",\"location\":{\"city\":\"Lisbon\",\"country\":\"Portugal\"}}," +
+			"\"totalPrice\":{\"amount\":412.5,\"currency\":\"EUR\"}}," +
+			"{\"id\":\"2\",\"checkIn\":\"12 Jan 2024\",\"checkOut\":\"14 Jan 2024\",\"propertyName\":\"Beta Inn\"," +
+			"\"address\":\"1 Main St, Boston, United States\",\"price\":{\"formatted\":\"US$ 1,080.00\"}}" +
+			"]},\"promo\":{\"name\":\"Summer deals\",\"startDate\":\"2024-06-01\"}}}";
+		List<BookingRaw> raws = ReservationJson.extract(json);
+		assertEquals(2, raws.size());
+
+		BookingRaw a = raws.get(0);
+		assertEquals("Hotel Alpha", a.getHotelName());
+		assertEquals("Lisbon", a.getCityText());
+		assertEquals("2023-05-01", a.getStartDateText());
+		assertEquals("412.50 EUR", a.getTotalPriceText());
+		assertEquals(new Price(new BigDecimal("412.50"), "EUR"), NormalizerUtil.normalize(a).getTotalPrice());
+
+		BookingNormalized b = NormalizerUtil.normalize(raws.get(1));
+		assertEquals("Beta Inn", b.getHotelName());
+		assertEquals(LocalDate.of(2024, 1, 12), b.getStartDate());
+		assertEquals("USD", b.getTotalPrice().getCurrency());
+	}
+
+	@Test
+	void testNumericAmountsKeepTheirDecimals() {
+		String json = "{\"trips\":[" +
+			"{\"hotelName\":\"A\",\"checkin\":\"2024-01-01\",\"checkout\":\"2024-01-02\",\"price\":1.5,\"currency\":\"USD\"}," +
+			"{\"hotelName\":\"B\",\"checkin\":\"2024-01-01\",\"checkout\":\"2024-01-02\",\"totalPrice\":{\"value\":12000,\"currencyCode\":\"JPY\"}}," +
+			"{\"hotelName\":\"C\",\"checkin\":\"2024-01-01\",\"checkout\":\"2024-01-02\",\"totalPrice\":{\"amount\":1.5,\"currency\":\"KWD\"}}]}";
+		List<BookingRaw> raws = ReservationJson.extract(json);
+		assertEquals(List.of("1.50 USD", "12000 JPY", "1.50 KWD"), raws.stream().map(BookingRaw::getTotalPriceText).toList());
+		assertEquals(new BigDecimal("1.50"), NormalizerUtil.normalize(raws.get(0)).getTotalPrice().getValue());
+		assertEquals(new BigDecimal("1.50"), NormalizerUtil.normalize(raws.get(2)).getTotalPrice().getValue());
+	}
+
+	@Test
+	void testKeyTellsApartBookingsOfOneHotelAndDates() {
+		String json = "{\"trips\":[" +
+			"{\"hotelName\":\"A\",\"checkin\":\"2024-01-01\",\"checkout\":\"2024-01-02\",\"price\":80,\"currency\":\"EUR\"}," +
+			"{\"hotelName\":\"A\",\"checkin\":\"2024-01-01\",\"checkout\":\"2024-01-02\",\"price\":95,\"currency\":\"EUR\"}," +
+			"{\"hotelName\":\"A\",\"checkin\":\"2024-01-01\",\"checkout\":\"2024-01-02\",\"price\":{\"formatted\":\"\u20ac 80.00\"}}]}";
+		List<BookingRaw> raws = ReservationJson.extract(json);
+		assertNotEquals(ReservationJson.key(raws.get(0)), ReservationJson.key(raws.get(1)));
+		assertEquals(ReservationJson.key(raws.get(0)), ReservationJson.key(raws.get(2)));
+	}
+
+	@Test
+	void testJsonEmbeddedInHtml() {
+		String html = "<html><head><script type=\"application/json\" data-store=\"trips\">" +
+			"{\"trips\":[{\"hotelName\":\"Gamma\",\"startDate\":\"2022-08-01\",\"endDate\":\"2022-08-03\",\"price\":\"\u20ac 210\"}]}" +
+			"</script><script type=\"application/json\">not json {</script><script>var x = 1;</script></head></html>";
+		List<BookingRaw> raws = ReservationJson.extractFromHtml(html);
+		assertEquals(1, raws.size());
+		assertEquals("Gamma", raws.get(0).getHotelName());
+		assertEquals("\u20ac 210", raws.get(0).getTotalPriceText());
+	}
+
+	@Test
+	void testNotJson() {
+		assertTrue(ReservationJson.extract("[]").isEmpty());
+		assertThrows(IllegalArgumentException.class, () -> ReservationJson.extract("{\"trips\": ["));
+	}
+}
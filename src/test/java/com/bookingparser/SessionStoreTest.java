@@ -0,0 +1,52 @@
+package com.bookingparser;
+
+import com.bookingparser.scrape.SessionStore;
+import org.junit.jupiter.api.Test;
+import org.junit.jupiter.api.io.TempDir;
+
+import java.nio.file.Files;
+import java.nio.file.Path;
+import java.time.Instant;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class SessionStoreTest {
+	private static final Instant NOW = Instant.parse("2025-03-01T12:00:00Z");
+
+	private static String state(String name, long expires) {
+		return "{\"cookies\":[{\"name\":\"bkng_prefs\",\"value\":\"x\",\"domain\":\".booking.com\",\"expires\":-1}," +
+			"{\"name\":\"" + name + "\",\"value\":\"secret\",\"domain\":\".booking.com\",\"path\":\"/\",\"expires\":" + expires + "}]," +
+			"\"origins\":[]}";
+	}
+
+	@Test
+	void testCheckReadsExpiryLocally(@TempDir Path dir) throws Exception {
+		SessionStore store = new SessionStore(dir.resolve("session.json"));
+		assertEquals(SessionStore.Status.MISSING, store.check(NOW));
+
+		Files.writeString(store.getFile(), state("bkng_sso_session", NOW.getEpochSecond() + 86_400));
+		assertEquals(SessionStore.Status.VALID, store.check(NOW));
+		// expiring within the safety margin counts as expired
+		Files.writeString(store.getFile(), state("bkng_sso_session", NOW.getEpochSecond() + 60));
+		assertEquals(SessionStore.Status.EXPIRED, store.check(NOW));
+		Files.writeString(store.getFile(), state("bkng_sso_session", -1));
+		assertEquals(SessionStore.Status.UNKNOWN, store.check(NOW));
+		Files.writeString(store.getFile(), state("unrelated", NOW.getEpochSecond() - 10));
+		assertEquals(SessionStore.Status.UNKNOWN, store.check(NOW));
+
+		// only cookies for the host, unexpired, go into the request
+		Files.writeString(store.getFile(), "{\"cookies\":[" +
+			"{\"name\":\"a\",\"value\":\"1\",\"domain\":\".booking.com\",\"expires\":-1}," +
+			"{\"name\":\"b\",\"value\":\"2\",\"domain\":\"secure.booking.com\",\"expires\":" + (NOW.getEpochSecond() + 60) + "}," +
+			"{\"name\":\"c\",\"value\":\"3\",\"domain\":\".booking.com\",\"expires\":" + (NOW.getEpochSecond() - 60) + "}," +
+			"{\"name\":\"d\",\"value\":\"4\",\"domain\":\"account.booking.com\",\"expires\":-1}]}");
+		assertEquals("a=1; b=2", store.cookieHeader("secure.booking.com", NOW));
+		assertEquals("a=1", store.cookieHeader("booking.com", NOW));
+		assertEquals("", store.cookieHeader("example.com", NOW));
+
+		Files.writeString(store.getFile(), "{\"cookies\":");
+		assertEquals(SessionStore.Status.MISSING, store.check(NOW));
+		store.delete();
+		assertFalse(Files.exists(store.getFile()));
+	}
+}
@@ -0,0 +1,67 @@
+package com.bookingparser;
+
+import com.bookingparser.filter.Where;
+import com.bookingparser.model.BookingNormalized;
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.model.Price;
+import org.junit.jupiter.api.Test;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+
+import static org.junit.jupiter.api.Assertions.*;
+
+public class WhereTest {
+	private static BookingNormalized booking(String city, String country, String hotel, String start, int nights, String price, String currency) {
+		LocalDate s = LocalDate.parse(start);
+		return new BookingNormalized(city, country, hotel, s, s.plusDays(nights), new Price(new BigDecimal(price), currency));
+	}
+
+	@Test
+	void testCombinedExpression() {
+		Where w = Where.compile("country in (France, Spain) and price > 500 EUR and nights >= 3");
+		assertTrue(w.test(booking("Paris", "France", "Lutetia", "2024-05-01", 3, "750.00", "EUR")));
+		assertTrue(w.test(booking("Madrid", "spain", "Ritz", "2024-05-01", 4, "501", "EUR")));
+		assertFalse(w.test(booking("Paris", "France", "Lutetia", "2024-05-01", 2, "750.00", "EUR")));
+		assertFalse(w.test(booking("Paris", "France", "Lutetia", "2024-05-01", 3, "750.00", "USD")));
+		assertFalse(w.test(booking("Rome", "Italy", "Hassler", "2024-05-01", 3, "750.00", "EUR")));
+	}
+
+	@Test
+	void testOperatorsAndGrouping() {
+		BookingNormalized b = booking("New York", "United States", "The \"Plaza\"", "2023-12-30", 5, "1234.50", "USD");
+		assertTrue(Where.compile("city = 'new york' and hotel ~ plaza").test(b));
+		assertTrue(Where.compile("country = United States").test(b));
+		assertTrue(Where.compile("start < 2024-01-01 and end >= 2024-01-04").test(b));
+		assertTrue(Where.compile("not (currency = EUR or nights < 5)").test(b));
+		assertTrue(Where.compile("price >= 1,234.50 and price <= \"$1,300\"").test(b));
+		assertTrue(Where.compile("country not in (France, 'Spain')").test(b));
+		assertFalse(Where.compile("nights in (1, 2, 3) or city != 'New York'").test(b));
+	}
+
+	@Test
+	void testCheapClausesFirst() {
+		assertEquals("(nights >= 3 and country in (France, Spain) and hotel ~ spa)",
+			Where.compile("hotel ~ spa and country in (France, Spain) and nights >= 3").toString());
+	}
+
+	@Test
+	void testRawFilterRunsBeforeParsing() {
+		Where w = Where.compile("country = France and price > 100");
+		BookingRaw paris = new BookingRaw(" Hotel ", null, "Paris", "France", "not a date", "", "free");
+		BookingRaw rome = new BookingRaw(" Hotel ", null, "Rome", "Italy", "not a date", "", "free");
+		assertTrue(w.rawFilter().test(paris));
+		assertFalse(w.rawFilter().test(rome));
+		assertTrue(Where.compile("price > 100 or city = Rome").rawFilter().test(paris));
+	}
+
+	@Test
+	void testErrorsNameTheColumn() {
+		IllegalArgumentException e = assertThrows(IllegalArgumentException.class, () -> Where.compile("citi = Paris"));
+		assertTrue(e.getMessage().contains("column 1"), e.getMessage());
+		e = assertThrows(IllegalArgumentException.class, () -> Where.compile("start > yesterday"));
+		assertTrue(e.getMessage().contains("column 9"), e.getMessage());
+		assertThrows(IllegalArgumentException.class, () -> Where.compile("city < Paris"));
+		assertThrows(IllegalArgumentException.class, () -> Where.compile("(nights > 1"));
+	}
+}
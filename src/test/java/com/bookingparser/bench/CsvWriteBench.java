@@ -0,0 +1,77 @@
+package com.bookingparser.bench;
+
+import com.bookingparser.export.Exporter;
+import com.bookingparser.export.FastCsvWriter;
+import com.bookingparser.model.BookingTable;
+import com.bookingparser.model.Price;
+import org.apache.commons.csv.CSVFormat;
+import org.apache.commons.csv.CSVPrinter;
+
+import java.io.BufferedWriter;
+import java.io.IOException;
+import java.io.OutputStream;
+import java.io.OutputStreamWriter;
+import java.io.Writer;
+import java.math.BigDecimal;
+import java.nio.charset.StandardCharsets;
+import java.time.LocalDate;
+
+/**
+ * Rows/sec and bytes/sec for CSVPrinter against FastCsvWriter, writing a BookingTable to a
+ * UTF-8 stream that only counts bytes.
+ * Run with: java -cp target/classes:target/test-classes:commons-csv.jar com.bookingparser.bench.CsvWriteBench [rows]
+ */
+public class CsvWriteBench {
+	private static final String[] CITIES = {"Paris", "Kraków", "İstanbul", "São Paulo", "New York", "Zürich"};
+	private static final String[] HOTELS = {"Hotel Lutetia", "Grand Hotel, Spa", "The \"Plaza\"", "Pod Różą", "Çırağan Palace"};
+	private static final String[] CURRENCIES = {"EUR", "PLN", "TRY", "BRL", "USD", "JPY"};
+
+	private interface RowWriter {
+		void write(Writer out, BookingTable table) throws IOException;
+	}
+
+	private static final class CountingStream extends OutputStream {
+		long bytes;
+
+		@Override public void write(int b) { bytes++; }
+		@Override public void write(byte[] b, int off, int len) { bytes += len; }
+	}
+
+	public static void main(String[] args) throws IOException {
+		int rows = args.length > 0 ? Integer.parseInt(args[0]) : 1_000_000;
+		BookingTable table = new BookingTable(rows);
+		LocalDate base = LocalDate.of(2020, 1, 1);
+		for (int i = 0; i < rows; i++) {
+			int c = i % CITIES.length;
+			table.add(CITIES[c], "Country " + c, HOTELS[i % HOTELS.length], base.plusDays(i % 1500), base.plusDays(i % 1500 + 3),
+				new Price(BigDecimal.valueOf(i % 100_000, 2), CURRENCIES[i % CURRENCIES.length]));
+		}
+		RowWriter commons = (out, t) -> {
+			CSVPrinter printer = new CSVPrinter(out, CSVFormat.DEFAULT.builder().setHeader(Exporter.HEADER).build());
+			for (int i = 0; i < t.size(); i++) {
+				printer.printRecord(t.city(i), t.country(i), t.hotelName(i), t.startDate(i), t.endDate(i), t.priceText(i));
+			}
+			printer.flush();
+		};
+		RowWriter fast = (out, t) -> {
+			FastCsvWriter writer = new FastCsvWriter(out);
+			writer.writeHeader();
+			for (int i = 0; i < t.size(); i++) writer.writeRow(t, i);
+			writer.flush();
+		};
+		for (int round = 0; round < 3; round++) {
+			run("commons", table, commons);
+			run("fast   ", table, fast);
+		}
+	}
+
+	private static void run(String label, BookingTable table, RowWriter rowWriter) throws IOException {
+		CountingStream counter = new CountingStream();
+		Writer out = new BufferedWriter(new OutputStreamWriter(counter, StandardCharsets.UTF_8), 1 << 16);
+		long t0 = System.nanoTime();
+		rowWriter.write(out, table);
+		double secs = (System.nanoTime() - t0) / 1e9;
+		System.out.printf("%s %,12.0f rows/sec %,8.1f MB/sec (%,d bytes)%n",
+			label, table.size() / secs, counter.bytes / secs / 1e6, counter.bytes);
+	}
+}
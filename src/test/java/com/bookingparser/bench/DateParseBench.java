@@ -0,0 +1,36 @@
+package com.bookingparser.bench;
+
+import com.bookingparser.normalize.NormalizerUtil;
+
+import java.util.function.ToLongFunction;
+
+/**
+ * Parses/sec of the legacy formatter loop against NormalizerUtil.parseDate on a mixed-format corpus.
+ * Run with: java -cp target/classes:target/test-classes com.bookingparser.bench.DateParseBench
+ */
+public class DateParseBench {
+	private static final String[] CORPUS = {
+		"2024-01-12", "12 Jan 2024", "Jan 12, 2024", "3 September 2023", "Mar 7 2022",
+		"2019-11-30", "28 Feb 2021", "Dec 31, 2020", "Check-in: 2024-05-10", "1 July 2018"
+	};
+
+	public static void main(String[] args) {
+		int rounds = args.length > 0 ? Integer.parseInt(args[0]) : 200_000;
+		run("legacy", rounds, s -> LegacyNormalizer.parseDate(s).toEpochDay());
+		run("shape ", rounds, s -> NormalizerUtil.parseDate(s).toEpochDay());
+	}
+
+	private static void run(String label, int rounds, ToLongFunction<String> parser) {
+		long sink = 0;
+		for (int w = 0; w < rounds / 10; w++) {
+			for (String s : CORPUS) sink += parser.applyAsLong(s);
+		}
+		long t0 = System.nanoTime();
+		for (int r = 0; r < rounds; r++) {
+			for (String s : CORPUS) sink += parser.applyAsLong(s);
+		}
+		long elapsed = System.nanoTime() - t0;
+		double perSec = (double) rounds * CORPUS.length / (elapsed / 1e9);
+		System.out.printf("%s %,14.0f parses/sec (checksum %d)%n", label, perSec, sink);
+	}
+}
@@ -0,0 +1,89 @@
+package com.bookingparser.bench;
+
+import java.math.BigDecimal;
+import java.time.LocalDate;
+import java.time.format.DateTimeFormatter;
+import java.time.format.DateTimeParseException;
+import java.util.*;
+import java.util.regex.Matcher;
+import java.util.regex.Pattern;
+
+/** Verbatim copy of the original NormalizerUtil date/price code, kept as the benchmark baseline. */
+final class LegacyNormalizer {
+	private static final Map<String, String> SYMBOL_TO_CODE = new LinkedHashMap<>();
+	static {
+		SYMBOL_TO_CODE.put("$", "USD");
+		SYMBOL_TO_CODE.put("€", "EUR");
+		SYMBOL_TO_CODE.put("£", "GBP");
+		SYMBOL_TO_CODE.put("CHF", "CHF");
+		SYMBOL_TO_CODE.put("C$", "CAD");
+		SYMBOL_TO_CODE.put("CA$", "CAD");
+		SYMBOL_TO_CODE.put("A$", "AUD");
+		SYMBOL_TO_CODE.put("AU$", "AUD");
+		SYMBOL_TO_CODE.put("₺", "TRY");
+		SYMBOL_TO_CODE.put("₽", "RUB");
+		SYMBOL_TO_CODE.put("zł", "PLN");
+		SYMBOL_TO_CODE.put("R$", "BRL");
+		SYMBOL_TO_CODE.put("₹", "INR");
+		SYMBOL_TO_CODE.put("¥", "JPY");
+		SYMBOL_TO_CODE.put("₩", "KRW");
+	}
+
+	private static final Pattern PRICE_NUMERIC = Pattern.compile("(?<!\\d)(?:\\d{1,3}(?:[.,]\\d{3})+|\\d+)(?:[.,]\\d{2})?(?!\\d)");
+
+	private static final List<DateTimeFormatter> DATE_FORMATS = Arrays.asList(
+		DateTimeFormatter.ISO_LOCAL_DATE,
+		DateTimeFormatter.ofPattern("d MMM uuuu"),
+		DateTimeFormatter.ofPattern("MMM d, uuuu"),
+		DateTimeFormatter.ofPattern("d MMMM uuuu"),
+		DateTimeFormatter.ofPattern("MMM d uuuu")
+	);
+
+	private LegacyNormalizer() {}
+
+	static LocalDate parseDate(String text) {
+		String cleaned = text.trim();
+		for (DateTimeFormatter fmt : DATE_FORMATS) {
+			try { return LocalDate.parse(cleaned, fmt); } catch (DateTimeParseException ignored) {}
+		}
+		Matcher m = Pattern.compile("(\\d{4}-\\d{2}-\\d{2})").matcher(cleaned);
+		if (m.find()) {
+			return LocalDate.parse(m.group(1));
+		}
+		throw new IllegalArgumentException("Unable to parse date: " + text);
+	}
+
+	private static String normalizeNumeric(String raw) {
+		if (raw.contains(",") && raw.contains(".")) {
+			int lastComma = raw.lastIndexOf(',');
+			int lastDot = raw.lastIndexOf('.');
+			if (lastComma > lastDot) {
+				return raw.replace(".", "").replace(',', '.');
+			} else {
+				return raw.replace(",", "");
+			}
+		} else if (raw.contains(",")) {
+			String[] parts = raw.split(",");
+			if (parts[parts.length - 1].length() == 3 && Arrays.stream(parts).allMatch(p -> p.chars().allMatch(Character::isDigit))) {
+				return String.join("", parts);
+			} else {
+				return raw.replace(',', '.');
+			}
+		} else {
+			return raw;
+		}
+	}
+
+	static BigDecimal parsePrice(String text) {
+		String cleaned = text == null ? "" : text.trim();
+		String currency = null;
+		Matcher code = Pattern.compile("\\b([A-Z]{3})\\b").matcher(cleaned);
+		if (code.find()) currency = code.group(1);
+		for (Map.Entry<String,String> e : SYMBOL_TO_CODE.entrySet()) {
+			if (cleaned.contains(e.getKey())) { if (currency == null) currency = e.getValue(); break; }
+		}
+		Matcher num = PRICE_NUMERIC.matcher(cleaned);
+		if (!num.find()) throw new IllegalArgumentException("Unable to extract numeric price from: " + text);
+		return new BigDecimal(normalizeNumeric(num.group(0)));
+	}
+}
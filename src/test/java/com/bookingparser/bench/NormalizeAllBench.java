@@ -0,0 +1,38 @@
+package com.bookingparser.bench;
+
+import com.bookingparser.model.BookingRaw;
+import com.bookingparser.normalize.BatchOptions;
+import com.bookingparser.normalize.BatchResult;
+import com.bookingparser.normalize.NormalizerUtil;
+
+import java.util.ArrayList;
+import java.util.List;
+
+/**
+ * Scaling of NormalizerUtil.normalizeAll over a synthetic corpus (default one million records) from 1 to 16 threads.
+ * Run with: java -cp target/classes:target/test-classes com.bookingparser.bench.NormalizeAllBench [records]
+ */
+public class NormalizeAllBench {
+	private static final String[] DATES = {"2024-01-12", "12 Jan 2024", "Jan 12, 2024", "3 septembre 2023", "12. Januar 2024"};
+	private static final String[] PRICES = {"$1,234.56", "€ 1.234,56", "Total: 999 CHF", "R$ 1.099,90", "12 345 zł"};
+
+	public static void main(String[] args) {
+		int n = args.length > 0 ? Integer.parseInt(args[0]) : 1_000_000;
+		List<BookingRaw> raws = new ArrayList<>(n);
+		for (int i = 0; i < n; i++) {
+			raws.add(new BookingRaw("Hotel " + (i % 5000), (i % 997) + " Main St, City" + (i % 300) + ", Country" + (i % 40),
+				null, null, DATES[i % DATES.length], DATES[(i + 1) % DATES.length], PRICES[i % PRICES.length]));
+		}
+		NormalizerUtil.normalizeAll(raws, new BatchOptions().parallelism(1));
+		double base = 0;
+		for (int threads = 1; threads <= 16; threads *= 2) {
+			long t0 = System.nanoTime();
+			BatchResult r = NormalizerUtil.normalizeAll(raws, new BatchOptions().parallelism(threads));
+			double secs = (System.nanoTime() - t0) / 1e9;
+			double perSec = n / secs;
+			if (threads == 1) base = perSec;
+			System.out.printf("%2d threads %,12.0f records/sec speedup %.2fx (accepted %d)%n",
+				threads, perSec, perSec / base, r.getAccepted().size());
+		}
+	}
+}
@@ -0,0 +1,42 @@
+package com.bookingparser.bench;
+
+import com.bookingparser.normalize.NormalizerUtil;
+
+import java.lang.management.ManagementFactory;
+import java.util.function.ToIntFunction;
+
+/**
+ * Calls/sec and bytes allocated per call for the legacy regex price parser against NormalizerUtil.parsePrice.
+ * Run with: java -cp target/classes:target/test-classes com.bookingparser.bench.PriceParseBench
+ */
+public class PriceParseBench {
+	private static final String[] CORPUS = {
+		"$1,234.56", "€ 1.234,56", "Total: 999 CHF", "Total EUR 250.00", "£89", "12 345 zł",
+		"R$ 1.099,90", "¥ 52,800", "US$ 1,080.00", "Price for 3 nights: 1,045.20 GBP"
+	};
+
+	public static void main(String[] args) {
+		int rounds = args.length > 0 ? Integer.parseInt(args[0]) : 200_000;
+		run("legacy ", rounds, s -> LegacyNormalizer.parsePrice(s).scale());
+		run("scanner", rounds, s -> NormalizerUtil.parsePrice(s).value.scale());
+	}
+
+	private static void run(String label, int rounds, ToIntFunction<String> parser) {
+		com.sun.management.ThreadMXBean threads = (com.sun.management.ThreadMXBean) ManagementFactory.getThreadMXBean();
+		long tid = Thread.currentThread().getId();
+		long sink = 0;
+		for (int w = 0; w < rounds / 10; w++) {
+			for (String s : CORPUS) sink += parser.applyAsInt(s);
+		}
+		long bytes0 = threads.getThreadAllocatedBytes(tid);
+		long t0 = System.nanoTime();
+		for (int r = 0; r < rounds; r++) {
+			for (String s : CORPUS) sink += parser.applyAsInt(s);
+		}
+		long elapsed = System.nanoTime() - t0;
+		long bytes = threads.getThreadAllocatedBytes(tid) - bytes0;
+		long calls = (long) rounds * CORPUS.length;
+		System.out.printf("%s %,14.0f calls/sec %8.1f bytes/call (checksum %d)%n",
+			label, calls / (elapsed / 1e9), (double) bytes / calls, sink);
+	}
+}